@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+
+"""
+Helpers shared by the *_bench.py scripts
+
+The scripts that import sonic_platform need what sonic_platform needs at
+run time:
+    - sonic_platform_base and sonic_py_common (sonic-platform-common)
+    - vendor_sonic_platform of the platform
+    - for the ones that build device objects, the S3IP sysfs tree at
+      CommonCfg.S3IP_PATH (/sys_switch)
+Run them in the pmon container of the switch, or on a host that has those
+packages on PYTHONPATH and the S3IP tree in place (eg. a tmpfs /sys_switch
+filled with the attributes of the platform). PYTHONPATH is passed on to the
+measured interpreters after the tree under test.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import subprocess
+import contextlib
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def usage(doc):
+    print(doc % {'scriptName': os.path.basename(sys.argv[0])})
+    sys.exit(1)
+
+
+def run_python(tree_dir, args):
+    """
+    Run a fresh interpreter with sonic_platform of tree_dir first on the path,
+    exit with its last error line if it fails
+
+    Args:
+        tree_dir: str, directory holding sonic_platform
+        args: list, interpreter arguments, eg. ["-c", code]
+
+    Returns:
+        tuple(stdout, stderr)
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([tree_dir] + [p for p in [env.get("PYTHONPATH")] if p])
+    proc = subprocess.run([sys.executable] + args, cwd=tree_dir, env=env,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, check=False)
+    if proc.returncode != 0:
+        print(proc.stderr.splitlines()[-1] if proc.stderr else "run in {} failed".format(tree_dir))
+        sys.exit(1)
+    return proc.stdout, proc.stderr
+
+
+@contextlib.contextmanager
+def exported_tree(ref):
+    """
+    sonic_platform of git <ref> in a temporary directory, removed on exit
+
+    Args:
+        ref: str, eg. HEAD~1
+
+    Yields:
+        str: the directory holding sonic_platform
+    """
+    tmp_dir = tempfile.mkdtemp(prefix="bench.")
+    try:
+        archive = subprocess.run(["git", "-C", REPO_DIR, "archive", ref, "sonic_platform"],
+                                 stdout=subprocess.PIPE, check=True)
+        subprocess.run(["tar", "-x", "-C", tmp_dir], input=archive.stdout, check=True)
+        yield tmp_dir
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
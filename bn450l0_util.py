@@ -49,6 +49,10 @@ FORCE = 0
 
 
 PORT_NUM = 128
+TRANSCEIVER_PATH = "/sys_switch/transceiver"
+ALL_PORT_POWER_ON_PATH = "/sys/bus/i2c/devices/17-000e/all_port_power_on"
+# one port of every port cpld, write_enable is a global control in the cpld
+WRITE_ENABLE_PORTS = (1, 5, 67)
 # TODO Add service list
 SERVICE_LIST = ['ieit-driver-init.service', 's3ip-sysfs.service', 's3ip-sysfs-monitor.service',
                 'fan-monitor.service', 'led-monitor.service']
@@ -196,54 +200,59 @@ def log_os_system(cmd):
         log_error('Failed :'+cmd)
     return  status
 
+def write_sysfs(path, value):
+    if DEBUG:
+        log_dbg("WRITE SYSFS: {} > {}".format(value, path))
+    try:
+        fd = os.open(path, os.O_WRONLY)
+        try:
+            os.write(fd, str(value).encode())
+        finally:
+            os.close(fd)
+    except OSError as err:
+        log_error('Failed :write {} > {}: {}'.format(value, path, err))
+        return 1
+    return 0
+
+def set_transceiver_control(attr, value):
+    # ports sharing a cpld register link to the same attribute, write it once
+    status = 0
+    written = set()
+    for i in range(0, PORT_NUM):
+        path = os.path.join(TRANSCEIVER_PATH, "eth{}".format(i+1), attr)
+        real_path = os.path.realpath(path)
+        if real_path in written:
+            continue
+        written.add(real_path)
+        status += write_sysfs(path, value)
+    return status
+
 def handle_transceiver_init():
     if not os.path.isfile(INSTALLED_FILE):
         ## enable port power
-        cmd = 'echo 1 > /sys/bus/i2c/devices/17-000e/all_port_power_on'
-        log_os_system(cmd)
+        write_sysfs(ALL_PORT_POWER_ON_PATH, 1)
 
         # Set all cpld write_enable enable, one global control in every cpld
-        cmd = "echo 89 > /sys_switch/transceiver/eth1/write_enable"
-        log_os_system(cmd)
-
-        cmd = "echo 89 > /sys_switch/transceiver/eth5/write_enable"
-        log_os_system(cmd)
-
-        cmd = "echo 89 > /sys_switch/transceiver/eth67/write_enable"
-        log_os_system(cmd)
+        for port in WRITE_ENABLE_PORTS:
+            write_sysfs(os.path.join(TRANSCEIVER_PATH, "eth{}".format(port), "write_enable"), 89)
 
         # set lpmode and reset
-        for i in range(0, PORT_NUM):
-            cmd = "echo 1 > /sys_switch/transceiver/eth{}/low_power_mode".format(i+1)
-            log_os_system(cmd)
-
-            cmd = "echo 0 > /sys_switch/transceiver/eth{}/reset".format(i+1)
-            log_os_system(cmd)
+        set_transceiver_control("low_power_mode", 1)
+        set_transceiver_control("reset", 0)
 
 
 def handle_transceiver_deinit():
     if not os.path.isfile(INSTALLED_FILE):
         ## disable port power
-        cmd = 'echo 0 > /sys/bus/i2c/devices/17-000e/all_port_power_on'
-        log_os_system(cmd)
+        write_sysfs(ALL_PORT_POWER_ON_PATH, 0)
 
         # Set all cpld write_enable enable
-        cmd = "echo 89 > /sys_switch/transceiver/eth1/write_enable"
-        log_os_system(cmd)
-
-        cmd = "echo 89 > /sys_switch/transceiver/eth5/write_enable"
-        log_os_system(cmd)
-
-        cmd = "echo 89 > /sys_switch/transceiver/eth67/write_enable"
-        log_os_system(cmd)
+        for port in WRITE_ENABLE_PORTS:
+            write_sysfs(os.path.join(TRANSCEIVER_PATH, "eth{}".format(port), "write_enable"), 89)
 
         # set lpmode and reset
-        for i in range(0, PORT_NUM):
-            cmd = "echo 0 > /sys_switch/transceiver/eth{}/low_power_mode".format(i+1)
-            log_os_system(cmd)
-
-            cmd = "echo 1 > /sys_switch/transceiver/eth{}/reset".format(i+1)
-            log_os_system(cmd)
+        set_transceiver_control("low_power_mode", 0)
+        set_transceiver_control("reset", 1)
 
 def exec_syscmd(cmd):
     try:
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+
+"""
+Usage: %(scriptName)s [options]
+
+Measure the cost of Chassis() and of the first access of its device lists,
+each run in a fresh interpreter. It needs the platform packages and the
+S3IP sysfs tree, see bench_common.py
+
+options:
+    -h | --help             : this help message
+    -n | --runs <num>       : number of runs, the median is reported, default 5
+    -b | --baseline <ref>   : also measure sonic_platform of git <ref>, eg. HEAD~1
+"""
+
+import sys
+import json
+import getopt
+import statistics
+
+from bench_common import REPO_DIR, usage, run_python, exported_tree
+
+MEASURE_CODE = """
+import json, time
+from sonic_platform.chassis import Chassis
+start = time.perf_counter()
+chassis = Chassis()
+built = time.perf_counter()
+chassis.get_all_sfps()
+chassis.get_sfp(1).get_cage_type()
+sfps = time.perf_counter()
+chassis.get_all_thermals()
+chassis.get_all_psus()
+chassis.get_all_fans()
+chassis.get_all_components()
+rest = time.perf_counter()
+print(json.dumps({"init": built - start, "sfps": sfps - built, "rest": rest - sfps}))
+"""
+
+STEPS = (("init", "Chassis()"), ("sfps", "first get_all_sfps + cage type"),
+         ("rest", "first thermals/psus/fans/components"))
+
+
+def measure(tree_dir, runs):
+    """
+    Returns:
+        dict: step -> median milliseconds
+    """
+    samples = {step: [] for step, _ in STEPS}
+    for _ in range(runs):
+        stdout, _ = run_python(tree_dir, ["-c", MEASURE_CODE])
+        result = json.loads(stdout.splitlines()[-1])
+        for step, _ in STEPS:
+            samples[step].append(result[step] * 1000.0)
+    return {step: statistics.median(values) for step, values in samples.items()}
+
+
+def report(title, medians):
+    print("{}: {:.1f} ms in total".format(title, sum(medians.values())))
+    for step, desc in STEPS:
+        print("    {:>9.1f} ms  {}".format(medians[step], desc))
+
+
+def main():
+    runs = 5
+    baseline = None
+    try:
+        opts, _ = getopt.getopt(sys.argv[1:], "hn:b:", ["help", "runs=", "baseline="])
+    except getopt.GetoptError:
+        usage(__doc__)
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            usage(__doc__)
+        elif opt in ("-n", "--runs"):
+            runs = int(arg)
+        elif opt in ("-b", "--baseline"):
+            baseline = arg
+
+    if baseline is not None:
+        with exported_tree(baseline) as tree_dir:
+            report("before ({})".format(baseline), measure(tree_dir, runs))
+    report("after (working tree)", measure(REPO_DIR, runs))
+
+
+if __name__ == "__main__":
+    main()
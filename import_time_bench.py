@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+
+"""
+Usage: %(scriptName)s [options]
+
+Measure the 'python -X importtime' cost of a sonic_platform module,
+see bench_common.py for what it needs to run
+
+options:
+    -h | --help             : this help message
+    -m | --module <name>    : module to import, default sonic_platform.platform
+    -n | --runs <num>       : number of runs, the median is reported, default 5
+    -b | --baseline <ref>   : also measure sonic_platform of git <ref>, eg. HEAD~1
+    -t | --top <num>        : show the <num> most expensive imports, default 10
+"""
+
+import sys
+import getopt
+import statistics
+
+from bench_common import REPO_DIR, usage, run_python, exported_tree
+
+
+def parse_importtime(output):
+    """
+    Parse stderr of 'python -X importtime'
+
+    Returns:
+        dict: module name -> (self us, cumulative us)
+    """
+    result = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3:
+            continue
+        try:
+            result[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+        except ValueError:
+            continue
+    return result
+
+
+def measure(tree_dir, module, runs):
+    """
+    Import <module> from <tree_dir> in fresh interpreters
+
+    Returns:
+        tuple(median cumulative us, parsed result of the median run)
+    """
+    samples = []
+    for _ in range(runs):
+        _, stderr = run_python(tree_dir, ["-X", "importtime", "-c", "import " + module])
+        parsed = parse_importtime(stderr)
+        total = parsed.get(module, (0, 0))[1]
+        samples.append((total, parsed))
+    samples.sort(key=lambda sample: sample[0])
+    median = statistics.median_low([sample[0] for sample in samples])
+    for total, parsed in samples:
+        if total == median:
+            return total, parsed
+    return samples[0]
+
+
+def report(title, total, parsed, top):
+    print("{}: {:.1f} ms cumulative, {} modules".format(title, total / 1000.0, len(parsed)))
+    heaviest = sorted(parsed.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    for name, (self_us, cumulative_us) in heaviest:
+        print("    {:>9.1f} ms self {:>9.1f} ms cumulative  {}".format(self_us / 1000.0,
+                                                                     cumulative_us / 1000.0,
+                                                                     name))
+
+
+def main():
+    module = "sonic_platform.platform"
+    runs = 5
+    baseline = None
+    top = 10
+    try:
+        opts, _ = getopt.getopt(sys.argv[1:], "hm:n:b:t:",
+                                ["help", "module=", "runs=", "baseline=", "top="])
+    except getopt.GetoptError:
+        usage(__doc__)
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            usage(__doc__)
+        elif opt in ("-m", "--module"):
+            module = arg
+        elif opt in ("-n", "--runs"):
+            runs = int(arg)
+        elif opt in ("-b", "--baseline"):
+            baseline = arg
+        elif opt in ("-t", "--top"):
+            top = int(arg)
+
+    current, current_parsed = measure(REPO_DIR, module, runs)
+    if baseline is not None:
+        with exported_tree(baseline) as tree_dir:
+            before, before_parsed = measure(tree_dir, module, runs)
+        report("before ({})".format(baseline), before, before_parsed, top)
+    report("after (working tree)", current, current_parsed, top)
+    if baseline is not None and before:
+        print("import {}: {:.1f} ms -> {:.1f} ms ({:+.1f}%)".format(module, before / 1000.0,
+                                                                   current / 1000.0,
+                                                                   (current - before) * 100.0 / before))
+
+
+if __name__ == "__main__":
+    main()
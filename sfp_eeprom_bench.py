@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+"""
+Usage: %(scriptName)s [options]
+
+Compare the per-read cost of open/seek/read/close against pread on a kept
+open descriptor, the way Sfp reads the transceiver eeprom
+
+options:
+    -h | --help             : this help message
+    -p | --path <file>      : eeprom attribute to read, eg. /sys_switch/transceiver/eth1/eeprom,
+                              default a fake sysfs tree in a temporary directory
+    -n | --reads <num>      : number of reads per method, default 20000
+    -o | --offset <num>     : eeprom offset, default 0
+    -l | --length <num>     : bytes per read, default 1
+"""
+
+import os
+import sys
+import time
+import getopt
+import shutil
+import tempfile
+
+from bench_common import usage
+
+FAKE_EEPROM_SIZE = 2048
+
+
+def make_fake_tree():
+    """
+    Build transceiver/eth1/eeprom behind a symlink like the s3ip sysfs
+
+    Returns:
+        tuple(tree dir, eeprom path)
+    """
+    tree_dir = tempfile.mkdtemp(prefix="sfp_eeprom_bench.")
+    device_dir = os.path.join(tree_dir, "devices", "i2c-23", "23-0050")
+    port_dir = os.path.join(tree_dir, "transceiver", "eth1")
+    os.makedirs(device_dir)
+    os.makedirs(port_dir)
+    with open(os.path.join(device_dir, "eeprom"), "wb") as f:
+        f.write(os.urandom(FAKE_EEPROM_SIZE))
+    eeprom_path = os.path.join(port_dir, "eeprom")
+    os.symlink(os.path.join(device_dir, "eeprom"), eeprom_path)
+    return tree_dir, eeprom_path
+
+
+def read_by_open(path, offset, length, reads):
+    for _ in range(reads):
+        with open(path, mode='rb', buffering=0) as f:
+            f.seek(offset)
+            f.read(length)
+
+
+def read_by_pread(path, offset, length, reads):
+    fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+    try:
+        for _ in range(reads):
+            os.pread(fd, length, offset)
+    finally:
+        os.close(fd)
+
+
+def measure(func, path, offset, length, reads):
+    """
+    Returns:
+        float: microseconds per read
+    """
+    start = time.perf_counter()
+    func(path, offset, length, reads)
+    return (time.perf_counter() - start) * 1000000.0 / reads
+
+
+def main():
+    path = None
+    reads = 20000
+    offset = 0
+    length = 1
+    try:
+        opts, _ = getopt.getopt(sys.argv[1:], "hp:n:o:l:",
+                                ["help", "path=", "reads=", "offset=", "length="])
+    except getopt.GetoptError:
+        usage(__doc__)
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            usage(__doc__)
+        elif opt in ("-p", "--path"):
+            path = arg
+        elif opt in ("-n", "--reads"):
+            reads = int(arg)
+        elif opt in ("-o", "--offset"):
+            offset = int(arg, 0)
+        elif opt in ("-l", "--length"):
+            length = int(arg, 0)
+
+    tree_dir = None
+    if path is None:
+        tree_dir, path = make_fake_tree()
+    try:
+        # warm up the dentry cache so both methods see the same state
+        read_by_open(path, offset, length, min(reads, 100))
+        before = measure(read_by_open, path, offset, length, reads)
+        after = measure(read_by_pread, path, offset, length, reads)
+    finally:
+        if tree_dir is not None:
+            shutil.rmtree(tree_dir, ignore_errors=True)
+
+    print("{}: {} reads of {} bytes at offset {}".format(path, reads, length, offset))
+    print("    open/seek/read/close : {:>8.2f} us per read".format(before))
+    print("    pread on kept fd     : {:>8.2f} us per read".format(after))
+    print("    saved                : {:>8.2f} us per read ({:.1f}x)".format(before - after,
+                                                                          before / after if after else 0))
+
+
+if __name__ == "__main__":
+    main()
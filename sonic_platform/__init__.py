@@ -1,4 +1,12 @@
 __all__ = ["platform", "chassis", "pcie", "extend"]
-from . import platform
-from . import pcie
-from . import extend
+
+import importlib
+
+
+def __getattr__(name):
+    # submodules are imported on first use, 'import sonic_platform' stays cheap
+    if name in __all__:
+        module = importlib.import_module("." + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
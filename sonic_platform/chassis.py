@@ -8,19 +8,31 @@ provides the Chassis information which are available in the platform
 try:
     import time
     import os.path
+    import threading
+    import collections
+    import math
     from sonic_platform_base.chassis_base import ChassisBase
-    from sonic_platform.fan_drawer import FanDrawer
-    from sonic_platform.psu import Psu
-    from sonic_platform.component import Component
-    from sonic_platform.sfp import Sfp
-    from sonic_platform.eeprom import Eeprom
-    from sonic_platform.watchdog import Watchdog
-    from sonic_platform.voltage import Voltage
-    from sonic_platform.current import Current
-    from sonic_platform.thermal import Thermal
-    from sonic_platform.extend import VoltageRegulator
-    from sonic_platform.extend import Led
-    from sonic_platform.extend import Fru
+    from sonic_platform.plat_common import LazyImport
+    from sonic_platform.plat_common import ReadMemo
+    futures = LazyImport("concurrent.futures")
+    # device modules are imported when the first device of the type is created
+    FanDrawer = LazyImport("sonic_platform.fan_drawer", "FanDrawer")
+    Psu = LazyImport("sonic_platform.psu", "Psu")
+    Component = LazyImport("sonic_platform.component", "Component")
+    Sfp = LazyImport("sonic_platform.sfp", "Sfp")
+    SfpPresenceMonitor = LazyImport("sonic_platform.sfp", "SfpPresenceMonitor")
+    SfpPresenceBitmap = LazyImport("sonic_platform.sfp", "SfpPresenceBitmap")
+    SfpIoScheduler = LazyImport("sonic_platform.sfp", "SfpIoScheduler")
+    SfpPortControl = LazyImport("sonic_platform.sfp", "SfpPortControl")
+    SfpBringUpScheduler = LazyImport("sonic_platform.sfp", "SfpBringUpScheduler")
+    Eeprom = LazyImport("sonic_platform.eeprom", "Eeprom")
+    Watchdog = LazyImport("sonic_platform.watchdog", "Watchdog")
+    Voltage = LazyImport("sonic_platform.voltage", "Voltage")
+    Current = LazyImport("sonic_platform.current", "Current")
+    Thermal = LazyImport("sonic_platform.thermal", "Thermal")
+    VoltageRegulator = LazyImport("sonic_platform.extend", "VoltageRegulator")
+    Led = LazyImport("sonic_platform.extend", "Led")
+    Fru = LazyImport("sonic_platform.extend", "Fru")
     from sonic_platform.plat_common import PlatCommon
     from sonic_platform.plat_common import CommonCfg
     from vendor_sonic_platform.device import DeviceCfg
@@ -30,6 +42,578 @@ except ImportError as e:
 
 
 
+class LazyDevice(object):
+    """
+    Chassis attribute whose device objects are built by <builders> on first
+    access, so tools touching one subsystem don't construct all of them.
+    The value is a plain list (or object), ChassisBase getters work unchanged
+    """
+
+    def __init__(self, *builders):
+        self.builders = builders
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, chassis, owner=None):
+        if chassis is None:
+            return self
+        built = chassis.__dict__.get("_built_devices")
+        if built is not None and not all(builder in built for builder in self.builders):
+            with chassis._device_lock:
+                building = chassis._building_devices
+                for builder in self.builders:
+                    if builder in built:
+                        continue
+                    # reached from inside a running builder, which may read
+                    # the list it is filling, keep the build order
+                    if builder in building:
+                        break
+                    building.add(builder)
+                    builder(chassis)
+                    built.add(builder)
+        return chassis.__dict__.get(self.name)
+
+    def __set__(self, chassis, value):
+        chassis.__dict__[self.name] = value
+
+
+class ChassisEventEngine(object):
+    """
+    Event multiplexer of Chassis.get_change_event. Every device type has
+    its own worker and scan interval (CommonCfg.EVENT_SCAN_SECS, the
+    caller's scantime for the others), so a slow thermal or voltage sweep
+    doesn't delay transceiver events. Workers put their events into one
+    pending table that get_change_event drains, later events of the same
+    device replace earlier ones not yet drained.
+    """
+
+    def __init__(self, plat_common, resolve_source=None):
+        """
+        Args:
+            plat_common: PlatCommon object
+            resolve_source: callable(dev), returns the poll callable of a device
+                            type not added by add_source, None if unsupported
+        """
+        self.plat_common = plat_common
+        self.resolve_source = resolve_source
+        self.cond = threading.Condition()
+        self.pending = {}
+        self.sources = {}
+        self.workers = {}
+        self.failed = set()
+        self.owner_pid = os.getpid()
+
+    def add_source(self, dev, poll, blocking=False):
+        """
+        Register the event source of a device type
+
+        Args:
+            dev: str, device type, eg. 'sfp'
+            poll: callable(interval), returns dict {device_id: device_event}
+            blocking: bool, poll waits up to interval by itself
+        """
+        self.sources[dev] = (poll, blocking)
+
+    def __get_interval(self, dev, scantime):
+        intervals = dict(CommonCfg.EVENT_SCAN_SECS)
+        intervals.update(getattr(DeviceCfg, "EVENT_SCAN_SECS", {}))
+        return intervals.get(dev, scantime)
+
+    def __push(self, dev, events):
+        with self.cond:
+            self.pending.setdefault(dev, {}).update(events)
+            self.cond.notify_all()
+
+    def __run(self, dev, interval):
+        poll, blocking = self.sources[dev]
+        while True:
+            start = time.monotonic()
+            failed = False
+            try:
+                events = poll(interval)
+                if events:
+                    self.__push(dev, events)
+            except Exception as err:
+                self.plat_common.log_error("get {} event error:{}", dev, err)
+                failed = True
+            if failed or not blocking:
+                time.sleep(max(0, start + interval - time.monotonic()))
+
+    def __start(self, dev_list, scantime):
+        with self.cond:
+            if self.owner_pid != os.getpid():
+                # worker threads don't survive fork
+                self.workers = {}
+                self.pending = {}
+                self.failed = set()
+                self.owner_pid = os.getpid()
+            for dev in dev_list:
+                if dev in self.workers or dev in self.failed:
+                    continue
+                if dev not in self.sources and self.resolve_source is not None:
+                    poll = self.resolve_source(dev)
+                    if poll is not None:
+                        self.sources[dev] = (poll, False)
+                if dev not in self.sources:
+                    self.plat_common.log_error("unsupported change event device {}", dev)
+                    self.failed.add(dev)
+                    continue
+                worker = threading.Thread(target=self.__run, args=(dev, self.__get_interval(dev, scantime)),
+                                          name="event-{}".format(dev), daemon=True)
+                worker.start()
+                self.workers[dev] = worker
+
+    def wait(self, dev_list, timeout, scantime):
+        """
+        Wait for events of the device types in dev_list
+
+        Args:
+            dev_list: list of str, device types
+            timeout: int, milliseconds, 0 to block until an event
+            scantime: float, scan interval of device types without their own
+
+        Returns:
+            (bool, dict): True and {dev: {device_id: device_event}}, the dicts
+                          are empty on timeout, False if no device type is supported
+        """
+        self.__start(dev_list, scantime)
+        deadline = None
+        if timeout:
+            deadline = time.monotonic() + timeout / 1000.0
+        with self.cond:
+            while True:
+                result = {dev: self.pending.pop(dev, {}) for dev in dev_list}
+                if any(result.values()):
+                    return True, result
+                if all(dev in self.failed for dev in dev_list):
+                    return False, {}
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return True, result
+                self.cond.wait(remaining)
+
+
+class PollingIntervalEngine(object):
+    """
+    Adaptive source of Chassis.get_polling_interval_factor. For the device
+    classes a daemon polls (CommonCfg.POLLING_DAEMON_KINDS) it tracks the
+    temperature slope and margin to the high threshold, fan rpm variation,
+    psu power delta and transceiver plug churn. The factor grows by
+    POLLING_BACKOFF_STEP per POLLING_ADAPT_SECS while everything is stable,
+    goes back to the static DeviceCfg factor when values move, and drops
+    to POLLING_FACTOR_MIN at once when a device is abnormal or close to
+    its threshold.
+    """
+    SFP_CHURN_WINDOW_SECS = 300
+
+    def __init__(self, plat_common, get_snapshot, get_sfp_bitmap):
+        """
+        Args:
+            plat_common: PlatCommon object
+            get_snapshot: callable(kinds, max_age), eg. Chassis.get_platform_snapshot
+            get_sfp_bitmap: callable(), eg. Chassis.get_sfp_presence_bitmap
+        """
+        self.plat_common = plat_common
+        self.get_snapshot = get_snapshot
+        self.get_sfp_bitmap = get_sfp_bitmap
+        self.lock = threading.Lock()
+        # kind -> {"time", "data", "score", "urgent", "reason"}
+        self.assessments = {}
+        self.fan_history = {}
+        self.sfp_bitmap = None
+        self.sfp_changes = collections.deque()
+        # daemon -> decision dict
+        self.decisions = {}
+
+    @staticmethod
+    def __get_base_factor(daemon):
+        try:
+            return DeviceCfg.POLLING_INTERVAL_FACTOR[daemon]
+        except (AttributeError, KeyError, TypeError):
+            return 1
+
+    @staticmethod
+    def __get_daemon_kinds(daemon):
+        kinds = dict(CommonCfg.POLLING_DAEMON_KINDS)
+        kinds.update(getattr(DeviceCfg, "POLLING_DAEMON_KINDS", {}))
+        return kinds.get(daemon, ())
+
+    @staticmethod
+    def __number(value):
+        return value if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+
+    def __assess_thermal(self, devices, prev, elapsed):
+        score, urgent, reason = 0, False, "stable"
+        for name, values in devices.items():
+            temperature = self.__number(values.get("temperature"))
+            if temperature is None:
+                continue
+            if values.get("presence") and values.get("status") is False:
+                return 1, True, "{} abnormal".format(name)
+            high = self.__number(values.get("high_threshold"))
+            if high is not None and high - temperature < CommonCfg.POLLING_THERMAL_MARGIN_NEAR:
+                return 1, True, "{} {:.1f}C below high threshold".format(name, high - temperature)
+            last = self.__number(prev.get(name, {}).get("temperature"))
+            if last is not None and elapsed > 0:
+                slope = abs(temperature - last) * 60 / elapsed
+                if slope / CommonCfg.POLLING_THERMAL_SLOPE_FAST > score:
+                    score = slope / CommonCfg.POLLING_THERMAL_SLOPE_FAST
+                    reason = "{} slope {:.2f}C/min".format(name, slope)
+        return score, urgent, reason
+
+    def __assess_fan(self, devices, prev, elapsed):
+        score, urgent, reason = 0, False, "stable"
+        for name, values in devices.items():
+            if values.get("presence") is False or values.get("status") is False:
+                return 1, True, "{} absent or fault".format(name)
+            rpm = self.__number(values.get("speed_rpm"))
+            if rpm is None:
+                continue
+            history = self.fan_history.setdefault(name, collections.deque(maxlen=CommonCfg.POLLING_HISTORY_LEN))
+            history.append(rpm)
+            mean = sum(history) / len(history)
+            if len(history) < 2 or mean <= 0:
+                continue
+            deviation = math.sqrt(sum((value - mean) ** 2 for value in history) / len(history))
+            if deviation / mean / CommonCfg.POLLING_FAN_CV_FAST > score:
+                score = deviation / mean / CommonCfg.POLLING_FAN_CV_FAST
+                reason = "{} rpm variation {:.1%}".format(name, deviation / mean)
+        return score, urgent, reason
+
+    def __assess_psu(self, devices, prev, elapsed):
+        score, urgent, reason = 0, False, "stable"
+        for name, values in devices.items():
+            if not values.get("presence"):
+                continue
+            if values.get("status") is False or values.get("powergood") is False:
+                return 1, True, "{} fault".format(name)
+            power = self.__number(values.get("power"))
+            last = self.__number(prev.get(name, {}).get("power"))
+            if power is None or last is None:
+                continue
+            delta = abs(power - last) / max(abs(last), 1)
+            if delta / CommonCfg.POLLING_PSU_DELTA_FAST > score:
+                score = delta / CommonCfg.POLLING_PSU_DELTA_FAST
+                reason = "{} power delta {:.1%}".format(name, delta)
+        return score, urgent, reason
+
+    def __assess_sfp(self, now):
+        bitmap = self.get_sfp_bitmap()
+        if bitmap is None:
+            return 0, False, "presence unknown"
+        if self.sfp_bitmap is not None:
+            changes = bin(self.sfp_bitmap ^ bitmap).count("1")
+            if changes:
+                self.sfp_changes.append((now, changes))
+        self.sfp_bitmap = bitmap
+        while self.sfp_changes and now - self.sfp_changes[0][0] > self.SFP_CHURN_WINDOW_SECS:
+            self.sfp_changes.popleft()
+        churn = sum(changes for _, changes in self.sfp_changes) * 60.0 / self.SFP_CHURN_WINDOW_SECS
+        return churn / CommonCfg.POLLING_SFP_CHURN_FAST, False, "{:.2f} plug changes/min".format(churn)
+
+    def __assess(self, kinds, now):
+        stale = [kind for kind in kinds if kind not in self.assessments or
+                 now - self.assessments[kind]["time"] >= CommonCfg.POLLING_ADAPT_SECS]
+        snapshot_kinds = [kind for kind in stale if kind != "sfp"]
+        snapshot = self.get_snapshot(snapshot_kinds, CommonCfg.POLLING_ADAPT_SECS) if snapshot_kinds else {}
+        for kind in stale:
+            previous = self.assessments.get(kind, {})
+            elapsed = now - previous.get("time", now)
+            prev = previous.get("data", {})
+            data = snapshot.get(kind, {})
+            if kind == "thermal":
+                score, urgent, reason = self.__assess_thermal(data, prev, elapsed)
+            elif kind == "fan":
+                score, urgent, reason = self.__assess_fan(data, prev, elapsed)
+            elif kind == "psu":
+                score, urgent, reason = self.__assess_psu(data, prev, elapsed)
+            elif kind == "sfp":
+                score, urgent, reason = self.__assess_sfp(now)
+            else:
+                continue
+            self.assessments[kind] = {"time": now, "data": data, "score": score,
+                                      "urgent": urgent, "reason": reason}
+
+    def get_factor(self, daemon):
+        """
+        Retrieves the polling interval factor of daemon, re-evaluated at
+        most every CommonCfg.POLLING_ADAPT_SECS
+
+        Args:
+            daemon: str, eg. 'thermalctld'
+
+        Returns:
+            float: factor within [POLLING_FACTOR_MIN, POLLING_FACTOR_MAX]
+        """
+        base = self.__get_base_factor(daemon)
+        kinds = self.__get_daemon_kinds(daemon)
+        if not CommonCfg.POLLING_ADAPTIVE or not kinds:
+            return base
+
+        now = time.monotonic()
+        with self.lock:
+            decision = self.decisions.get(daemon)
+            if decision is not None and now - decision["time"] < CommonCfg.POLLING_ADAPT_SECS:
+                return decision["factor"]
+            try:
+                self.__assess(kinds, now)
+            except Exception as error:
+                self.plat_common.log_error("assess polling of {} error:{}", daemon, error)
+                return base
+
+            factor = decision["factor"] if decision is not None else base
+            details = {kind: {"score": round(self.assessments[kind]["score"], 3),
+                              "urgent": self.assessments[kind]["urgent"],
+                              "reason": self.assessments[kind]["reason"]}
+                       for kind in kinds if kind in self.assessments}
+            urgent = [kind for kind, detail in details.items() if detail["urgent"]]
+            score = max([detail["score"] for detail in details.values()] or [0])
+            if urgent:
+                factor = CommonCfg.POLLING_FACTOR_MIN
+                reason = "tighten: {}".format(details[urgent[0]]["reason"])
+            elif score >= 1:
+                factor = base
+                reason = "changing, back to base"
+            elif score < CommonCfg.POLLING_STABLE_SCORE:
+                factor = factor * CommonCfg.POLLING_BACKOFF_STEP
+                reason = "stable, back off"
+            else:
+                factor = max(base, factor / CommonCfg.POLLING_BACKOFF_STEP)
+                reason = "moving, toward base"
+            factor = min(CommonCfg.POLLING_FACTOR_MAX, max(CommonCfg.POLLING_FACTOR_MIN, factor))
+            if decision is None or decision["factor"] != factor:
+                self.plat_common.log_info("polling factor of {} {} -> {}: {}", daemon,
+                                          decision["factor"] if decision else base, factor, reason)
+            self.decisions[daemon] = {"time": now, "factor": factor, "base": base,
+                                      "reason": reason, "kinds": details}
+            return factor
+
+    def get_decision(self, daemon):
+        """
+        Retrieves the last decision of daemon and the reasoning behind it
+
+        Args:
+            daemon: str
+
+        Returns:
+            dict: {"factor", "base", "reason", "kinds": {kind: {"score", "urgent",
+                  "reason"}}, "age"}, None if the factor wasn't evaluated yet
+        """
+        with self.lock:
+            decision = self.decisions.get(daemon)
+            if decision is None:
+                return None
+            result = dict(decision)
+            result["age"] = time.monotonic() - result.pop("time")
+            return result
+
+
+class CpuSignalMonitor(object):
+    """
+    Sampler of the CPU error signals (thermaltrip, caterr, error0-2, nmi,
+    smi) behind Chassis.get_cpu_warning_state. All signals are read in one
+    batch: hooks.get_cpu_signal_bitmap, or the CPLD register of
+    DeviceCfg.CPU_SIGNAL_REGISTER decoded as a bitmap, or else the signal
+    attributes kept open and read with pread. A daemon thread samples every
+    CommonCfg.CPU_SIGNAL_POLL_MS so pulses shorter than the caller's poll
+    interval are latched, every assert/deassert edge is recorded with its
+    timestamp and callers only get the edges they haven't seen.
+    """
+
+    def __init__(self, plat_common, signals):
+        """
+        Args:
+            plat_common: PlatCommon object
+            signals: list of tuple(signal, sysfs path, description), the
+                     attribute reads 0 while the signal is asserted
+        """
+        self.plat_common = plat_common
+        self.signals = signals
+        self.lock = threading.Lock()
+        self.state = None
+        self.seq = 0
+        self.edges = collections.deque(maxlen=CommonCfg.CPU_SIGNAL_EDGES_MAX)
+        # signal -> {"count", "first", "last"} of assert edges
+        self.latched = {}
+        self.read_failed = False
+        # signals whose attribute failed to read, logged once
+        self.bad_signals = set()
+        self.fds = {}
+        self.worker = None
+        self.owner_pid = None
+
+    def __read_register(self, register):
+        """
+        Args:
+            register: dict, {"path": CPLD register attribute, "bits": {signal: bit},
+                      "active_low": bool, default True}
+        """
+        fd = self.fds.get(register["path"])
+        if fd is None:
+            fd = os.open(register["path"], os.O_RDONLY | os.O_CLOEXEC)
+            self.fds[register["path"]] = fd
+        value = int(os.pread(fd, 64, 0).decode("utf-8").strip(), 0)
+        active_low = register.get("active_low", True)
+        asserted = set()
+        for signal, bit in register["bits"].items():
+            if bool(value >> bit & 1) != active_low:
+                asserted.add(signal)
+        return asserted
+
+    def __read_attribute(self, path):
+        """
+        Returns:
+            str: the attribute value, the descriptor is dropped if the read fails
+        """
+        fd = self.fds.get(path)
+        if fd is None:
+            fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            self.fds[path] = fd
+        try:
+            return os.pread(fd, 64, 0).decode("utf-8").strip()
+        except OSError:
+            # the attribute may have been recreated, reopen it next time
+            del self.fds[path]
+            os.close(fd)
+            raise
+
+    def __read_attributes(self):
+        """
+        An attribute that can't be read or holds no valid value is skipped,
+        the other signals are still reported
+        """
+        asserted = set()
+        for signal, path, desc in self.signals:
+            try:
+                value = self.__read_attribute(path)
+                if not self.plat_common.is_valid_value(value):
+                    continue
+                if int(value, 0) == 0:
+                    asserted.add(signal)
+                self.bad_signals.discard(signal)
+            except Exception as err:
+                if signal not in self.bad_signals:
+                    self.plat_common.log_notice("Get cpu {} failed:{}", desc, err)
+                    self.bad_signals.add(signal)
+        return asserted
+
+    def __read(self):
+        """
+        Returns:
+            set: asserted signals
+        """
+        if hasattr(hooks, "get_cpu_signal_bitmap"):
+            bitmap = hooks.get_cpu_signal_bitmap()
+            return {signal for index, (signal, _, _) in enumerate(self.signals) if bitmap >> index & 1}
+        register = getattr(DeviceCfg, "CPU_SIGNAL_REGISTER", None)
+        if register:
+            return self.__read_register(register)
+        return self.__read_attributes()
+
+    def __close(self):
+        for fd in self.fds.values():
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.fds = {}
+
+    def sample(self):
+        """
+        Read all signals once and record the edges since the last sample
+        """
+        with self.lock:
+            try:
+                asserted = self.__read()
+            except Exception as err:
+                # the attributes may have been recreated, reopen them next time
+                self.__close()
+                if not self.read_failed:
+                    self.plat_common.log_notice("Get cpu warning failed:{}", err)
+                    self.read_failed = True
+                return
+            self.read_failed = False
+
+            now = time.time()
+            previous = self.state if self.state is not None else set()
+            for signal, _, desc in self.signals:
+                if (signal in asserted) == (signal in previous):
+                    continue
+                self.seq += 1
+                self.edges.append({"seq": self.seq, "signal": signal, "asserted": signal in asserted,
+                                   "timestamp": now})
+                if signal in asserted:
+                    self.plat_common.log_warning("CPU {} occured!", desc)
+                    latch = self.latched.setdefault(signal, {"count": 0, "first": now, "last": now})
+                    latch["count"] += 1
+                    latch["last"] = now
+            self.state = asserted
+
+    def __run(self):
+        interval = CommonCfg.CPU_SIGNAL_POLL_MS / 1000.0
+        while True:
+            start = time.monotonic()
+            self.sample()
+            time.sleep(max(0, start + interval - time.monotonic()))
+
+    def start(self):
+        """
+        Start the sampling thread, sample in the caller if CPU_SIGNAL_POLL_MS is 0
+        """
+        if CommonCfg.CPU_SIGNAL_POLL_MS <= 0:
+            self.sample()
+            return
+        with self.lock:
+            if self.owner_pid == os.getpid():
+                return
+            # the sampling thread doesn't survive fork
+            self.owner_pid = os.getpid()
+        # signals asserted already are seen by the first caller
+        self.sample()
+        with self.lock:
+            self.worker = threading.Thread(target=self.__run, name="cpu-signal", daemon=True)
+            self.worker.start()
+
+    def get_edges(self, cursor=0):
+        """
+        Retrieves the edges recorded after cursor
+
+        Args:
+            cursor: int, the cursor returned by the previous call, 0 for all kept edges
+
+        Returns:
+            tuple(list, int): edges [{"seq", "signal", "asserted", "timestamp"}]
+                              oldest first, and the cursor for the next call
+        """
+        self.start()
+        with self.lock:
+            return [dict(edge) for edge in self.edges if edge["seq"] > cursor], self.seq
+
+    def get_latched(self):
+        """
+        Retrieves the assert edges of every signal since start
+
+        Returns:
+            dict: signal -> {"count", "first", "last"}, timestamps in time.time()
+        """
+        self.start()
+        with self.lock:
+            return {signal: dict(latch) for signal, latch in self.latched.items()}
+
+    def get_asserted(self):
+        """
+        Returns:
+            set: signals asserted at the last sample
+        """
+        self.start()
+        with self.lock:
+            return set(self.state or ())
+
+
 class Chassis(ChassisBase):
     """Platform-specific Chassis class"""
 
@@ -40,94 +624,155 @@ class Chassis(ChassisBase):
     CPU_ERROR_ERROR0 = "error0"
     CPU_ERROR_NMI = "nmi"
     CPU_ERROR_SMI = "smi"
-
-    # List of SensorBase-derived objects representing all currents
-    # available on the chassis
-    _current_list = []
-
-    # List of SensorBase-derived objects representing all voltages
-    # available on the chassis
-    _voltage_list = []
-
-    # List of fru objects representing all frus
-    # available on the chassis
-    _fru_list = []
-
-    # List of vr objects representing all voltage-regulators
-    # available on the chassis
-    _vr_list = []
-
-    # List of led objects representing all LEDs
-    # available on the chassis
-    _led_list = []
+    # (attribute under extend/system, description, signal), bit order of hooks.get_cpu_signal_bitmap
+    CPU_WARNING_FILES = (("cpu_thermaltrip_out", "thermaltrip", CPU_ERROR_THERMALTRIP),
+                         ("cpu_caterr_3V3", "caterr", CPU_ERROR_CATERR),
+                         ("cpu_error2", "error2", CPU_ERROR_ERROR2),
+                         ("cpu_error1", "error1", CPU_ERROR_ERROR1),
+                         ("cpu_error0", "error0", CPU_ERROR_ERROR0),
+                         ("cpu_smi", "smi", CPU_ERROR_SMI),
+                         ("cpu_nmi", "nmi", CPU_ERROR_NMI))
+
+    # platform snapshot, kind -> (device list getter, ((field, device getter), ...))
+    SNAPSHOT_THRESHOLD_GETTERS = (("high_threshold", "get_high_threshold"),
+                                  ("low_threshold", "get_low_threshold"),
+                                  ("high_critical_threshold", "get_high_critical_threshold"),
+                                  ("low_critical_threshold", "get_low_critical_threshold"))
+    SNAPSHOT_GETTERS = {
+        "thermal": ("get_all_thermals", (("presence", "get_presence"), ("temperature", "get_temperature"),
+                                         ("status", "get_status")) + SNAPSHOT_THRESHOLD_GETTERS),
+        "voltage": ("get_all_voltages", (("presence", "get_presence"), ("value", "get_voltage"),
+                                         ("status", "get_status")) + SNAPSHOT_THRESHOLD_GETTERS),
+        "current": ("get_all_currents", (("presence", "get_presence"), ("value", "get_current"),
+                                         ("status", "get_status")) + SNAPSHOT_THRESHOLD_GETTERS),
+        "fan": ("get_all_fans", (("presence", "get_presence"), ("status", "get_status"),
+                                 ("direction", "get_direction"), ("speed", "get_speed"),
+                                 ("target_speed", "get_target_speed"), ("speed_rpm", "get_speed_rpm"))),
+        "psu": ("get_all_psus", (("presence", "get_presence"), ("status", "get_status"),
+                                 ("powergood", "get_powergood_status"), ("voltage", "get_voltage"),
+                                 ("current", "get_current"), ("power", "get_power"),
+                                 ("input_voltage", "get_input_voltage"), ("input_current", "get_input_current"),
+                                 ("input_power", "get_input_power"), ("temperature", "get_temperature"))),
+    }
+    _snapshot_pool = None
+    _snapshot_pool_pid = None
+    _snapshot_pool_lock = threading.Lock()
 
     def __init__(self):
+        # guards the lazy device lists, re-entrant because builders
+        # may touch other lazy lists
+        self._device_lock = threading.RLock()
+        self._building_devices = set()
+        self._built_devices = set()
+        self._current_list = []
+        self._voltage_list = []
+        self._fru_list = []
+        self._vr_list = []
+        self._led_list = []
         ChassisBase.__init__(self)
         self.plat_common = PlatCommon(debug=CommonCfg.DEBUG)
-
+        self._sfp_monitor = None
+        self._event_engine = None
+        self._snapshot_lock = threading.Lock()
+        self._snapshot = {}
+        self._polling_engine = None
+        self._cpu_signal_monitor = None
+        self._cpu_signal_cursor = 0
+
+    def __init_fan_devices(self):
         try:
-            # fan drawer
             for index in range(0, DeviceCfg.CHASSIS_FAN_INFO["num"]):
                 fandrawer = FanDrawer(index, DeviceCfg.CHASSIS_FAN_INFO["rotor_num"], DeviceCfg.CHASSIS_FAN_INFO["method"])
                 self._fan_drawer_list.append(fandrawer)
                 self._fan_list.extend(fandrawer.get_all_fans())
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # psu
+    def __init_psu_devices(self):
+        try:
             for index in range(0, DeviceCfg.CHASSIS_PSU_INFO["num"]):
                 psu = Psu(index, DeviceCfg.CHASSIS_PSU_INFO["fan_num"], DeviceCfg.CHASSIS_PSU_INFO["method"])
                 self._psu_list.append(psu)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # sfp
+    def __init_sfp_devices(self):
+        try:
             for index in range(0, DeviceCfg.SFP_NUM):
                 sfp = Sfp(index)
                 self._sfp_list.append(sfp)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # thermal
+    def __init_thermal_devices(self):
+        try:
             for index, thermal_info in enumerate(DeviceCfg.CHASSIS_THERMAL_INFO):
                 thermal = Thermal(thermal_info["name"], thermal_info["slot_idx"],
                                   thermal_info["index"], thermal_info["method"])
                 self._thermal_list.append(thermal)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # voltage
+    def __init_voltage_devices(self):
+        try:
             for index, voltage_info in enumerate(DeviceCfg.CHASSIS_VOLTAGE_INFO):
                 voltage = Voltage(voltage_info["name"], voltage_info["slot_idx"],
                                   voltage_info["index"], voltage_info["method"])
                 self._voltage_list.append(voltage)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # current
+    def __init_current_devices(self):
+        try:
             for index, current_info in enumerate(DeviceCfg.CHASSIS_CURRENT_INFO):
                 current = Current(current_info["name"], current_info["slot_idx"],
                                   current_info["index"], current_info["method"])
                 self._current_list.append(current)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # component:
+    def __init_component_devices(self):
+        try:
             for comp_type, comp_info in DeviceCfg.CHASSIS_COMPONENT_INFO.items():
                 for index, comp_detail in enumerate(comp_info):
                     component = Component(comp_type, index, comp_detail)
                     self._component_list.append(component)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # vr
+    def __init_vr_devices(self):
+        try:
             for index, vr_info in enumerate(DeviceCfg.CHASSIS_VR_INFO):
                 vr = VoltageRegulator(index, vr_info["name"], vr_info["method"])
                 self._vr_list.append(vr)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # fru
+    def __init_fru_devices(self):
+        try:
             for index, fru_info in enumerate(DeviceCfg.CHASSIS_FRU_INFO):
                 fru = Fru(index, fru_info["name"], fru_info["method"], fru_info["id"])
                 self._fru_list.append(fru)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # led
+    def __init_led_devices(self):
+        try:
             for index, led_info in enumerate(DeviceCfg.CHASSIS_LED_INFO):
                 led = Led(index, led_info["name"], led_info["method"])
                 self._led_list.append(led)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # syseeprom
+    def __init_eeprom_device(self):
+        try:
             self._eeprom = Eeprom()
-            # watchdog
-            self._watchdog = Watchdog(DeviceCfg.HAS_WATCHDOG)
+        except Exception as error:
+            self.plat_common.log_error(str(error))
 
-            # slot(linecard)
-            self.__init_slot_devices()
+    def __init_watchdog_device(self):
+        try:
+            self._watchdog = Watchdog(DeviceCfg.HAS_WATCHDOG)
         except Exception as error:
             self.plat_common.log_error(str(error))
 
@@ -137,42 +782,44 @@ class Chassis(ChassisBase):
                 slot_index = index + 1
                 slot_path = os.path.join(CommonCfg.S3IP_SLOT_PATH, "slot{}".format(slot_index))
 
-                thermal_num = self.plat_common.read_file(os.path.join(slot_path,
-                                                                          "num_temp_sensors"))
-                vol_num = self.plat_common.read_file(os.path.join(slot_path,
-                                                                      "num_vol_sensors"))
-                curr_num = self.plat_common.read_file(os.path.join(slot_path,
-                                                                       "num_curr_sensors"))
-
-                if self.plat_common.is_valid_value(thermal_num):
-                    for thermal_index in range(1, int(thermal_num) + 1):
-                        name_path = os.path.join(slot_path,
-                                                 "temp_sensor{}".format(thermal_index),
-                                                 "alias")
-                        name = self.plat_common.read_file(name_path)
-                        thermal = Thermal(name, slot_index, thermal_index)
-                        self._thermal_list.append(thermal)
-
-                if self.plat_common.is_valid_value(vol_num):
-                    for vol_index in range(1, int(vol_num) + 1):
+                num_paths = [os.path.join(slot_path, "num_temp_sensors"),
+                             os.path.join(slot_path, "num_vol_sensors"),
+                             os.path.join(slot_path, "num_curr_sensors")]
+                nums, _ = self.plat_common.read_files_typed(num_paths, int)
+
+                devices = []
+                for num_path, dir_name, device_class, device_list in [
+                        (num_paths[0], "temp_sensor", Thermal, self._thermal_list),
+                        (num_paths[1], "vol_sensor", Voltage, self._voltage_list),
+                        (num_paths[2], "curr_sensor", Current, self._current_list)]:
+                    for device_index in range(1, (nums.get(num_path) or 0) + 1):
                         name_path = os.path.join(slot_path,
-                                                 "vol_sensor{}".format(vol_index),
+                                                 "{}{}".format(dir_name, device_index),
                                                  "alias")
-                        name = self.plat_common.read_file(name_path)
-                        voltage = Voltage(name, slot_index, vol_index)
-                        self._voltage_list.append(voltage)
+                        devices.append((name_path, device_class, device_index, device_list))
 
-                if self.plat_common.is_valid_value(curr_num):
-                    for curr_index in range(1, int(curr_num) + 1):
-                        name_path = os.path.join(slot_path,
-                                                 "curr_sensor{}".format(curr_index),
-                                                 "alias")
-                        name = self.plat_common.read_file(name_path)
-                        current = Current(name, slot_index, curr_index)
-                        self._current_list.append(current)
+                names, _ = self.plat_common.read_files([device[0] for device in devices])
+                for name_path, device_class, device_index, device_list in devices:
+                    device_list.append(device_class(names.get(name_path), slot_index, device_index))
         except Exception as error:
             self.plat_common.log_error(str(error))
 
+    # Device objects are created on first access of the attribute, slot
+    # (linecard) sensors are appended after the chassis ones
+    _fan_drawer_list = LazyDevice(__init_fan_devices)
+    _fan_list = LazyDevice(__init_fan_devices)
+    _psu_list = LazyDevice(__init_psu_devices)
+    _sfp_list = LazyDevice(__init_sfp_devices)
+    _thermal_list = LazyDevice(__init_thermal_devices, __init_slot_devices)
+    _voltage_list = LazyDevice(__init_voltage_devices, __init_slot_devices)
+    _current_list = LazyDevice(__init_current_devices, __init_slot_devices)
+    _component_list = LazyDevice(__init_component_devices)
+    _vr_list = LazyDevice(__init_vr_devices)
+    _fru_list = LazyDevice(__init_fru_devices)
+    _led_list = LazyDevice(__init_led_devices)
+    _eeprom = LazyDevice(__init_eeprom_device)
+    _watchdog = LazyDevice(__init_watchdog_device)
+
     def get_presence(self):
         """
         Retrieves the presence of the chassis
@@ -874,11 +1521,13 @@ class Chassis(ChassisBase):
         Args:
             timeout: Timeout in milliseconds (optional). If timeout == 0,
                 this method will block until a change is detected.
-            scantime: Scan device change event interval, default is 0.5s
+            scantime: Scan device change event interval, default is 0.5s, device
+                types in CommonCfg.EVENT_SCAN_SECS use their own interval
 
         Returns:
             (bool, dict):
-                - bool: True if call successful, False if not;
+                - bool: True if call successful (also on timeout, with empty
+                        dictionaries), False if no device type in dev_list is supported;
                 - dict: A nested dictionary where key is a device type,
                         value is a dictionary with key:value pairs in the format of
                         {'device_id':'device_event'}, where device_id is the device ID
@@ -917,54 +1566,245 @@ class Chassis(ChassisBase):
 
                          'voltage'     '<monitor point>'   '0'              Vout normal
                                                            '1'              Vout abnormal
+
+                         other, eg.    '<device name>'     '0'              Status normal
+                         'current'                         '1'              Status abnormal
                          -----------------------------------------------------------------
+                        Device types without a get_all_<dev>s getter are not supported.
         """
         if dev_list is None:
             dev_list = ["sfp"]
 
-        start_ms = time.time() * 1000
-        change_event_dict = {}
-        dev_change_event_dict = {}
-        ret = False
+        return self.__get_event_engine().wait(dev_list, timeout, scantime)
 
-        while True:
-            time.sleep(scantime)
+    def __get_event_engine(self):
+        with self._device_lock:
+            if self._event_engine is None:
+                engine = ChassisEventEngine(self.plat_common, self.__get_device_scanner)
+                if CommonCfg.SFP_EVENT_MODE != CommonCfg.SFP_EVENT_MODE_SCAN:
+                    engine.add_source("sfp", lambda interval: self.__get_sfp_monitor().wait(interval, interval),
+                                      blocking=True)
+                self._event_engine = engine
+            return self._event_engine
 
-            for dev in dev_list:
-                change_event_dict.update({dev: {}})
-                self.plat_common.log_info('get {} event...'.format(dev))
-                d_list = getattr(self, 'get_all_{}s'.format(dev))()
-                for d in d_list:
-                    (ret, dev_change_event_dict) = d.get_change_event()
+    def __get_device_scanner(self, dev):
+        """
+        Scanner of any device type with a get_all_<dev>s getter. Devices
+        without get_change_event report '0' normal or '1' abnormal when
+        their status (or presence) changes, like thermal and voltage
+
+        Returns:
+            callable(interval): None if the device type is unknown
+        """
+        list_getter = getattr(self, 'get_all_{}s'.format(dev), None)
+        if list_getter is None:
+            return None
+        last_status = {}
+
+        def scan(interval):
+            events = {}
+            for device in list_getter():
+                if hasattr(device, "get_change_event"):
+                    ret, dev_change_event_dict = device.get_change_event()
                     if ret:
-                        change_event_dict[dev].update(dev_change_event_dict[dev])
-
-            for events in change_event_dict.values():
-                if len(events):
-                    return True, change_event_dict
-
-            if timeout:
-                now_ms = time.time() * 1000
-                if (now_ms - start_ms) >= timeout:
-                    for events in change_event_dict.values():
-                        if len(events):
-                            return True, change_event_dict
-                        else:
-                            # return False, change_event_dict
-                            # temporary modification fro xcvrd
-                            return True, change_event_dict
+                        events.update(dev_change_event_dict.get(dev, {}))
+                    continue
+                name = device.get_name()
+                status = device.get_status() if hasattr(device, "get_status") else device.get_presence()
+                if last_status.get(name, False) != status:
+                    last_status[name] = status
+                    events[name] = "0" if status else "1"
+            return events
+        return scan
+
+    @classmethod
+    def __get_snapshot_pool(cls):
+        with cls._snapshot_pool_lock:
+            if cls._snapshot_pool is None or cls._snapshot_pool_pid != os.getpid():
+                cls._snapshot_pool = futures.ThreadPoolExecutor(
+                    max_workers=CommonCfg.SNAPSHOT_MAX_WORKERS, thread_name_prefix="platform-snapshot")
+                cls._snapshot_pool_pid = os.getpid()
+            return cls._snapshot_pool
+
+    def __read_device(self, device, getters):
+        values = {}
+        for field, getter in getters:
+            try:
+                values[field] = getattr(device, getter)()
+            except Exception as error:
+                self.plat_common.log_error("snapshot {} {} error:{}", device.get_name(), getter, error)
+                values[field] = None
+        return values
+
+    def __take_snapshot(self, kinds):
+        memo = ReadMemo()
+        pool = self.__get_snapshot_pool()
+        timestamp = time.time()
+        jobs = []
+        for kind in kinds:
+            list_getter, getters = self.SNAPSHOT_GETTERS[kind]
+            for device in getattr(self, list_getter)():
+                jobs.append((kind, device, pool.submit(self.plat_common.run_with_memo, memo,
+                                                       self.__read_device, device, getters)))
+
+        result = {kind: {} for kind in kinds}
+        for kind, device, job in jobs:
+            try:
+                result[kind][device.get_name()] = job.result()
+            except Exception as error:
+                self.plat_common.log_error("snapshot {} error:{}", kind, error)
+        stats = memo.get_stats()
+        self.plat_common.log_info("platform snapshot {}: {} reads, {} shared", kinds, stats["reads"], stats["hits"])
+        return timestamp, result
+
+    def get_platform_snapshot(self, kinds=None, max_age=None):
+        """
+        Retrieves sensor values and thresholds, fan speeds, psu readings and
+        presence in one concurrent pass. Devices reading the same sysfs file
+        or BMC url share one read, calls within max_age get the last snapshot
+
+        Args:
+            kinds: list of str, "thermal", "voltage", "current", "fan", "psu",
+                   None for all
+            max_age: float, seconds a snapshot may be old,
+                     default CommonCfg.PLATFORM_SNAPSHOT_MAX_AGE
+
+        Returns:
+            dict: {"timestamp": float, time of the oldest kind included,
+                   <kind>: {<device name>: {<field>: value}}}
+        """
+        if kinds is None:
+            kinds = list(self.SNAPSHOT_GETTERS.keys())
+        if max_age is None:
+            max_age = CommonCfg.PLATFORM_SNAPSHOT_MAX_AGE
+        unsupported = [kind for kind in kinds if kind not in self.SNAPSHOT_GETTERS]
+        if unsupported:
+            self.plat_common.log_error("unsupported snapshot kinds {}", unsupported)
+            kinds = [kind for kind in kinds if kind in self.SNAPSHOT_GETTERS]
+
+        # one pass at a time, concurrent callers get the pass in progress
+        with self._snapshot_lock:
+            now = time.time()
+            stale = [kind for kind in kinds
+                     if kind not in self._snapshot or now - self._snapshot[kind][0] >= max_age]
+            if stale:
+                timestamp, result = self.__take_snapshot(stale)
+                for kind in stale:
+                    self._snapshot[kind] = (timestamp, result[kind])
+
+            snapshot = {"timestamp": min([self._snapshot[kind][0] for kind in kinds] or [now])}
+            for kind in kinds:
+                snapshot[kind] = {name: dict(values) for name, values in self._snapshot[kind][1].items()}
+            return snapshot
+
+    def get_sfp_presence_bitmap(self, max_age=None):
+        """
+        Retrieves the presence of all transceiver cages in one read
+
+        Args:
+            max_age: float, seconds a cached bitmap may be old,
+                     default CommonCfg.SFP_PRESENCE_CACHE_SECS
+
+        Returns:
+            int: bit N set if sfp N+1 is present, None for Fail
+        """
+        return SfpPresenceBitmap.get(self.plat_common, max_age)
+
+    def read_sfp_eeprom_bulk(self, offset, num_bytes, bypass_cache=False):
+        """
+        Read the same eeprom range of all present transceivers, one worker
+        per i2c adapter
+
+        Args:
+            offset: int, optoe linear address
+            num_bytes: int
+            bypass_cache: bool, don't serve static ranges from the page cache
+
+        Returns:
+            dict: sfp index (start from 1) -> bytearray, None for Fail
+        """
+        return SfpIoScheduler.read_eeprom_bulk(self.get_all_sfps(), offset, num_bytes, bypass_cache)
+
+    def set_sfp_control(self, control, value, sfp_indexes=None):
+        """
+        Write lpmode, reset, power or write_enable of many ports in one call,
+        cpld group attributes are written once for all their ports
+
+        Args:
+            control: str, "lpmode", "reset", "power" or "write_enable"
+            value: int or str, written as is
+            sfp_indexes: list of sfp index (start from 1), None for all ports
+
+        Returns:
+            dict: sfp index -> True if written successfully, False if not
+        """
+        results = SfpPortControl.apply(self.plat_common, control, value, sfp_indexes)
+        if control in ("reset", "power"):
+            # module content is undefined after reset or power change
+            for sfp in self.get_all_sfps():
+                if sfp.index in results:
+                    sfp.invalidate_eeprom_cache()
+        return results
+
+    def bring_up_sfps(self, sfp_indexes=None, power_budget=None):
+        """
+        Release present transceivers from reset and lpmode in waves within
+        the power budget and inrush limit, eg. once after a cold boot
+
+        Args:
+            sfp_indexes: list of sfp index (start from 1), None for all ports
+            power_budget: float, W for all transceivers, None for the platform default
+
+        Returns:
+            dict: sfp index -> {"state", "ready", "time_to_ready", "power", "wave"}
+        """
+        sfp_list = [sfp for sfp in self.get_all_sfps()
+                    if sfp_indexes is None or sfp.index in sfp_indexes]
+        return SfpBringUpScheduler(sfp_list, self.plat_common, power_budget=power_budget).run()
+
+    def __get_sfp_monitor(self):
+        if self._sfp_monitor is None:
+            self._sfp_monitor = SfpPresenceMonitor(self.get_all_sfps(), self.plat_common)
+        return self._sfp_monitor
+
+    def __get_polling_engine(self):
+        with self._device_lock:
+            if self._polling_engine is None:
+                self._polling_engine = PollingIntervalEngine(self.plat_common, self.get_platform_snapshot,
+                                                             self.get_sfp_presence_bitmap)
+            return self._polling_engine
 
     def get_polling_interval_factor(self, daemon):
         try:
-            factor = DeviceCfg.POLLING_INTERVAL_FACTOR[daemon]
-            return factor
+            return self.__get_polling_engine().get_factor(daemon)
         except Exception as error:
             self.plat_common.log_error(str(error))
             return 1
 
+    def get_polling_decision(self, daemon):
+        """
+        Retrieves the current polling interval factor of daemon and why
+
+        Args:
+            daemon: str, eg. 'thermalctld'
+
+        Returns:
+            dict: {"factor", "base", "reason", "kinds", "age"}, None if not evaluated yet
+        """
+        return self.__get_polling_engine().get_decision(daemon)
+
+    def __get_cpu_signal_monitor(self):
+        with self._device_lock:
+            if self._cpu_signal_monitor is None:
+                signals = [(signal, os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system", file_name), desc)
+                           for file_name, desc, signal in self.CPU_WARNING_FILES]
+                self._cpu_signal_monitor = CpuSignalMonitor(self.plat_common, signals)
+            return self._cpu_signal_monitor
+
     def get_cpu_warning_state(self):
         """
-        Retrive the state of the cpu warning
+        Retrive the state of the cpu warning, the signals asserted now and
+        the pulses asserted since the previous call
 
         Returns:
             list: cpu warning description, eg."caterr", "thermaltrip"
@@ -972,54 +1812,33 @@ class Chassis(ChassisBase):
         if hasattr(hooks, "get_cpu_warning_state"):
             return hooks.get_cpu_warning_state()
 
-        thermaltrip_path = os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system/cpu_thermaltrip_out")
-        caterr_path = os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system/cpu_caterr_3V3")
-        error2_path = os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system/cpu_error2")
-        error1_path = os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system/cpu_error1")
-        error0_path = os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system/cpu_error0")
-        nmi_path = os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system/cpu_nmi")
-        smi_path = os.path.join(CommonCfg.S3IP_EXTEND_PATH, "system/cpu_smi")
-        cpu_warning_signals = []
+        monitor = self.__get_cpu_signal_monitor()
+        edges, self._cpu_signal_cursor = monitor.get_edges(self._cpu_signal_cursor)
+        asserted = monitor.get_asserted()
+        asserted.update(edge["signal"] for edge in edges if edge["asserted"])
+        return [signal for _, _, signal in self.CPU_WARNING_FILES if signal in asserted]
 
-        try:
-            thermal_trip = self.plat_common.read_file(thermaltrip_path)
-            if self.plat_common.is_valid_value(thermal_trip) and int(thermal_trip) == 0:
-                self.plat_common.log_warning("CPU thermaltrip occured!")
-                cpu_warning_signals.append(self.CPU_ERROR_THERMALTRIP)
-
-            caterr = self.plat_common.read_file(caterr_path)
-            if self.plat_common.is_valid_value(caterr) and int(caterr) == 0:
-                self.plat_common.log_warning("CPU caterr occured!")
-                cpu_warning_signals.append(self.CPU_ERROR_CATERR)
-
-            error2 = self.plat_common.read_file(error2_path)
-            if self.plat_common.is_valid_value(error2) and int(error2) == 0:
-                self.plat_common.log_warning("CPU error2 occured!")
-                cpu_warning_signals.append(self.CPU_ERROR_ERROR2)
-
-            error1 = self.plat_common.read_file(error1_path)
-            if self.plat_common.is_valid_value(error1) and int(error1) == 0:
-                self.plat_common.log_warning("CPU error1 occured!")
-                cpu_warning_signals.append(self.CPU_ERROR_ERROR1)
-
-            error0 = self.plat_common.read_file(error0_path)
-            if self.plat_common.is_valid_value(error0) and int(error0) == 0:
-                self.plat_common.log_warning("CPU error0 occured!")
-                cpu_warning_signals.append(self.CPU_ERROR_ERROR0)
-
-            smi = self.plat_common.read_file(smi_path)
-            if self.plat_common.is_valid_value(smi) and int(smi) == 0:
-                self.plat_common.log_warning("CPU smi occured!")
-                cpu_warning_signals.append(self.CPU_ERROR_SMI)
-
-            nmi = self.plat_common.read_file(nmi_path)
-            if self.plat_common.is_valid_value(nmi) and int(nmi) == 0:
-                self.plat_common.log_warning("CPU nmi occured!")
-                cpu_warning_signals.append(self.CPU_ERROR_NMI)
-        except Exception as err:
-            self.plat_common.log_notice("Get cpu warning failed:{}".format(str(err)))
+    def get_cpu_signal_events(self, cursor=0):
+        """
+        Retrieves the assert/deassert edges of the cpu error signals
+
+        Args:
+            cursor: int, returned by the previous call, 0 for all kept edges
 
-        return cpu_warning_signals
+        Returns:
+            tuple(list, int): [{"seq", "signal", "asserted", "timestamp"}] and
+                              the cursor for the next call
+        """
+        return self.__get_cpu_signal_monitor().get_edges(cursor)
+
+    def get_cpu_signal_latched(self):
+        """
+        Retrieves how often and when every cpu error signal was asserted
+
+        Returns:
+            dict: signal -> {"count", "first", "last"}
+        """
+        return self.__get_cpu_signal_monitor().get_latched()
 
     def get_fan_watchdog_status(self):
         """
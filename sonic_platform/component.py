@@ -9,14 +9,16 @@ try:
     import os
     import sys
     import re
-    import binascii
-    import hashlib
-    import datetime
-    import logging
     import time
     from sonic_platform_base.component_base import ComponentBase
     from sonic_platform.plat_common import PlatCommon
     from sonic_platform.plat_common import CommonCfg
+    from sonic_platform.plat_common import LazyImport
+    # only needed by firmware upgrade
+    binascii = LazyImport("binascii")
+    hashlib = LazyImport("hashlib")
+    datetime = LazyImport("datetime")
+    logging = LazyImport("logging")
     from vendor_sonic_platform import hooks
     from vendor_sonic_platform.device import DeviceCfg
 except ImportError as import_error:
@@ -50,7 +52,7 @@ class Component(ComponentBase):
         self.plat_comm = PlatCommon(debug=CommonCfg.DEBUG)
         self.__init_component_cfg(comp_info)
         self.fwup_log_file = "/var/log/fw_upgrade.log"
-        self.__init_logging()
+        self.logger = None
         self.cpld_upgrade_sysfs = CommonCfg.S3IP_FW_CTL_PATH + "/cpld_update_ctrl"
         if hasattr(DeviceCfg, "NEW_BMC_RESTFUL"):
             self.new_restful = DeviceCfg.NEW_BMC_RESTFUL
@@ -71,6 +73,8 @@ class Component(ComponentBase):
 
     # Logging facility
     def __fw_log(self, message):
+        if self.logger is None:
+            self.__init_logging()
         return self.logger.info(message)
 
     def __init_component_cfg(self, comp_info):
@@ -9,13 +9,15 @@ try:
     import os.path
     from sonic_platform.plat_common import PlatCommon
     from sonic_platform.plat_common import CommonCfg
+    from sonic_platform.plat_common import RecordedReadings
     from sonic_platform_base.fan_base import FanBase
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found") from e
 
 RETRY_CNT = 8
-class Fan(FanBase):
+class Fan(RecordedReadings, FanBase):
     """Platform-specific Fan class"""
+    RECORDED_READINGS = ("speed_rpm",)
     def __init__(self, index, parent=None, is_psu_fan=False, method="sysfs"):
         """
         Fan initial
@@ -62,6 +64,17 @@ class Fan(FanBase):
         """
         return "{}_Fan{}".format(self.parent.get_name(), self.index)
 
+    def is_stale(self):
+        """
+        Whether the last RESTful reading is the last known value because BMC was unreachable
+
+        Returns:
+            bool: True for stale
+        """
+        if self.is_psu_fan:
+            return self.parent.is_stale()
+        return self.plat_common.is_stale()
+
     def get_presence(self):
         """
         Obtain the presence of the current fan
@@ -339,9 +352,8 @@ class Fan(FanBase):
         speed = None
         try:
             if self.is_psu_fan:
-                return self.parent.get_fan_speed_rpm()
-
-            if self.method in [CommonCfg.BY_RESTFUL, CommonCfg.BY_CACHE]:
+                speed = self.parent.get_fan_speed_rpm()
+            elif self.method in [CommonCfg.BY_RESTFUL, CommonCfg.BY_CACHE]:
                 rotor = "Rotor{}".format(self.index)
                 if self.method == CommonCfg.BY_RESTFUL:
                     speed_info = self.plat_common.get_fantray_speed_info_by_restful(self.parent.get_index())
@@ -359,6 +371,7 @@ class Fan(FanBase):
         except Exception as error:
             self.plat_common.log_error("Get fan speed rpm error:{}".format(str(error)))
 
+        self.record_reading("speed_rpm", speed)
         return speed
 
     def get_speed_rpm_max(self):
@@ -2,17 +2,73 @@
 
 try:
     import os
-    import requests
-    import json
-    import subprocess
+    import array
+    import errno
+    import itertools
+    import collections
+    import re
     import syslog
     import random
     import time
     import fcntl
-    import urllib3
-    from sonic_py_common import device_info
-    from urllib3.exceptions import InsecureRequestWarning
-    urllib3.disable_warnings(InsecureRequestWarning)
+    import threading
+    import struct
+    import mmap
+    import math
+    import importlib
+    import importlib.util
+except ImportError as e:
+    raise ImportError(str(e) + "- required module not found") from e
+
+
+class LazyImport(object):
+    """
+    Placeholder of a module, or of an attribute of a module, that is
+    imported on first attribute access or call. Keeps the http stack and
+    other heavy modules out of the startup path of pmon daemons and CLIs
+    that never use them.
+    """
+
+    def __init__(self, module_name, attr_name=None):
+        """
+        Args:
+            module_name: str, eg. 'requests', 'sonic_platform.sfp'
+            attr_name: str, eg. 'Sfp', None for the module itself
+
+        Raises:
+            ImportError if the module can't be found
+        """
+        if importlib.util.find_spec(module_name) is None:
+            raise ImportError("No module named '{}'".format(module_name))
+        self._module_name = module_name
+        self._attr_name = attr_name
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            module = importlib.import_module(self._module_name)
+            if self._attr_name is None:
+                self._target = module
+            else:
+                self._target = getattr(module, self._attr_name)
+        return self._target
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+
+try:
+    json = LazyImport("json")
+    subprocess = LazyImport("subprocess")
+    requests = LazyImport("requests")
+    urllib3 = LazyImport("urllib3")
+    device_info = LazyImport("sonic_py_common.device_info")
+    futures = LazyImport("concurrent.futures")
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found") from e
 
@@ -21,6 +77,100 @@ class CommonCfg(object):
     DEBUG                          =                                   False
     RETRY_MAX_CNT                  =                                       3
     RETRY_INTERVAL_BASE            =                                       3
+    RETRY_BACKOFF_BASE             =                                     0.5
+    RETRY_BACKOFF_MAX              =                                       8
+
+    """ bmc restful circuit breaker """
+    BMC_GET_TIMEOUT                =                                      15
+    BREAKER_FAIL_THRESHOLD         =                                       3
+    BREAKER_OPEN_SECS              =                                      15
+    BREAKER_PROBE_INTERVAL         =                                       5
+    BREAKER_PROBE_TIMEOUT          =                                       3
+    BMC_STALE_MAX_AGE              =                                     300
+
+    """ platform_cache json files, unit second """
+    CACHE_FILE_WAIT_SECS           =                                       5
+    CACHE_FILE_POLL_SECS           =                                     0.1
+    CACHE_FILE_REWAIT_SECS         =                                      30
+    CACHE_FILE_MISSING_GRACE       =                                       5
+
+    """ platform_cache backend, 'json' files or 'mmap' binary snapshot """
+    CACHE_BACKEND_JSON             =                                  "json"
+    CACHE_BACKEND_MMAP             =                                  "mmap"
+    CACHE_BACKEND                  =                      CACHE_BACKEND_JSON
+    """ binary snapshot built from json data older than this is not used, unit second """
+    TELEMETRY_SNAPSHOT_MAX_AGE     =                                       0
+
+    """ sysfs attributes kept open by SysfsReader """
+    SYSFS_MAX_OPEN_FDS             =                                     512
+    BATCH_READ_MAX_WORKERS         =                                       4
+
+    """ transceiver plug events, 'auto' waits for sysfs notification with
+        bitmap poll fallback, 'scan' calls every Sfp each scantime """
+    SFP_EVENT_MODE_AUTO            =                                  "auto"
+    SFP_EVENT_MODE_SCAN            =                                  "scan"
+    SFP_EVENT_MODE                 =                     SFP_EVENT_MODE_AUTO
+    SFP_NOTIFY_RESCAN_SECS         =                                       5
+    SFP_PRESENCE_CACHE_SECS        =                                     0.5
+    SFP_EEPROM_CACHE_VERIFY_SECS   =                                       1
+    SFP_CHANNEL_STATUS_CACHE_SECS  =                                       1
+
+    """ Chassis.get_change_event scan interval per device type, unit second,
+        others use the caller's scantime """
+    EVENT_SCAN_SECS                = {"fan": 1, "psu": 1, "thermal": 5, "voltage": 5}
+
+    """ transceiver i2c topology (SMBUSx/MUXx/PORTx-EEPROM), first existing file is used """
+    SFP_TOPOLOGY_FILE              = "/usr/share/sonic/platform/platform-device.json"
+    SFP_TOPOLOGY_PDDF_FILE         = "/usr/share/sonic/platform/pddf/pddf-device.json"
+    SFP_TOPOLOGY_FILES             = (SFP_TOPOLOGY_FILE, SFP_TOPOLOGY_PDDF_FILE)
+
+    """ transceiver staged bring-up, power in W, time in second """
+    SFP_BRINGUP_POWER_BUDGET       =                                     800
+    SFP_BRINGUP_INRUSH_PORTS       =                                      16
+    SFP_BRINGUP_WAVE_SECS          =                                     0.2
+    SFP_BRINGUP_LOW_POWER          =                                     1.5
+    SFP_BRINGUP_DEFAULT_POWER      =                                      12
+    SFP_BRINGUP_READY_TIMEOUT      =                                      60
+    SFP_BRINGUP_POLL_SECS          =                                    0.05
+
+    """ syslog rate limit of identical error/warning messages """
+    LOG_RATE_LIMIT_SECS            =                                      60
+    LOG_RATE_LIMIT_ENTRIES         =                                     256
+
+    """ bmc restful connection pool """
+    BMC_POOL_CONNECTIONS           =                                       1
+    BMC_POOL_MAXSIZE               =                                       4
+    BMC_POOL_BLOCK                 =                                    True
+
+    """ readings kept by Thermal, Voltage, Current, Psu and Fan for recorded min/max """
+    SENSOR_HISTORY_DEPTH           =                                     100
+
+    """ Chassis.get_platform_snapshot, unit second """
+    PLATFORM_SNAPSHOT_MAX_AGE      =                                       3
+    SNAPSHOT_MAX_WORKERS           =                                       8
+
+    """ cpu error signal sampling interval, unit ms, 0 samples in the caller only;
+        number of signal edges kept """
+    CPU_SIGNAL_POLL_MS             =                                      20
+    CPU_SIGNAL_EDGES_MAX           =                                     256
+
+    """ adaptive polling interval factor, bounded to [MIN, MAX], re-evaluated every ADAPT_SECS """
+    POLLING_ADAPTIVE               =                                    True
+    POLLING_FACTOR_MIN             =                                     0.5
+    POLLING_FACTOR_MAX             =                                       4
+    POLLING_BACKOFF_STEP           =                                     1.5
+    POLLING_ADAPT_SECS             =                                      30
+    POLLING_HISTORY_LEN            =                                      10
+    POLLING_STABLE_SCORE           =                                     0.2
+    POLLING_THERMAL_SLOPE_FAST     =                                     1.0  # C/min
+    POLLING_THERMAL_MARGIN_NEAR    =                                       5  # C below high threshold
+    POLLING_FAN_CV_FAST            =                                    0.05  # rpm stdev/mean
+    POLLING_PSU_DELTA_FAST         =                                     0.1  # relative power change
+    POLLING_SFP_CHURN_FAST         =                                       1  # plug changes/min
+    POLLING_DAEMON_KINDS           = {"thermalctld": ("thermal", "fan"), "psud": ("psu",), "xcvrd": ("sfp",)}
+
+    """ bmc sensor snapshot refresh interval, unit second """
+    SENSOR_SNAPSHOT_TTL            =                                       3
 
     """ platform api supported access-method """
     BY_SYSFS                       =                                 "sysfs"
@@ -203,21 +353,24 @@ class Logger(object):
     DEFAULT_LOG_FACILITY = LOG_FACILITY_USER
     DEFAULT_LOG_OPTION = LOG_OPTION_NDELAY
 
+    # one syslog handle and one rate-limit table per process
+    _log_lock = threading.Lock()
+    _openlog_pid = None
+    _recent_errors = collections.OrderedDict()
+    _suppressed_count = 0
+
     def __init__(self, log_facility=DEFAULT_LOG_FACILITY, log_option=DEFAULT_LOG_OPTION):
         self._syslog = syslog
 
         # Initialize syslog
-        self._syslog.openlog(logoption=log_option, facility=log_facility)
+        with Logger._log_lock:
+            if Logger._openlog_pid != os.getpid():
+                self._syslog.openlog(logoption=log_option, facility=log_facility)
+                Logger._openlog_pid = os.getpid()
 
         # Set the default minimum log priority to LOG_PRIORITY_NOTICE
         self.set_min_log_priority(self.LOG_PRIORITY_NOTICE)
 
-    def __del__(self):
-        try:
-            self._syslog.closelog()
-        except TypeError:
-            pass
-
     #
     # Methods for setting minimum log priority
     #
@@ -266,42 +419,1588 @@ class Logger(object):
     # Methods for logging messages
     #
 
-    def log(self, priority, msg, also_print_to_console=False):
-        if self._min_log_priority >= priority:
-            # Send message to syslog
-            self._syslog.syslog(priority, msg)
+    def is_enabled_for(self, priority):
+        """
+        Check whether messages of <priority> will be logged, so callers
+        can skip building expensive messages
+
+        Args:
+            priority: log priority
+
+        Returns:
+            bool: True if enabled
+        """
+        return self._min_log_priority >= priority
+
+    @classmethod
+    def __check_rate_limit(cls, msg):
+        """
+        Returns:
+            tuple(allowed, suppressed): suppressed is the number of identical
+            messages dropped since msg was last logged
+        """
+        now = time.monotonic()
+        with cls._log_lock:
+            entry = cls._recent_errors.get(msg)
+            if entry is not None and now - entry[0] < CommonCfg.LOG_RATE_LIMIT_SECS:
+                entry[1] += 1
+                Logger._suppressed_count += 1
+                return False, 0
+            suppressed = entry[1] if entry is not None else 0
+            cls._recent_errors[msg] = [now, 0]
+            cls._recent_errors.move_to_end(msg)
+            while len(cls._recent_errors) > CommonCfg.LOG_RATE_LIMIT_ENTRIES:
+                cls._recent_errors.popitem(last=False)
+            return True, suppressed
+
+    @classmethod
+    def get_suppressed_count(cls):
+        """
+        Retrieves the number of repeated messages dropped by rate limiting
+
+        Returns:
+            int: suppressed message count of this process
+        """
+        return Logger._suppressed_count
+
+    def log(self, priority, msg, *args, also_print_to_console=False):
+        """
+        Log msg, formatted with msg.format(*args) only if it will be emitted.
+        Identical error and warning messages are logged at most once
+        every CommonCfg.LOG_RATE_LIMIT_SECS
+        """
+        enabled = self._min_log_priority >= priority
+        if not enabled and not also_print_to_console:
+            return
+
+        if args:
+            msg = msg.format(*args)
+
+        if enabled:
+            if priority <= self.LOG_PRIORITY_WARNING:
+                allowed, suppressed = self.__check_rate_limit(msg)
+                if allowed and suppressed:
+                    msg = "{} (suppressed {} identical messages)".format(msg, suppressed)
+            else:
+                allowed = True
+            if allowed:
+                # Send message to syslog
+                self._syslog.syslog(priority, msg)
 
         # Send message to console
         if also_print_to_console:
             print(msg)
 
-    def log_error(self, msg, also_print_to_console=False):
-        self.log(self.LOG_PRIORITY_ERROR, msg, also_print_to_console)
+    def log_error(self, msg, *args, also_print_to_console=False):
+        self.log(self.LOG_PRIORITY_ERROR, msg, *args, also_print_to_console=also_print_to_console)
+
+    def log_warning(self, msg, *args, also_print_to_console=False):
+        self.log(self.LOG_PRIORITY_WARNING, msg, *args, also_print_to_console=also_print_to_console)
+
+    def log_notice(self, msg, *args, also_print_to_console=False):
+        self.log(self.LOG_PRIORITY_NOTICE, msg, *args, also_print_to_console=also_print_to_console)
+
+    def log_info(self, msg, *args, also_print_to_console=False):
+        self.log(self.LOG_PRIORITY_INFO, msg, *args, also_print_to_console=also_print_to_console)
+
+    def log_debug(self, msg, *args, also_print_to_console=False):
+        self.log(self.LOG_PRIORITY_DEBUG, msg, *args, also_print_to_console=also_print_to_console)
+
+
+class BmcSession(object):
+    """
+    Process-wide keep-alive HTTPS session to BMC, shared by all PlatCommon
+    instances so that RESTful V1.0 and V2.0 calls reuse pooled connections
+    instead of doing a TCP+TLS handshake per request
+    """
+    _lock = threading.Lock()
+    _session = None
+    _owner_pid = None
+    _requests = 0
+    _inflight = 0
+    _errors = 0
+
+    @classmethod
+    def get_session(cls):
+        """
+        Retrieves the shared session, it is rebuilt after fork because pooled
+        sockets must not be shared between processes
+
+        Returns:
+            requests.Session
+        """
+        with cls._lock:
+            if cls._session is None or cls._owner_pid != os.getpid():
+                # bmc uses a self-signed certificate
+                urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+                session = requests.Session()
+                session.verify = False
+                adapter = requests.adapters.HTTPAdapter(pool_connections=CommonCfg.BMC_POOL_CONNECTIONS,
+                                                        pool_maxsize=CommonCfg.BMC_POOL_MAXSIZE,
+                                                        pool_block=CommonCfg.BMC_POOL_BLOCK)
+                # V1.0 and V2.0 api are both under ROOT_URL
+                session.mount(CommonCfg.ROOT_URL, adapter)
+                cls._session = session
+                cls._owner_pid = os.getpid()
+                cls._requests = 0
+                cls._inflight = 0
+                cls._errors = 0
+            return cls._session
+
+    @classmethod
+    def request(cls, method, url, **kwargs):
+        """
+        Send one request through the shared session
+
+        Args:
+            method: str, 'GET' or 'POST'
+            url: str, url address
+            kwargs: arguments of requests.Session.request
+
+        Returns:
+            requests.Response
+        """
+        session = cls.get_session()
+        with cls._lock:
+            cls._requests += 1
+            cls._inflight += 1
+        try:
+            return session.request(method, url, **kwargs)
+        except Exception:
+            with cls._lock:
+                cls._errors += 1
+            raise
+        finally:
+            with cls._lock:
+                cls._inflight -= 1
+
+    @classmethod
+    def close(cls):
+        """
+        Close all pooled connections
+        """
+        with cls._lock:
+            if cls._session is not None:
+                cls._session.close()
+            cls._session = None
+            cls._owner_pid = None
+
+    @classmethod
+    def get_stats(cls):
+        """
+        Retrieves connection pool statistics
+
+        Returns:
+            dict, eg.
+            {
+                "requests": 120,
+                "new_connections": 2,
+                "pool_hits": 118,
+                "in_flight": 1,
+                "errors": 0
+            }
+        """
+        new_conns = 0
+        pool_requests = 0
+        with cls._lock:
+            stats = {"requests": cls._requests, "in_flight": cls._inflight, "errors": cls._errors}
+            session = cls._session if cls._owner_pid == os.getpid() else None
+        if session is not None:
+            pools = session.get_adapter(CommonCfg.ROOT_URL).poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    new_conns += pool.num_connections
+                    pool_requests += pool.num_requests
+        stats["new_connections"] = new_conns
+        stats["pool_hits"] = max(pool_requests - new_conns, 0)
+        return stats
+
+
+class CircuitBreaker(object):
+    """
+    Circuit breaker state of one BMC endpoint or of the whole BMC
+    """
+    STATE_CLOSED = "closed"
+    STATE_OPEN = "open"
+    STATE_HALF_OPEN = "half-open"
+
+    def __init__(self, name, fail_threshold, open_secs):
+        self.name = name
+        self.fail_threshold = fail_threshold
+        self.open_secs = open_secs
+        self.state = self.STATE_CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0
+        self.counters = {"success": 0, "failure": 0, "rejected": 0, "opened": 0}
+        self._trial_running = False
+
+    def allow(self, now):
+        """
+        Whether a request may be sent now, in half-open state only one
+        trial request is let through
+        """
+        if self.state == self.STATE_OPEN and now - self.opened_at >= self.open_secs:
+            self.state = self.STATE_HALF_OPEN
+            self._trial_running = False
+
+        if self.state == self.STATE_CLOSED:
+            return True
+        if self.state == self.STATE_HALF_OPEN and not self._trial_running:
+            self._trial_running = True
+            return True
+
+        self.counters["rejected"] += 1
+        return False
+
+    def release(self):
+        """
+        Give back a half-open trial whose result does not belong to this breaker
+        """
+        self._trial_running = False
+
+    def record_success(self):
+        self.counters["success"] += 1
+        self.consecutive_failures = 0
+        self.state = self.STATE_CLOSED
+        self._trial_running = False
+
+    def record_failure(self, now):
+        self.counters["failure"] += 1
+        self.consecutive_failures += 1
+        if self.state == self.STATE_HALF_OPEN or \
+            self.consecutive_failures >= self.fail_threshold:
+            if self.state != self.STATE_OPEN:
+                self.counters["opened"] += 1
+            self.state = self.STATE_OPEN
+            self.opened_at = now
+            self._trial_running = False
+
+    def get_stats(self):
+        stats = dict(self.counters)
+        stats["state"] = self.state
+        stats["consecutive_failures"] = self.consecutive_failures
+        return stats
+
+
+class BmcRetryEngine(object):
+    """
+    Retry engine for BMC RESTful requests.
+    A host level breaker opens on transport errors (BMC down or hung) and a
+    per-endpoint breaker opens on bad responses, open breakers make callers
+    fail fast or get the last known value, a background thread probes the
+    BMC until it comes back.
+    """
+    _lock = threading.Lock()
+    _host = CircuitBreaker("bmc", CommonCfg.BREAKER_FAIL_THRESHOLD, CommonCfg.BREAKER_OPEN_SECS)
+    _endpoints = {}
+    _last_values = {}
+    _prober_pid = None
+
+    @classmethod
+    def __get_endpoint(cls, url, cache_key=None):
+        """
+        One breaker per request target: the url plus header when the device
+        index travels in the header, else the url without query
+        """
+        if cache_key is not None:
+            endpoint = cache_key
+            header = dict(cache_key[1]) if isinstance(cache_key[1], tuple) else cache_key[1]
+            name = url if header is None else "{} {}".format(url, header)
+        else:
+            endpoint = name = url.split("?")[0]
+        breaker = cls._endpoints.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(name, CommonCfg.BREAKER_FAIL_THRESHOLD, CommonCfg.BREAKER_OPEN_SECS)
+            cls._endpoints[endpoint] = breaker
+        return breaker
+
+    @classmethod
+    def backoff(cls, attempt):
+        """
+        Exponential backoff with jitter
+
+        Args:
+            attempt: int, 0-based retry attempt
+
+        Returns:
+            float: seconds to wait
+        """
+        delay = min(CommonCfg.RETRY_BACKOFF_MAX, CommonCfg.RETRY_BACKOFF_BASE * (2 ** attempt))
+        return delay / 2 + random.random() * delay / 2
+
+    @classmethod
+    def execute(cls, url, attempt_func, cache_key=None, allow_stale=False):
+        """
+        Run attempt_func with retry, backoff and circuit breaker
+
+        Args:
+            url: str, the endpoint url
+            attempt_func: callable, send one request and return (ok, value),
+                          raise requests.exceptions.RequestException on transport error
+            cache_key: tuple(url, header items), key to remember the last good value and
+                       of the endpoint breaker, None for not remember
+            allow_stale: bool, return the last good value when the request fails
+
+        Returns:
+            tuple(ok, value, stale)
+        """
+        for attempt in range(CommonCfg.RETRY_MAX_CNT):
+            now = time.monotonic()
+            with cls._lock:
+                endpoint = cls.__get_endpoint(url, cache_key)
+                if not cls._host.allow(now):
+                    break
+                if not endpoint.allow(now):
+                    cls._host.release()
+                    break
+
+            try:
+                ok, value = attempt_func()
+            except requests.exceptions.RequestException:
+                with cls._lock:
+                    endpoint.release()
+                    cls._host.record_failure(time.monotonic())
+                    host_open = cls._host.state == CircuitBreaker.STATE_OPEN
+                if host_open:
+                    cls.__start_prober()
+                    break
+            else:
+                with cls._lock:
+                    cls._host.record_success()
+                    if ok:
+                        endpoint.record_success()
+                        if cache_key is not None:
+                            cls._last_values[cache_key] = (value, time.monotonic())
+                        return True, value, False
+                    endpoint.record_failure(time.monotonic())
+                    if endpoint.state == CircuitBreaker.STATE_OPEN:
+                        break
+
+            if attempt + 1 < CommonCfg.RETRY_MAX_CNT:
+                time.sleep(cls.backoff(attempt))
+
+        if allow_stale and cache_key is not None:
+            with cls._lock:
+                last = cls._last_values.get(cache_key)
+            if last is not None and time.monotonic() - last[1] <= CommonCfg.BMC_STALE_MAX_AGE:
+                return False, last[0], True
+
+        return False, None, False
+
+    @classmethod
+    def __start_prober(cls):
+        with cls._lock:
+            if cls._prober_pid == os.getpid():
+                return
+            cls._prober_pid = os.getpid()
+        prober = threading.Thread(target=cls.__probe, name="bmc-prober")
+        prober.daemon = True
+        prober.start()
+
+    @classmethod
+    def __probe(cls):
+        try:
+            while True:
+                time.sleep(CommonCfg.BREAKER_PROBE_INTERVAL)
+                with cls._lock:
+                    if cls._host.state == CircuitBreaker.STATE_CLOSED:
+                        return
+                try:
+                    # any http answer means bmc web service is up again
+                    BmcSession.request("GET", CommonCfg.BMC_RESTFUL_VER_API,
+                                       timeout=CommonCfg.BREAKER_PROBE_TIMEOUT)
+                    with cls._lock:
+                        cls._host.record_success()
+                    return
+                except requests.exceptions.RequestException:
+                    pass
+        finally:
+            with cls._lock:
+                cls._prober_pid = None
+
+    @classmethod
+    def is_bmc_available(cls):
+        """
+        Whether BMC is considered reachable
+
+        Returns:
+            bool: False if host breaker is open or half-open
+        """
+        with cls._lock:
+            return cls._host.state == CircuitBreaker.STATE_CLOSED
+
+    @classmethod
+    def get_stats(cls):
+        """
+        Retrieves breaker states and counters
+
+        Returns:
+            dict, eg.
+            {
+                "bmc": {"state": "closed", "success": 10, "failure": 0, ...},
+                "endpoints": {
+                    "https://240.1.1.1/api/common/psu/presence": {"state": "closed", ...},
+                    "https://240.1.1.1/api/common/psu/info {'psu': '1'}": {"state": "open", ...}
+                }
+            }
+        """
+        with cls._lock:
+            return {
+                "bmc": cls._host.get_stats(),
+                "endpoints": {breaker.name: breaker.get_stats() for breaker in cls._endpoints.values()}
+            }
+
+
+class SensorSnapshot(object):
+    """
+    Process-wide snapshot of SENSOR_ALL_INFO_GET_API. Thermal, Voltage and
+    Current objects read their value and thresholds from it, concurrent
+    callers wait for one in-flight fetch instead of sending their own.
+    A last known value handed out while BMC is unreachable is served but
+    doesn't refresh the snapshot or its timestamp.
+    """
+    _cond = threading.Condition()
+    _fetching = False
+    _generation = 0
+    _last_ok = False
+    _last_stale = False
+    _data = None
+    _index = {}
+    _timestamp = 0
+    _monotonic = 0
 
-    def log_warning(self, msg, also_print_to_console=False):
-        self.log(self.LOG_PRIORITY_WARNING, msg, also_print_to_console)
+    @classmethod
+    def __is_fresh(cls, ttl):
+        return cls._data is not None and time.monotonic() - cls._monotonic < ttl
 
-    def log_notice(self, msg, also_print_to_console=False):
-        self.log(self.LOG_PRIORITY_NOTICE, msg, also_print_to_console)
+    @classmethod
+    def get(cls, fetcher, ttl):
+        """
+        Retrieves the snapshot, refresh it by fetcher if older than ttl
 
-    def log_info(self, msg, also_print_to_console=False):
-        self.log(self.LOG_PRIORITY_INFO, msg, also_print_to_console)
+        Args:
+            fetcher: callable, return tuple(the 'data' of SENSOR_ALL_INFO_GET_API,
+                     True if it is the last known value)
+            ttl: float, max age in second
 
-    def log_debug(self, msg, also_print_to_console=False):
-        self.log(self.LOG_PRIORITY_DEBUG, msg, also_print_to_console)
+        Returns:
+            tuple(data, index): None, None if refresh failed
+        """
+        with cls._cond:
+            if cls.__is_fresh(ttl):
+                return cls._data, cls._index
+            if cls._fetching:
+                # coalesce onto the in-flight request
+                generation = cls._generation
+                while cls._fetching and cls._generation == generation:
+                    cls._cond.wait()
+                if cls._last_ok:
+                    return cls._data, cls._index
+                return None, None
+            cls._fetching = True
+
+        data, stale = None, False
+        try:
+            data, stale = fetcher()
+        finally:
+            with cls._cond:
+                cls._fetching = False
+                cls._generation += 1
+                cls._last_ok = isinstance(data, dict)
+                cls._last_stale = cls._last_ok and stale
+                if cls._last_ok and (not stale or cls._data is None):
+                    index = {}
+                    for sensors in data.values():
+                        if isinstance(sensors, dict):
+                            index.update(sensors)
+                    cls._data = data
+                    cls._index = index
+                    if not stale:
+                        cls._timestamp = time.time()
+                        cls._monotonic = time.monotonic()
+                cls._cond.notify_all()
+
+        if isinstance(data, dict):
+            return cls._data, cls._index
+        return None, None
+
+    @classmethod
+    def is_stale(cls):
+        """
+        Whether the last refresh got the last known value instead of fresh data
+
+        Returns:
+            bool
+        """
+        return cls._last_stale
+
+    @classmethod
+    def get_timestamp(cls):
+        """
+        Retrieves the time of the last successful refresh
+
+        Returns:
+            float: seconds since the epoch, 0 if never refreshed
+        """
+        return cls._timestamp
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Force next reader to refresh the snapshot
+        """
+        with cls._cond:
+            cls._monotonic = 0
+
+
+class JsonFileCache(object):
+    """
+    Per-process cache of parsed platform_cache json files. A document is
+    parsed once and reused while the file's device, inode, size and mtime
+    are unchanged. Returned documents are shared, callers must not modify them.
+    """
+    _lock = threading.Lock()
+    _entries = {}
+    _stats = {}
+    _gave_up = {}
+
+    @classmethod
+    def __get_stats(cls, file_path):
+        stats = cls._stats.get(file_path)
+        if stats is None:
+            stats = {"parses": 0, "hits": 0, "missing": 0, "errors": 0}
+            cls._stats[file_path] = stats
+        return stats
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Retrieves the parsed document of file_path
+
+        Args:
+            file_path: str, full path of json file
+
+        Returns:
+            tuple(data, parsed): data is None if file doesn't exist,
+            parsed is True if the file was parsed by this call
+        """
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            stat = None
+
+        with cls._lock:
+            stats = cls.__get_stats(file_path)
+            entry = cls._entries.get(file_path)
+            if stat is None:
+                # file is being replaced, keep serving the last document for a while
+                if entry is not None and \
+                    time.monotonic() - entry["checked"] < CommonCfg.CACHE_FILE_MISSING_GRACE:
+                    stats["hits"] += 1
+                    return entry["data"], False
+                stats["missing"] += 1
+                return None, False
+            key = (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if entry is not None and entry["key"] == key:
+                entry["checked"] = time.monotonic()
+                stats["hits"] += 1
+                return entry["data"], False
+
+        try:
+            with open(file_path, 'r', encoding="utf-8") as fd:
+                fcntl.flock(fd.fileno(), fcntl.LOCK_SH)
+                stat = os.fstat(fd.fileno())
+                data = json.load(fd)
+        except Exception:
+            with cls._lock:
+                cls.__get_stats(file_path)["errors"] += 1
+            raise
+
+        with cls._lock:
+            cls._entries[file_path] = {
+                "key": (stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns),
+                "data": data,
+                "checked": time.monotonic()
+            }
+            cls.__get_stats(file_path)["parses"] += 1
+            cls._gave_up.pop(file_path, None)
+        return data, True
+
+    @classmethod
+    def should_wait(cls, file_path):
+        """
+        Whether a reader should wait for a missing file to appear, it is
+        skipped for a while after a wait has already timed out
+        """
+        with cls._lock:
+            gave_up = cls._gave_up.get(file_path)
+        return gave_up is None or time.monotonic() - gave_up >= CommonCfg.CACHE_FILE_REWAIT_SECS
+
+    @classmethod
+    def mark_gave_up(cls, file_path):
+        with cls._lock:
+            cls._gave_up[file_path] = time.monotonic()
+
+    @classmethod
+    def get_stats(cls):
+        """
+        Retrieves parse counts and hit ratio of each file
+
+        Returns:
+            dict, eg.
+            {
+                "/var/run/platform_cache/psu_rev.json": {
+                    "parses": 3, "hits": 97, "missing": 0, "errors": 0, "hit_ratio": 0.97
+                }
+            }
+        """
+        result = {}
+        with cls._lock:
+            for file_path, stats in cls._stats.items():
+                item = dict(stats)
+                total = stats["parses"] + stats["hits"]
+                item["hit_ratio"] = round(float(stats["hits"]) / total, 3) if total else 0.0
+                result[file_path] = item
+        return result
+
+
+class TelemetrySnapshot(object):
+    """
+    Fixed-layout, versioned binary snapshot of fan, psu and sensor data in a
+    memory-mapped file, an alternative to the platform_cache json files.
+
+    The writer bumps the generation counter to odd before changing records
+    and back to even afterwards (seqlock), so readers in any process copy a
+    record lock-free and retry if the counter moved meanwhile.
+
+    Layout:
+        header | MAX_SENSORS sensor records | MAX_FANS fan records | MAX_PSUS psu records
+    A reading is 7 doubles (Value, Warning_High, Warning_Low, Critical_High,
+    Critical_Low, Max, Min), NaN for absent; empty string means absent.
+
+    The records only hold the keys of the tables below, which are the keys
+    Psu, Fan, Thermal, Voltage and Current read from the cache. Other keys of
+    the json files (eg. psu 'OutputStatus' at top level) are dropped, numeric
+    strings come back as floats, and "", "NA", "N/A" and -99999 readings as
+    well as empty strings come back absent. Strings are cut to the field size.
+    check() verifies the getters see the same values from both backends.
+
+    The header keeps the mtime of each json file a snapshot was built from,
+    so readers can tell whether the snapshot still holds the current data
+    of a source without parsing it.
+    """
+    MAGIC = b"PLTS"
+    VERSION = 1
+    MAX_SENSORS = 256
+    MAX_FANS = 16
+    MAX_PSUS = 8
+    MAX_ROTORS = 4
+    READ_RETRY = 100
+
+    READING_KEYS = ("Value", "Warning_High", "Warning_Low", "Critical_High", "Critical_Low", "Max", "Min")
+    READING_FMT = "7d"
+    ROTOR_KEYS = ("Speed", "SpeedMax", "SpeedMin")
+    PSU_READINGS = (("Inputs", "Voltage"), ("Inputs", "Current"), ("Inputs", "Power"),
+                    ("Outputs", "Voltage"), ("Outputs", "Current"), ("Outputs", "Power"),
+                    (None, "Temperature"), (None, "FanSpeed"))
+
+    # magic, version, header size, generation, timestamp, sensor/fan/psu count,
+    # sensor/fan/psu source mtime
+    HEADER = struct.Struct("<4sHHQdIIIddd")
+    SOURCE_SLOT = {"sensor": 8, "fan": 9, "psu": 10}
+    GENERATION_OFFSET = 8
+    # name, type, reading
+    SENSOR_REC = struct.Struct("<32s16s" + READING_FMT)
+    # name, present, color, PN, SN, Vendor, AirFlow, pwm, fixup, rotor num, rotors
+    FAN_REC = struct.Struct("<16s?16s32s32s32s8sddB" + "3d" * MAX_ROTORS)
+    # name, present, PN, SN, Vender, FW_Version, HW_Version, AirFlow,
+    # input type, input status, output status, readings
+    PSU_REC = struct.Struct("<16s?32s32s32s16s16s8s8s16s16s" + READING_FMT * len(PSU_READINGS))
+
+    SENSOR_BASE = HEADER.size
+    FAN_BASE = SENSOR_BASE + SENSOR_REC.size * MAX_SENSORS
+    PSU_BASE = FAN_BASE + FAN_REC.size * MAX_FANS
+    FILE_SIZE = PSU_BASE + PSU_REC.size * MAX_PSUS
+
+    # key paths read by the device classes: (path, numeric)
+    SENSOR_CHECK_KEYS = tuple(((key,), True) for key in READING_KEYS[:5])
+    FAN_CHECK_KEYS = ((("Present",), False), (("color",), False), (("PN",), False), (("SN",), False),
+                      (("Vendor",), False), (("AirFlow",), False), (("speed", "pwm"), True),
+                      (("speed", "fixup"), True)) + \
+        tuple((("speed", "Rotor{}".format(index), key), True)
+              for index, key in itertools.product(range(1, MAX_ROTORS + 1), ROTOR_KEYS))
+    PSU_CHECK_KEYS = tuple(((key,), False) for key in ("Present", "PN", "SN", "Vender", "FW_Version",
+                                                        "HW_Version", "AirFlow")) + \
+        ((("Inputs", "Type"), False), (("Inputs", "Status"), False), (("Outputs", "Status"), False)) + \
+        tuple((tuple(part for part in (group, name, key) if part is not None), True)
+              for (group, name), key in itertools.product(PSU_READINGS, READING_KEYS))
+
+    _lock = threading.Lock()
+    _map = None
+    _map_path = None
+    _map_ino = None
+    _map_checked = 0
+    _index_generation = None
+    _index = {}
+
+    ############ encode ############
+    @staticmethod
+    def __str(value, size):
+        if value is None:
+            return b""
+        return str(value).encode("utf-8")[:size]
+
+    @staticmethod
+    def __num(value):
+        try:
+            if value is None or value in ["", "NA", "N/A", -99999, -99999.0]:
+                return float("nan")
+            return float(value)
+        except (TypeError, ValueError):
+            return float("nan")
+
+    @classmethod
+    def __reading(cls, info):
+        if not isinstance(info, dict):
+            info = {}
+        return [cls.__num(info.get(key)) for key in cls.READING_KEYS]
+
+    @classmethod
+    def __pack_sensor(cls, name, sensor_type, info):
+        return cls.SENSOR_REC.pack(cls.__str(name, 32), cls.__str(sensor_type, 16), *cls.__reading(info))
+
+    @classmethod
+    def __pack_fan(cls, name, info):
+        speed = info.get("speed") if isinstance(info.get("speed"), dict) else {}
+        rotors = []
+        for index in range(1, cls.MAX_ROTORS + 1):
+            rotor = speed.get("Rotor{}".format(index))
+            if not isinstance(rotor, dict):
+                rotor = {}
+            rotors.extend([cls.__num(rotor.get(key)) for key in cls.ROTOR_KEYS])
+        rotor_num = len([key for key in speed if str(key).startswith("Rotor")])
+        return cls.FAN_REC.pack(cls.__str(name, 16), info.get("Present") == "yes",
+                                cls.__str(info.get("color"), 16), cls.__str(info.get("PN"), 32),
+                                cls.__str(info.get("SN"), 32), cls.__str(info.get("Vendor"), 32),
+                                cls.__str(info.get("AirFlow"), 8), cls.__num(speed.get("pwm")),
+                                cls.__num(speed.get("fixup")), min(rotor_num, cls.MAX_ROTORS), *rotors)
+
+    @classmethod
+    def __pack_psu(cls, name, info):
+        inputs = info.get("Inputs") if isinstance(info.get("Inputs"), dict) else {}
+        outputs = info.get("Outputs") if isinstance(info.get("Outputs"), dict) else {}
+        readings = []
+        for group, key in cls.PSU_READINGS:
+            parent = info if group is None else info.get(group)
+            readings.extend(cls.__reading(parent.get(key) if isinstance(parent, dict) else None))
+        return cls.PSU_REC.pack(cls.__str(name, 16), info.get("Present") == "yes",
+                                cls.__str(info.get("PN"), 32), cls.__str(info.get("SN"), 32),
+                                cls.__str(info.get("Vender"), 32), cls.__str(info.get("FW_Version"), 16),
+                                cls.__str(info.get("HW_Version"), 16), cls.__str(info.get("AirFlow"), 8),
+                                cls.__str(inputs.get("Type"), 8), cls.__str(inputs.get("Status"), 16),
+                                cls.__str(outputs.get("Status"), 16), *readings)
+
+    @classmethod
+    def write(cls, file_path, sensor_doc, fan_doc, psu_doc, source_mtimes=(0, 0, 0)):
+        """
+        Convert platform_cache json documents into the binary snapshot,
+        only one writer is allowed at a time (flock on the snapshot file)
+
+        Args:
+            file_path: str, snapshot file
+            sensor_doc: dict, content of sensor_rev.json
+            fan_doc: dict, content of fan_rev.json
+            psu_doc: dict, content of psu_rev.json
+            source_mtimes: tuple, mtime of the sensor, fan and psu json files
+                           the documents were read from
+
+        Returns:
+            int: the new generation
+        """
+        sensors = []
+        for sensor_type, values in (sensor_doc or {}).items():
+            if isinstance(values, dict):
+                for name, info in values.items():
+                    sensors.append(cls.__pack_sensor(name, sensor_type, info))
+        fans = [cls.__pack_fan(name, info) for name, info in (fan_doc or {}).items() if isinstance(info, dict)]
+        psus = [cls.__pack_psu(name, info) for name, info in (psu_doc or {}).items() if isinstance(info, dict)]
+        sensors = sensors[:cls.MAX_SENSORS]
+        fans = fans[:cls.MAX_FANS]
+        psus = psus[:cls.MAX_PSUS]
+
+        fd = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            if os.fstat(fd).st_size != cls.FILE_SIZE:
+                os.ftruncate(fd, cls.FILE_SIZE)
+            buf = mmap.mmap(fd, cls.FILE_SIZE)
+            try:
+                old = cls.HEADER.unpack_from(buf, 0)
+                generation = old[3] if old[0] == cls.MAGIC and old[1] == cls.VERSION else 0
+                generation += generation % 2
+                # odd generation: records are being changed
+                struct.pack_into("<Q", buf, cls.GENERATION_OFFSET, generation + 1)
+                for base, rec, records in ((cls.SENSOR_BASE, cls.SENSOR_REC, sensors),
+                                           (cls.FAN_BASE, cls.FAN_REC, fans),
+                                           (cls.PSU_BASE, cls.PSU_REC, psus)):
+                    data = b"".join(records)
+                    buf[base:base + len(data)] = data
+                cls.HEADER.pack_into(buf, 0, cls.MAGIC, cls.VERSION, cls.HEADER.size, generation + 1,
+                                     time.time(), len(sensors), len(fans), len(psus), *source_mtimes)
+                struct.pack_into("<Q", buf, cls.GENERATION_OFFSET, generation + 2)
+            finally:
+                buf.close()
+        finally:
+            os.close(fd)
+        with cls._lock:
+            # a newly created file is mapped on the next read
+            cls._map_checked = 0
+        return generation + 2
+
+    @staticmethod
+    def __lookup(doc, path):
+        for key in path:
+            if not isinstance(doc, dict):
+                return None
+            doc = doc.get(key)
+        return doc
+
+    @classmethod
+    def check(cls, file_path, sensor_doc, fan_doc, psu_doc, normalize):
+        """
+        Compare the records of the snapshot with the json documents it was
+        built from, key by key as the device classes read them
+
+        Args:
+            file_path: str, snapshot file
+            sensor_doc: dict, content of sensor_rev.json
+            fan_doc: dict, content of fan_rev.json
+            psu_doc: dict, content of psu_rev.json
+            normalize: callable(value, numeric), the value a getter makes of a raw value
+
+        Returns:
+            list: str, one line per differing key, empty if both backends agree
+        """
+        records = []
+        for sensor_type, values in (sensor_doc or {}).items():
+            if isinstance(values, dict):
+                records.extend(("sensor", name, info, cls.SENSOR_CHECK_KEYS) for name, info in values.items())
+        records.extend(("fan", name, info, cls.FAN_CHECK_KEYS) for name, info in (fan_doc or {}).items())
+        records.extend(("psu", name, info, cls.PSU_CHECK_KEYS) for name, info in (psu_doc or {}).items())
+
+        mismatches = []
+        for kind, name, info, keys in records:
+            if not isinstance(info, dict):
+                continue
+            record, _ = cls.read_record(file_path, kind, name)
+            if record is None:
+                mismatches.append("{} {}: not in snapshot".format(kind, name))
+                continue
+            for path, numeric in keys:
+                expected = normalize(cls.__lookup(info, path), numeric)
+                actual = normalize(cls.__lookup(record, path), numeric)
+                if expected != actual:
+                    mismatches.append("{} {} {}: json {!r} snapshot {!r}".format(kind, name, "/".join(path),
+                                                                                expected, actual))
+        return mismatches
+
+    ############ decode ############
+    @staticmethod
+    def __text(raw):
+        return raw.rstrip(b"\x00").decode("utf-8", "replace")
+
+    @classmethod
+    def __dict_reading(cls, values):
+        return {key: value for key, value in zip(cls.READING_KEYS, values) if not math.isnan(value)}
+
+    @classmethod
+    def __unpack_sensor(cls, raw):
+        fields = cls.SENSOR_REC.unpack(raw)
+        return cls.__dict_reading(fields[2:])
+
+    @classmethod
+    def __unpack_fan(cls, raw):
+        fields = cls.FAN_REC.unpack(raw)
+        info = {"Present": "yes" if fields[1] else "no"}
+        for key, value in (("color", fields[2]), ("PN", fields[3]), ("SN", fields[4]),
+                           ("Vendor", fields[5]), ("AirFlow", fields[6])):
+            if value.rstrip(b"\x00"):
+                info[key] = cls.__text(value)
+        speed = {}
+        for key, value in (("pwm", fields[7]), ("fixup", fields[8])):
+            if not math.isnan(value):
+                speed[key] = value
+        rotors = fields[10:]
+        for index in range(fields[9]):
+            values = rotors[index * 3:index * 3 + 3]
+            speed["Rotor{}".format(index + 1)] = {key: value for key, value in zip(cls.ROTOR_KEYS, values)
+                                                  if not math.isnan(value)}
+        info["speed"] = speed
+        return info
+
+    @classmethod
+    def __unpack_psu(cls, raw):
+        fields = cls.PSU_REC.unpack(raw)
+        info = {"Present": "yes" if fields[1] else "no", "Inputs": {}, "Outputs": {}}
+        for key, value in (("PN", fields[2]), ("SN", fields[3]), ("Vender", fields[4]),
+                           ("FW_Version", fields[5]), ("HW_Version", fields[6]), ("AirFlow", fields[7])):
+            if value.rstrip(b"\x00"):
+                info[key] = cls.__text(value)
+        for group, key, value in (("Inputs", "Type", fields[8]), ("Inputs", "Status", fields[9]),
+                                  ("Outputs", "Status", fields[10])):
+            if value.rstrip(b"\x00"):
+                info[group][key] = cls.__text(value)
+        readings = fields[11:]
+        for index, (group, key) in enumerate(cls.PSU_READINGS):
+            reading = cls.__dict_reading(readings[index * 7:index * 7 + 7])
+            if group is None:
+                info[key] = reading
+            else:
+                info[group][key] = reading
+        return info
+
+    @classmethod
+    def __get_map(cls, file_path):
+        now = time.monotonic()
+        if cls._map is not None and cls._map_path == file_path and now - cls._map_checked < 1:
+            return cls._map
+        cls._map_checked = now
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
+            cls.__close_map()
+            return None
+        if cls._map is not None and cls._map_ino == (stat.st_dev, stat.st_ino):
+            return cls._map
+        cls.__close_map()
+        if stat.st_size != cls.FILE_SIZE:
+            return None
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            cls._map = mmap.mmap(fd, cls.FILE_SIZE, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        cls._map_ino = (stat.st_dev, stat.st_ino)
+        cls._map_path = file_path
+        cls._index_generation = None
+        return cls._map
+
+    @classmethod
+    def __close_map(cls):
+        if cls._map is not None:
+            cls._map.close()
+        cls._map = None
+        cls._map_ino = None
+        cls._index_generation = None
+
+    @classmethod
+    def __build_index(cls, buf, header):
+        index = {}
+        for kind, base, rec, num, capacity in (
+                ("sensor", cls.SENSOR_BASE, cls.SENSOR_REC, header[5], cls.MAX_SENSORS),
+                ("fan", cls.FAN_BASE, cls.FAN_REC, header[6], cls.MAX_FANS),
+                ("psu", cls.PSU_BASE, cls.PSU_REC, header[7], cls.MAX_PSUS)):
+            name_size = 32 if kind == "sensor" else 16
+            for slot in range(min(num, capacity)):
+                offset = base + rec.size * slot
+                index[(kind, cls.__text(buf[offset:offset + name_size]))] = offset
+        return index
+
+    @classmethod
+    def read_record(cls, file_path, kind, name):
+        """
+        Read one record consistently without locks
+
+        Args:
+            file_path: str, snapshot file
+            kind: str, 'sensor', 'fan' or 'psu'
+            name: str, eg. 'fan1', 'psu2', 'BB_P3V3_STBY_V'
+
+        Returns:
+            tuple(info, source_mtime): info is a dict in the same format as the
+            json cache, None if record or snapshot not found; source_mtime is
+            the mtime of the json file the record was built from
+        """
+        rec, unpack = {"sensor": (cls.SENSOR_REC, cls.__unpack_sensor),
+                       "fan": (cls.FAN_REC, cls.__unpack_fan),
+                       "psu": (cls.PSU_REC, cls.__unpack_psu)}[kind]
+        with cls._lock:
+            buf = cls.__get_map(file_path)
+            if buf is None:
+                return None, 0
+            for _ in range(cls.READ_RETRY):
+                header = cls.HEADER.unpack_from(buf, 0)
+                generation = header[3]
+                if header[0] != cls.MAGIC or header[1] != cls.VERSION:
+                    return None, 0
+                if generation % 2:
+                    time.sleep(0)
+                    continue
+                if cls._index_generation != generation:
+                    cls._index = cls.__build_index(buf, header)
+                    cls._index_generation = generation
+                offset = cls._index.get((kind, name))
+                raw = buf[offset:offset + rec.size] if offset is not None else None
+                if struct.unpack_from("<Q", buf, cls.GENERATION_OFFSET)[0] != generation:
+                    continue
+                if raw is None:
+                    return None, header[cls.SOURCE_SLOT[kind]]
+                return unpack(raw), header[cls.SOURCE_SLOT[kind]]
+        return None, 0
+
+
+class SysfsReader(object):
+    """
+    Per-process reader of sysfs attributes. Resolved real paths are cached,
+    and files under /sys keep an open descriptor that is re-read with pread
+    at offset 0, which makes the kernel call the attribute's show() again.
+    A descriptor is dropped and reopened once when the device was removed
+    (ENODEV/ESTALE/ENXIO) or the attribute went away.
+    """
+    SYSFS_PREFIX = "/sys/"
+    READ_SIZE = 4096
+    REOPEN_ERRNO = (errno.ENODEV, errno.ESTALE, errno.ENXIO, errno.EBADF, errno.ENOENT)
+
+    _lock = threading.Lock()
+    _owner_pid = None
+    _realpaths = {}
+    # real path -> [fd, users, closed]
+    _fds = collections.OrderedDict()
+    _stats = {"reads": 0, "opens": 0, "reopens": 0, "evictions": 0, "writes": 0}
+
+    @classmethod
+    def __check_owner(cls):
+        # descriptors of the parent process are not shared after fork
+        if cls._owner_pid != os.getpid():
+            for entry in cls._fds.values():
+                try:
+                    os.close(entry[0])
+                except OSError:
+                    pass
+            cls._fds.clear()
+            cls._realpaths.clear()
+            cls._owner_pid = os.getpid()
+
+    @classmethod
+    def __resolve(cls, file_path):
+        real_path = cls._realpaths.get(file_path)
+        if real_path is None:
+            real_path = os.path.realpath(file_path)
+            cls._realpaths[file_path] = real_path
+        return real_path
+
+    @classmethod
+    def __close_entry(cls, real_path):
+        entry = cls._fds.pop(real_path, None)
+        if entry is not None:
+            entry[2] = True
+            if entry[1] == 0:
+                os.close(entry[0])
+
+    @classmethod
+    def __forget(cls, file_path):
+        with cls._lock:
+            real_path = cls._realpaths.pop(file_path, None)
+            if real_path is not None:
+                cls.__close_entry(real_path)
+
+    @classmethod
+    def __acquire(cls, file_path):
+        """
+        Returns:
+            tuple(real_path, entry): entry is None if file isn't kept open
+        """
+        with cls._lock:
+            cls.__check_owner()
+            real_path = cls.__resolve(file_path)
+            if not real_path.startswith(cls.SYSFS_PREFIX):
+                return real_path, None
+            entry = cls._fds.get(real_path)
+            if entry is None:
+                entry = [os.open(real_path, os.O_RDONLY | os.O_CLOEXEC), 0, False]
+                cls._stats["opens"] += 1
+                cls._fds[real_path] = entry
+                while len(cls._fds) > CommonCfg.SYSFS_MAX_OPEN_FDS:
+                    old_path = next(iter(cls._fds))
+                    cls.__close_entry(old_path)
+                    cls._stats["evictions"] += 1
+            else:
+                cls._fds.move_to_end(real_path)
+            entry[1] += 1
+            cls._stats["reads"] += 1
+            return real_path, entry
+
+    @classmethod
+    def __release(cls, entry):
+        with cls._lock:
+            entry[1] -= 1
+            if entry[2] and entry[1] == 0:
+                os.close(entry[0])
+
+    @classmethod
+    def __read_once(cls, file_path):
+        real_path, entry = cls.__acquire(file_path)
+        if entry is None:
+            with open(real_path, 'rb') as filed:
+                return filed.read()
+        try:
+            chunks = []
+            offset = 0
+            while True:
+                chunk = os.pread(entry[0], cls.READ_SIZE, offset)
+                chunks.append(chunk)
+                offset += len(chunk)
+                if len(chunk) < cls.READ_SIZE:
+                    break
+            return b"".join(chunks)
+        finally:
+            cls.__release(entry)
+
+    @classmethod
+    def read(cls, file_path):
+        """
+        Read a sysfs attribute
+
+        Args:
+            file_path: str, full path of sysfs file
+
+        Returns:
+            str: stripped content, None if file doesn't exist
+
+        Raises:
+            OSError for other read errors
+        """
+        for retry in range(2):
+            try:
+                return cls.__read_once(file_path).decode("utf-8").strip()
+            except FileNotFoundError:
+                cls.__forget(file_path)
+                if retry == 0 and os.path.exists(file_path):
+                    continue
+                return None
+            except OSError as error:
+                if error.errno not in cls.REOPEN_ERRNO or retry > 0:
+                    raise
+                cls.__forget(file_path)
+                with cls._lock:
+                    cls._stats["reopens"] += 1
+        return None
+
+    @classmethod
+    def write(cls, file_path, value):
+        """
+        Write a sysfs attribute, uses the cached real path
+
+        Args:
+            file_path: str, full path of sysfs file
+            value: int, float or str
+
+        Returns:
+            boolean: False if file doesn't exist
+
+        Raises:
+            OSError for other write errors
+        """
+        with cls._lock:
+            cls.__check_owner()
+            real_path = cls.__resolve(file_path)
+            cls._stats["writes"] += 1
+        try:
+            # no O_CREAT: a missing attribute must not turn into a new file
+            fd = os.open(real_path, os.O_WRONLY | os.O_TRUNC | os.O_CLOEXEC)
+        except FileNotFoundError:
+            cls.__forget(file_path)
+            return False
+        try:
+            os.write(fd, str(value).encode("utf-8"))
+        finally:
+            os.close(fd)
+        return True
+
+    @classmethod
+    def get_real_path(cls, file_path):
+        """
+        Retrieves the cached real path of file_path
+
+        Args:
+            file_path: str, full path of sysfs file
+
+        Returns:
+            str: real path
+        """
+        with cls._lock:
+            cls.__check_owner()
+            return cls.__resolve(file_path)
+
+    @classmethod
+    def invalidate(cls, file_path=None):
+        """
+        Drop the cached path and descriptor of file_path, or all of them
+
+        Args:
+            file_path: str, None for all
+        """
+        if file_path is not None:
+            cls.__forget(file_path)
+            return
+        with cls._lock:
+            for real_path in list(cls._fds.keys()):
+                cls.__close_entry(real_path)
+            cls._realpaths.clear()
+
+    @classmethod
+    def get_stats(cls):
+        """
+        Retrieves reader counters
+
+        Returns:
+            dict: reads, opens, reopens, evictions, writes and open fds
+        """
+        with cls._lock:
+            stats = dict(cls._stats)
+            stats["open_fds"] = len(cls._fds)
+        return stats
+
+
+class SampleHistory(object):
+    """
+    Fixed-depth history of timestamped sensor readings. Values and
+    timestamps live in two array('d') rings, the minimum and maximum are
+    kept in monotonic deques and the sum is kept running, so add, min, max
+    and average are O(1). Percentiles sort a copy of the window.
+    """
+
+    def __init__(self, depth=None):
+        """
+        Args:
+            depth: int, samples kept, default CommonCfg.SENSOR_HISTORY_DEPTH
+        """
+        if depth is None:
+            depth = CommonCfg.SENSOR_HISTORY_DEPTH
+        self.depth = max(1, int(depth))
+        self.values = array.array("d", [0.0]) * self.depth
+        self.timestamps = array.array("d", [0.0]) * self.depth
+        # number of samples ever added, the next one goes to slot count % depth
+        self.count = 0
+        self.total = 0.0
+        # (sequence, value), values increasing in min_queue and decreasing in max_queue
+        self.min_queue = collections.deque()
+        self.max_queue = collections.deque()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.count, self.depth)
+
+    def add(self, value, timestamp=None):
+        """
+        Record a reading, None and non-numbers are ignored
+
+        Args:
+            value: int or float
+            timestamp: float, time.time() of the reading, default now
+        """
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or math.isnan(value):
+            return
+        value = float(value)
+        with self.lock:
+            seq = self.count
+            slot = seq % self.depth
+            if seq >= self.depth:
+                self.total -= self.values[slot]
+            self.values[slot] = value
+            self.timestamps[slot] = time.time() if timestamp is None else timestamp
+            self.total += value
+            self.count += 1
+            if slot == self.depth - 1:
+                # the window is full here, drop the rounding error of the running sum
+                self.total = math.fsum(self.values)
+
+            oldest = self.count - self.depth
+            while self.min_queue and self.min_queue[-1][1] >= value:
+                self.min_queue.pop()
+            self.min_queue.append((seq, value))
+            while self.min_queue[0][0] < oldest:
+                self.min_queue.popleft()
+            while self.max_queue and self.max_queue[-1][1] <= value:
+                self.max_queue.pop()
+            self.max_queue.append((seq, value))
+            while self.max_queue[0][0] < oldest:
+                self.max_queue.popleft()
+
+    def clear(self):
+        """
+        Drop all readings
+        """
+        with self.lock:
+            self.count = 0
+            self.total = 0.0
+            self.min_queue.clear()
+            self.max_queue.clear()
+
+    def get_min(self):
+        """
+        Returns:
+            float: the minimum reading kept, None if empty
+        """
+        with self.lock:
+            return self.min_queue[0][1] if self.min_queue else None
+
+    def get_max(self):
+        """
+        Returns:
+            float: the maximum reading kept, None if empty
+        """
+        with self.lock:
+            return self.max_queue[0][1] if self.max_queue else None
+
+    def get_average(self):
+        """
+        Returns:
+            float: the average of the readings kept, None if empty
+        """
+        with self.lock:
+            size = min(self.count, self.depth)
+            return self.total / size if size else None
+
+    def get_last(self):
+        """
+        Returns:
+            tuple(timestamp, value) of the latest reading, None if empty
+        """
+        with self.lock:
+            if not self.count:
+                return None
+            slot = (self.count - 1) % self.depth
+            return self.timestamps[slot], self.values[slot]
+
+    def get_samples(self):
+        """
+        Returns:
+            list: [(timestamp, value)] oldest first
+        """
+        with self.lock:
+            if self.count <= self.depth:
+                slots = range(self.count)
+            else:
+                start = self.count % self.depth
+                slots = list(range(start, self.depth)) + list(range(start))
+            return [(self.timestamps[slot], self.values[slot]) for slot in slots]
+
+    @staticmethod
+    def __percentile(ordered, percent):
+        position = (len(ordered) - 1) * min(100.0, max(0.0, percent)) / 100.0
+        low = int(position)
+        high = min(low + 1, len(ordered) - 1)
+        return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    def get_percentile(self, percent):
+        """
+        Retrieves a percentile of the readings kept, interpolated linearly
+
+        Args:
+            percent: float, 0-100, eg. 95
+
+        Returns:
+            float: None if empty
+        """
+        with self.lock:
+            ordered = sorted(self.values[:min(self.count, self.depth)])
+        return self.__percentile(ordered, percent) if ordered else None
+
+    def get_stats(self, percentiles=(50, 95, 99)):
+        """
+        Retrieves a summary of the readings kept
+
+        Args:
+            percentiles: tuple of float, 0-100
+
+        Returns:
+            dict: {"count", "min", "max", "average", "last", "since", "p<N>" for
+                  every percentile}, values None if empty
+        """
+        with self.lock:
+            size = min(self.count, self.depth)
+            ordered = sorted(self.values[:size])
+            stats = {"count": size, "min": None, "max": None, "average": None, "last": None, "since": None}
+            if size:
+                stats["min"] = self.min_queue[0][1]
+                stats["max"] = self.max_queue[0][1]
+                stats["average"] = self.total / size
+                stats["last"] = self.values[(self.count - 1) % self.depth]
+                stats["since"] = self.timestamps[self.count % self.depth if self.count > self.depth else 0]
+        for percent in percentiles:
+            stats["p{:g}".format(percent)] = self.__percentile(ordered, percent) if ordered else None
+        return stats
+
+
+class RecordedReadings(object):
+    """
+    Mixin of the device classes keeping their readings in a SampleHistory
+    per reading, eg. Thermal 'temperature' or Psu 'power'. RECORDED_READINGS
+    lists the readings, the first one is the default of the getters below.
+    """
+    RECORDED_READINGS = ()
+
+    def __get_history(self, reading):
+        histories = self.__dict__.get("_recorded_readings")
+        if histories is None:
+            histories = self.__dict__.setdefault("_recorded_readings", {})
+        history = histories.get(reading)
+        if history is None:
+            history = histories.setdefault(reading, SampleHistory())
+        return history
+
+    def record_reading(self, reading, value):
+        """
+        Record a reading, None and non-numbers are ignored
+
+        Args:
+            reading: str, one of RECORDED_READINGS
+            value: int or float
+        """
+        self.__get_history(reading).add(value)
+
+    def get_minimum_recorded(self, reading=None):
+        """
+        Retrieves the minimum recorded value, the current one if nothing
+        was recorded yet
+
+        Args:
+            reading: str, one of RECORDED_READINGS, default the first
+
+        Returns:
+            A float number in the unit of the reading, eg. Celsius for temperature
+        """
+        reading = reading or self.RECORDED_READINGS[0]
+        history = self.__get_history(reading)
+        if len(history) == 0:
+            return getattr(self, "get_" + reading)()
+        return history.get_min()
+
+    def get_maximum_recorded(self, reading=None):
+        """
+        Retrieves the maximum recorded value, the current one if nothing
+        was recorded yet
+
+        Args:
+            reading: str, one of RECORDED_READINGS, default the first
+
+        Returns:
+            A float number in the unit of the reading, eg. Celsius for temperature
+        """
+        reading = reading or self.RECORDED_READINGS[0]
+        history = self.__get_history(reading)
+        if len(history) == 0:
+            return getattr(self, "get_" + reading)()
+        return history.get_max()
+
+    def get_recorded_stats(self, reading=None, percentiles=(50, 95, 99)):
+        """
+        Retrieves a summary of the recorded values
+
+        Args:
+            reading: str, one of RECORDED_READINGS, default the first
+            percentiles: tuple of float, 0-100
+
+        Returns:
+            dict: {"count", "min", "max", "average", "last", "since", "p<N>"},
+                  see SampleHistory.get_stats
+        """
+        return self.__get_history(reading or self.RECORDED_READINGS[0]).get_stats(percentiles)
+
+
+class ReadMemo(object):
+    """
+    Values of sysfs files and BMC GET requests read during one pass, eg.
+    Chassis.get_platform_snapshot. Getters of different devices reading
+    the same source share one read, concurrent readers of a source that
+    is being read wait for that read instead of starting another one.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values = {}
+        self.inflight = {}
+        self.stats = {"reads": 0, "hits": 0}
+
+    def get_or_load(self, key, loader):
+        """
+        Retrieves the value of key, loaded by loader() on first use
+
+        Args:
+            key: hashable, eg. ("file", path)
+            loader: callable, reads the source
+
+        Returns:
+            value returned by loader, None if the loading reader failed
+        """
+        with self.lock:
+            if key in self.values:
+                self.stats["hits"] += 1
+                return self.values[key]
+            event = self.inflight.get(key)
+            owner = event is None
+            if owner:
+                event = threading.Event()
+                self.inflight[key] = event
+                self.stats["reads"] += 1
+            else:
+                self.stats["hits"] += 1
+        if not owner:
+            event.wait()
+            with self.lock:
+                return self.values.get(key)
+
+        value = None
+        try:
+            value = loader()
+        finally:
+            with self.lock:
+                self.values[key] = value
+                self.inflight.pop(key, None)
+            event.set()
+        return value
+
+    def get_stats(self):
+        """
+        Returns:
+            dict: reads, hits
+        """
+        with self.lock:
+            return dict(self.stats)
 
 
 class PlatCommon(Logger):
+    I2C_BUS_PATTERN = re.compile(r"/i2c-(\d+)/|/(\d+)-[0-9a-fA-F]{4}/")
+    _batch_lock = threading.Lock()
+    _batch_pool = None
+    _batch_pool_pid = None
+    # ReadMemo of the pass the current thread works for
+    _memo_local = threading.local()
+
     SENSOR_CACHE_FILE = "/var/run/platform_cache/sensor_rev.json"
     PSU_CACHE_FILE = "/var/run/platform_cache/psu_rev.json"
     FAN_CACHE_FILE = "/var/run/platform_cache/fan_rev.json"
+    TELEMETRY_SNAPSHOT_FILE = "/var/run/platform_cache/telemetry.bin"
 
     def __init__(self, debug=False):
         Logger.__init__(self)
+        # staleness of the last RESTful read of this object, per thread
+        self._stale_local = threading.local()
 
         if debug is True:
             self.set_min_log_priority_info()
 
+    def is_stale(self):
+        """ Whether the last RESTful read of this object in the calling thread
+        returned the last known value because BMC was unreachable
+
+        Returns:
+            Boolean: True for stale
+        """
+        return getattr(self._stale_local, "stale", False)
+
     def is_float(self, val):
         """ Verify value type is float or not
 
@@ -335,6 +2034,23 @@ class PlatCommon(Logger):
             return False
         return True
 
+    def run_with_memo(self, memo, func, *args):
+        """ Call func in this thread with sysfs and BMC GET reads shared
+        through memo
+
+        Args:
+            memo: ReadMemo object
+            func: callable
+
+        Returns:
+            return value of func
+        """
+        PlatCommon._memo_local.memo = memo
+        try:
+            return func(*args)
+        finally:
+            PlatCommon._memo_local.memo = None
+
     def read_file(self, file_path):
         """ Read file
 
@@ -344,17 +2060,19 @@ class PlatCommon(Logger):
         Returns:
             String: return file content
         """
-        try:
-            if not os.path.exists(file_path):
-                return None
+        memo = getattr(PlatCommon._memo_local, "memo", None)
+        if memo is not None:
+            return memo.get_or_load(("file", file_path), lambda: self.__read_file(file_path))
+        return self.__read_file(file_path)
 
-            with open(file_path, 'r', encoding="utf-8") as filed:
-                data = filed.read().strip()
+    def __read_file(self, file_path):
+        try:
+            data = SysfsReader.read(file_path)
         except IOError as error:
             self.log_error("read {} error:{}".format(file_path, str(error)))
             data = None
 
-        self.log_info("read {} content={}.".format(file_path, data))
+        self.log_info("read {} content={}.", file_path, data)
         return data
 
     def write_file(self, file_path, value):
@@ -368,42 +2086,175 @@ class PlatCommon(Logger):
             Boolean: True if write file successfully, False if not
         """
         try:
-            if not os.path.exists(file_path) or value is None:
+            if value is None:
                 return False
 
-            with open(file_path, 'w', encoding="utf-8") as filed:
-                filed.write(str(value))
+            if not SysfsReader.write(file_path, value):
+                return False
         except IOError as error:
             self.log_error("write {} failed:{}".format(file_path, str(error)))
             return False
 
         return True
 
-    def request_get(self, url, header=None, timeout=120):
+    def __get_bus_key(self, file_path):
+        """
+        Group key of the device behind file_path, i2c bus number if the
+        real path shows it, otherwise the S3IP subsystem, eg. 'cpld'
+        """
+        real_path = SysfsReader.get_real_path(file_path)
+        match = self.I2C_BUS_PATTERN.search(real_path)
+        if match:
+            return "i2c-{}".format(match.group(1) or match.group(2))
+        if file_path.startswith(CommonCfg.S3IP_ROOT_DIR + "/"):
+            return file_path[len(CommonCfg.S3IP_ROOT_DIR) + 1:].split("/")[0]
+        return "other"
+
+    def __read_group(self, paths):
+        values = {}
+        latencies = {}
+        for file_path in paths:
+            start = time.monotonic()
+            values[file_path] = self.read_file(file_path)
+            latencies[file_path] = time.monotonic() - start
+        return values, latencies
+
+    @classmethod
+    def __get_batch_pool(cls):
+        with cls._batch_lock:
+            if cls._batch_pool is None or cls._batch_pool_pid != os.getpid():
+                cls._batch_pool = futures.ThreadPoolExecutor(
+                    max_workers=CommonCfg.BATCH_READ_MAX_WORKERS,
+                    thread_name_prefix="sysfs-batch")
+                cls._batch_pool_pid = os.getpid()
+            return cls._batch_pool
+
+    def read_files(self, paths):
+        """ Read many sysfs files in one call. Files behind the same bus are
+        read in sequence, different buses are read in parallel
+
+        Args:
+            paths: list of str, full path of sysfs files
+
+        Returns:
+            tuple(values, latencies): dict of path to content (None for Fail),
+            dict of path to read time in seconds
+        """
+        groups = {}
+        for file_path in paths:
+            try:
+                key = self.__get_bus_key(file_path)
+            except Exception:
+                key = "other"
+            groups.setdefault(key, [])
+            if file_path not in groups[key]:
+                groups[key].append(file_path)
+
+        values = {}
+        latencies = {}
+        group_list = list(groups.values())
+        if len(group_list) <= 1:
+            for group in group_list:
+                values, latencies = self.__read_group(group)
+            return values, latencies
+
+        pool = self.__get_batch_pool()
+        pending = [pool.submit(self.__read_group, group) for group in group_list[1:]]
+        # the caller reads one group itself instead of waiting idle
+        group_values, group_latencies = self.__read_group(group_list[0])
+        values.update(group_values)
+        latencies.update(group_latencies)
+        for future, group in zip(pending, group_list[1:]):
+            try:
+                group_values, group_latencies = future.result()
+                values.update(group_values)
+                latencies.update(group_latencies)
+            except Exception as error:
+                self.log_error("batch read {} error:{}".format(group, str(error)))
+                for file_path in group:
+                    values[file_path] = None
+        return values, latencies
+
+    def read_files_typed(self, paths, value_type=int):
+        """ Read many sysfs files in one call and convert the contents
+
+        Args:
+            paths: list of str, full path of sysfs files
+            value_type: int or float
+
+        Returns:
+            tuple(values, latencies): dict of path to value, None if the content
+            is invalid or not a number, dict of path to read time in seconds
+        """
+        raw_values, latencies = self.read_files(paths)
+        values = {}
+        for file_path, value in raw_values.items():
+            values[file_path] = None
+            if not self.is_valid_value(value):
+                continue
+            try:
+                if value_type is float and not self.is_float(value):
+                    continue
+                values[file_path] = value_type(value)
+            except (TypeError, ValueError):
+                pass
+        return values, latencies
+
+    def request_get(self, url, header=None, timeout=None, allow_stale=False):
         """ Call restful get interface and parse the return results (RESTful V2.0)
 
         Args:
             url: str, url address
             header: dict-str
-            timeout: int
+            timeout: int, default CommonCfg.BMC_GET_TIMEOUT
+            allow_stale: bool, return the last known value if BMC is unreachable
 
         Returns:
             dict
         """
-        for _ in range(CommonCfg.RETRY_MAX_CNT):
+        data, _ = self.request_get_with_status(url, header, timeout, allow_stale)
+        return data
+
+    def request_get_with_status(self, url, header=None, timeout=None, allow_stale=True):
+        """ Call restful get interface, report whether the result is stale (RESTful V2.0)
+
+        Args:
+            url: str, url address
+            header: dict-str
+            timeout: int, default CommonCfg.BMC_GET_TIMEOUT
+            allow_stale: bool, return the last known value if BMC is unreachable
+
+        Returns:
+            dict: None for Fail
+            Boolean: True if the data is the last known value instead of a fresh one
+        """
+        if timeout is None:
+            timeout = CommonCfg.BMC_GET_TIMEOUT
+
+        def attempt():
             try:
-                response = requests.get(url, headers=header, timeout=timeout, verify=False)
-                self.log_info("request {}, header={}, response={}&{}".format(url,
-                                                                              header,
-                                                                              response.status_code,
-                                                                              response.text))
+                response = BmcSession.request("GET", url, headers=header, timeout=timeout)
+                self.log_info("request {}, header={}, response={}&{}", url, header,
+                              response.status_code, response.text)
                 if response.status_code == 200 and self.is_response_success(response.text):
-                    return json.loads(response.text).get('data')
+                    return True, json.loads(response.text).get('data')
+            except requests.exceptions.RequestException as error:
+                self.log_notice("request {} get:{}".format(url, str(error)))
+                raise
             except Exception as error:
                 self.log_notice("request {} get:{}".format(url, str(error)))
-            time.sleep(CommonCfg.RETRY_INTERVAL_BASE + random.random())
-
-        return None
+            return False, None
+
+        cache_key = (url, tuple(sorted(header.items())) if isinstance(header, dict) else header)
+        memo = getattr(PlatCommon._memo_local, "memo", None)
+        if memo is not None:
+            result = memo.get_or_load(("get", cache_key, allow_stale),
+                                      lambda: BmcRetryEngine.execute(url, attempt, cache_key, allow_stale)[1:])
+            data, stale = result if result is not None else (None, False)
+        else:
+            _, data, stale = BmcRetryEngine.execute(url, attempt, cache_key, allow_stale)
+        self._stale_local.stale = stale
+        return data, stale
 
     def request_post(self, url, header, data, new_restful=True, timeout=None, resp_required=True):
         """ Call restful post interface and parse the return results
@@ -420,14 +2271,11 @@ class PlatCommon(Logger):
             Boolean: return True if response is ok, False if not
             obj: response text
         """
-        for _ in range(CommonCfg.RETRY_MAX_CNT):
+        def attempt():
             try:
-                response = requests.post(url, headers=header, data=data, timeout=timeout, verify=False)
-                self.log_info("request {}, header={}, data={}, response={}&{}".format(url,
-                                                                                       header,
-                                                                                       data,
-                                                                                       response.status_code,
-                                                                                       response.text))
+                response = BmcSession.request("POST", url, headers=header, data=data, timeout=timeout)
+                self.log_info("request {}, header={}, data={}, response={}&{}", url, header, data,
+                              response.status_code, response.text)
                 if not resp_required:
                     return True, None
                 if response.status_code == 200 and self.is_response_success(response.text):
@@ -435,11 +2283,39 @@ class PlatCommon(Logger):
                         return True, json.loads(response.text).get('data')
                     else:
                         return True, json.loads(response.text).get('description')
+            except requests.exceptions.RequestException as error:
+                self.log_notice("request {} get:{}".format(url, str(error)))
+                raise
             except Exception as error:
                 self.log_notice("request {} get:{}".format(url, str(error)))
-            time.sleep(CommonCfg.RETRY_INTERVAL_BASE + random.random())
+            return False, None
+
+        ret, output, _ = BmcRetryEngine.execute(url, attempt)
+        return ret, output
+
+    def get_bmc_session_stats(self):
+        """ Retrieves statistics of the shared BMC connection pool
+
+        Returns:
+            dict: see BmcSession.get_stats
+        """
+        return BmcSession.get_stats()
+
+    def get_bmc_breaker_stats(self):
+        """ Retrieves circuit breaker states and counters of BMC requests
 
-        return False, None
+        Returns:
+            dict: see BmcRetryEngine.get_stats
+        """
+        return BmcRetryEngine.get_stats()
+
+    def is_bmc_available(self):
+        """ Whether BMC RESTful service is considered reachable
+
+        Returns:
+            Boolean: False if BMC is known to be down and values may be stale
+        """
+        return BmcRetryEngine.is_bmc_available()
 
     def is_response_success(self, ret_val):
         """ Check whether a restful communication is successful
@@ -472,7 +2348,7 @@ class PlatCommon(Logger):
             proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
             out, err = proc.communicate()
             proc.wait()
-            self.log_info("execute {} return code={}, out={}, err={}".format(cmd, proc.returncode, out, err))
+            self.log_info("execute {} return code={}, out={}, err={}", cmd, proc.returncode, out, err)
             return proc.returncode, bytes.decode(out).strip()
         except Exception as error:
             self.log_error("execute {} error:{}".format(cmd, str(error)))
@@ -517,6 +2393,42 @@ class PlatCommon(Logger):
         """
         return device_info.get_platform()
 
+    def get_sensor_snapshot(self, ttl=None):
+        """ Get all sensors status from the shared snapshot (RESTful V2.0)
+
+        Args:
+            ttl: float, max age of snapshot in second, default CommonCfg.SENSOR_SNAPSHOT_TTL
+
+        Returns:
+            dict: None for Fail, same format as SENSOR_ALL_INFO_GET_API data
+        """
+        if ttl is None:
+            ttl = CommonCfg.SENSOR_SNAPSHOT_TTL
+        data, _ = SensorSnapshot.get(self.__fetch_all_sensor_info, ttl)
+        self._stale_local.stale = SensorSnapshot.is_stale()
+        return data
+
+    def get_sensor_snapshot_timestamp(self):
+        """ Get the refresh time of the sensor snapshot, a last known value
+        served while BMC is unreachable doesn't move it
+
+        Returns:
+            float: seconds since the epoch, 0 if never refreshed
+        """
+        return SensorSnapshot.get_timestamp()
+
+    def is_sensor_snapshot_stale(self):
+        """ Whether the sensor snapshot could not be refreshed from BMC and
+        its last known value is served
+
+        Returns:
+            Boolean: True for stale
+        """
+        return SensorSnapshot.is_stale()
+
+    def __fetch_all_sensor_info(self):
+        return self.request_get_with_status(CommonCfg.SENSOR_ALL_INFO_GET_API, allow_stale=True)
+
     def get_one_sensor_info_by_restful(self, sensor_name):
         """ Get one sensor status (RESTful V2.0)
 
@@ -535,6 +2447,12 @@ class PlatCommon(Logger):
             }
         """
         try:
+            _, index = SensorSnapshot.get(self.__fetch_all_sensor_info, CommonCfg.SENSOR_SNAPSHOT_TTL)
+            if index is not None and sensor_name in index:
+                self._stale_local.stale = SensorSnapshot.is_stale()
+                return index.get(sensor_name)
+
+            # sensor is not in snapshot, ask bmc for it only
             url = CommonCfg.SENSOR_ONE_INFO_GET_API + sensor_name
             response = self.request_get(url)
             # response format eg:
@@ -584,7 +2502,7 @@ class PlatCommon(Logger):
             }
         """
         try:
-            response = self.request_get(CommonCfg.SENSOR_ALL_INFO_GET_API)
+            response = self.get_sensor_snapshot()
             # response format eg:
             # {
             #     "voltage": {
@@ -764,7 +2682,7 @@ class PlatCommon(Logger):
         """
         data = {"fantray": str(index)}
         try:
-            response = self.request_get(CommonCfg.FANTRAY_PRESENCE_GET_API, data)
+            response, _ = self.request_get_with_status(CommonCfg.FANTRAY_PRESENCE_GET_API, data)
             # response format eg:
             # {
             #     "Present": "yes"
@@ -796,7 +2714,8 @@ class PlatCommon(Logger):
             }
         """
         data = {"fantray": str(index)}
-        return self.request_get(CommonCfg.FANTRAY_INFO_GET_API, data)
+        info, _ = self.request_get_with_status(CommonCfg.FANTRAY_INFO_GET_API, data)
+        return info
 
     def get_fantray_speed_info_by_restful(self, index):
         """
@@ -823,7 +2742,7 @@ class PlatCommon(Logger):
             }
         """
         data = {"fantray": str(index)}
-        speed_info = self.request_get(CommonCfg.FANTRAY_SPEED_GET_API, data)
+        speed_info, _ = self.request_get_with_status(CommonCfg.FANTRAY_SPEED_GET_API, data)
         return speed_info
 
     def get_fantray_led_by_restful(self, index):
@@ -839,7 +2758,7 @@ class PlatCommon(Logger):
         data = {"fantray": str(index)}
 
         try:
-            response = self.request_get(CommonCfg.FANTRAY_LED_GET_API, data)
+            response, _ = self.request_get_with_status(CommonCfg.FANTRAY_LED_GET_API, data)
             # response format eg:
             # {
             #     "color": "green"
@@ -865,7 +2784,7 @@ class PlatCommon(Logger):
         """
         data = {"psu": str(psu_index)}
         try:
-            response = self.request_get(CommonCfg.PSU_PRESENCE_GET_API, data)
+            response, _ = self.request_get_with_status(CommonCfg.PSU_PRESENCE_GET_API, data)
             # response format eg:
             # {
             #     "Present": "yes"
@@ -899,7 +2818,8 @@ class PlatCommon(Logger):
             }
         """
         data = {"psu": str(psu_index)}
-        return self.request_get(CommonCfg.PSU_INFO_GET_API, data)
+        info, _ = self.request_get_with_status(CommonCfg.PSU_INFO_GET_API, data)
+        return info
 
     def get_psu_power_status_by_restful(self, psu_index):
         """
@@ -940,7 +2860,8 @@ class PlatCommon(Logger):
             }
         """
         data = {"psu": str(psu_index)}
-        return self.request_get(CommonCfg.PSU_PWR_STATUS_GET_API, data)
+        info, _ = self.request_get_with_status(CommonCfg.PSU_PWR_STATUS_GET_API, data)
+        return info
 
     def get_psu_status_by_restful(self, psu_index):
         """
@@ -975,7 +2896,8 @@ class PlatCommon(Logger):
             }
         """
         data = {"psu": str(psu_index)}
-        return self.request_get(CommonCfg.PSU_STATUS_GET_API, data)
+        info, _ = self.request_get_with_status(CommonCfg.PSU_STATUS_GET_API, data)
+        return info
 
     ## get device information from cache files
     ## for psu, fan, sensor
@@ -1012,25 +2934,150 @@ class PlatCommon(Logger):
             data: str
         """
         data = ""
-        for _ in range(5):
+        if JsonFileCache.should_wait(file_path):
+            deadline = time.monotonic() + CommonCfg.CACHE_FILE_WAIT_SECS
+        else:
+            deadline = 0
+
+        while True:
             try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r', encoding="utf-8") as fd:
-                        fcntl.flock(fd.fileno(), fcntl.LOCK_EX)
-                        data = json.load(fd)
-
-                    self.log_info("load cache {} content={}.".format(file_path, data))
-                    return data
-                else:
-                    # restful cache file doesn't exist, wait one second
-                    time.sleep(1)
+                doc, parsed = JsonFileCache.load(file_path)
+                if doc is not None:
+                    if parsed:
+                        self.log_info("load cache {} content={}.", file_path, doc)
+                    return doc
             except Exception as error:
                 self.log_notice("retry read file {}: {}".format(file_path, str(error)))
-            time.sleep(0.1)
+            if time.monotonic() >= deadline:
+                break
+            # restful cache file doesn't exist or is being written, wait a moment
+            time.sleep(CommonCfg.CACHE_FILE_POLL_SECS)
 
+        JsonFileCache.mark_gave_up(file_path)
         self.log_notice("load cache file {} failed.".format(file_path))
         return data
 
+    def get_sysfs_reader_stats(self):
+        """
+        Retrieves counters of the persistent-fd sysfs reader
+
+        Returns:
+            dict: reads, opens, reopens, evictions, writes, open_fds
+        """
+        return SysfsReader.get_stats()
+
+    def get_cache_file_stats(self):
+        """
+        Retrieves parse counts and hit ratio of platform_cache files
+
+        Returns:
+            dict: see JsonFileCache.get_stats
+        """
+        return JsonFileCache.get_stats()
+
+    def __read_snapshot_record(self, kind, name, file_path):
+        """
+        Retrieves one device record from the binary snapshot, readers never
+        write the snapshot, it is built by the cache producer
+
+        Returns:
+            dict: None if the snapshot has no such record or was built from
+            older data than the json cache file holds now
+        """
+        try:
+            source_mtime = os.stat(file_path).st_mtime
+        except FileNotFoundError:
+            return None
+        info, built_mtime = TelemetrySnapshot.read_record(self.TELEMETRY_SNAPSHOT_FILE, kind, name)
+        if source_mtime - built_mtime > CommonCfg.TELEMETRY_SNAPSHOT_MAX_AGE:
+            return None
+        return info
+
+    def __get_cache_record(self, kind, name, file_path):
+        """
+        Retrieves one device record from the configured cache backend,
+        fall back to the json cache file if the binary snapshot has no such
+        record or is outdated
+
+        Args:
+            kind: str, 'sensor', 'fan' or 'psu'
+            name: str, eg. 'fan1', 'psu2', 'BB_P3V3_STBY_V'
+            file_path: str, the json cache file
+
+        Returns:
+            dict: None for Fail
+        """
+        if CommonCfg.CACHE_BACKEND == CommonCfg.CACHE_BACKEND_MMAP:
+            try:
+                info = self.__read_snapshot_record(kind, name, file_path)
+                if info is not None:
+                    return info
+            except Exception as error:
+                self.log_notice("read snapshot {} {} error:{}".format(kind, name, str(error)))
+
+        cache_info = self.__load_cache(file_path)
+        if not cache_info or not isinstance(cache_info, dict):
+            return None
+        if kind == "sensor":
+            for _, value in cache_info.items():
+                if isinstance(value, dict) and name in value:
+                    return value.get(name)
+            return None
+        return cache_info.get(name)
+
+    def convert_cache_to_snapshot(self):
+        """
+        Build the binary telemetry snapshot from the json cache files,
+        so both cache formats can be used side by side. Meant for the cache
+        producer, to be called each time it has rewritten the json files
+
+        Returns:
+            boolean: True if snapshot is written
+        """
+        try:
+            docs = []
+            mtimes = []
+            for file_path in [self.SENSOR_CACHE_FILE, self.FAN_CACHE_FILE, self.PSU_CACHE_FILE]:
+                try:
+                    mtimes.append(os.stat(file_path).st_mtime)
+                except FileNotFoundError:
+                    mtimes.append(0)
+                # stat before parsing: a rewrite in between makes the snapshot look older, never newer
+                doc, _ = JsonFileCache.load(file_path)
+                docs.append(doc if isinstance(doc, dict) else {})
+            TelemetrySnapshot.write(self.TELEMETRY_SNAPSHOT_FILE, docs[0], docs[1], docs[2], tuple(mtimes))
+            return True
+        except Exception as error:
+            self.log_error("convert cache to snapshot error:{}".format(str(error)))
+        return False
+
+    def __normalize_cache_value(self, value, numeric):
+        if numeric:
+            if self.is_float(value) and self.is_valid_value(value):
+                return float(value)
+            return None
+        # absent and empty strings are not told apart by the snapshot
+        return None if value in [None, ""] else str(value)
+
+    def check_cache_snapshot(self, file_path=None):
+        """
+        Verify the binary snapshot serves the same values as the json cache
+        files for every key Psu, Fan, Thermal, Voltage and Current read
+
+        Args:
+            file_path: str, snapshot file, default TELEMETRY_SNAPSHOT_FILE
+
+        Returns:
+            list: str, the differing keys, empty if both backends agree
+        """
+        if file_path is None:
+            file_path = self.TELEMETRY_SNAPSHOT_FILE
+        docs = []
+        for cache_file in [self.SENSOR_CACHE_FILE, self.FAN_CACHE_FILE, self.PSU_CACHE_FILE]:
+            doc, _ = JsonFileCache.load(cache_file)
+            docs.append(doc if isinstance(doc, dict) else {})
+        return TelemetrySnapshot.check(file_path, docs[0], docs[1], docs[2], self.__normalize_cache_value)
+
     def get_fantray_presence_by_cache(self, index):
         """
         Retrieves the fantray presence status
@@ -1043,9 +3090,9 @@ class PlatCommon(Logger):
         """
         try:
             fan_name = "fan{}".format(index)
-            cache_info = self.__load_cache(self.FAN_CACHE_FILE)
-            if cache_info and isinstance(cache_info.get(fan_name), dict):
-                if cache_info.get(fan_name).get("Present") == "yes":
+            fan_info = self.__get_cache_record("fan", fan_name, self.FAN_CACHE_FILE)
+            if isinstance(fan_info, dict):
+                if fan_info.get("Present") == "yes":
                     return True
         except Exception as error:
             self.log_error("Get fan cache presence error:{}".format(str(error)))
@@ -1073,9 +3120,7 @@ class PlatCommon(Logger):
         """
         try:
             fan_name = "fan{}".format(index)
-            cache_info = self.__load_cache(self.FAN_CACHE_FILE)
-            if cache_info and isinstance(cache_info, dict):
-                return cache_info.get(fan_name)
+            return self.__get_cache_record("fan", fan_name, self.FAN_CACHE_FILE)
         except Exception as error:
             self.log_error("Get fan cache mfr info error:{}".format(str(error)))
 
@@ -1107,9 +3152,9 @@ class PlatCommon(Logger):
         """
         try:
             fan_name = "fan{}".format(index)
-            cache_info = self.__load_cache(self.FAN_CACHE_FILE)
-            if cache_info and isinstance(cache_info.get(fan_name), dict):
-                return cache_info.get(fan_name).get("speed")
+            fan_info = self.__get_cache_record("fan", fan_name, self.FAN_CACHE_FILE)
+            if isinstance(fan_info, dict):
+                return fan_info.get("speed")
         except Exception as error:
             self.log_error("Get fan cache speed error:{}".format(str(error)))
 
@@ -1127,9 +3172,9 @@ class PlatCommon(Logger):
         """
         try:
             fan_name = "fan{}".format(index)
-            cache_info = self.__load_cache(self.FAN_CACHE_FILE)
-            if cache_info and isinstance(cache_info.get(fan_name), dict):
-                return cache_info.get(fan_name).get("color")
+            fan_info = self.__get_cache_record("fan", fan_name, self.FAN_CACHE_FILE)
+            if isinstance(fan_info, dict):
+                return fan_info.get("color")
         except Exception as error:
             self.log_error("Get fan cache led error:{}".format(str(error)))
         return CommonCfg.NULL_VALUE
@@ -1146,9 +3191,9 @@ class PlatCommon(Logger):
         """
         try:
             psu_name = "psu{}".format(psu_index)
-            cache_info = self.__load_cache(self.PSU_CACHE_FILE)
-            if cache_info and isinstance(cache_info.get(psu_name), dict):
-                if cache_info.get(psu_name).get("Present") == "yes":
+            psu_info = self.__get_cache_record("psu", psu_name, self.PSU_CACHE_FILE)
+            if isinstance(psu_info, dict):
+                if psu_info.get("Present") == "yes":
                     return True
         except Exception as error:
             self.log_error("Get psu cache presence error:{}".format(str(error)))
@@ -1167,9 +3212,7 @@ class PlatCommon(Logger):
         """
         try:
             psu_name = "psu{}".format(psu_index)
-            cache_info = self.__load_cache(self.PSU_CACHE_FILE)
-            if cache_info and isinstance(cache_info, dict):
-                return cache_info.get(psu_name)
+            return self.__get_cache_record("psu", psu_name, self.PSU_CACHE_FILE)
         except Exception as error:
             self.log_error("Get psu cache info error:{}".format(str(error)))
 
@@ -1185,11 +3228,7 @@ class PlatCommon(Logger):
             dict: None for Fail
         """
         try:
-            cache_info = self.__load_cache(self.SENSOR_CACHE_FILE)
-            if cache_info and isinstance(cache_info, dict):
-                for _, value in cache_info.items():
-                    if sensor_name in value:
-                        return value.get(sensor_name)
+            return self.__get_cache_record("sensor", sensor_name, self.SENSOR_CACHE_FILE)
         except Exception as error:
             self.log_error("Get cache {} info error:{}".format(sensor_name, str(error)))
 
@@ -11,6 +11,7 @@ try:
     from sonic_platform.fan import Fan
     from sonic_platform.plat_common import PlatCommon
     from sonic_platform.plat_common import CommonCfg
+    from sonic_platform.plat_common import RecordedReadings
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found") from e
 
@@ -19,8 +20,9 @@ AC_INPUT = "AC"
 DC_INPUT = "DC"
 
 
-class Psu(PsuBase):
+class Psu(RecordedReadings, PsuBase):
     """Platform-specific Psu class"""
+    RECORDED_READINGS = ("power", "voltage", "current", "temperature")
 
     def __init__(self, index, fan_num=1, method="sysfs"):
         """
@@ -72,6 +74,15 @@ class Psu(PsuBase):
         """
         return "PSU{}".format(self.index)
 
+    def is_stale(self):
+        """
+        Whether the last RESTful reading is the last known value because BMC was unreachable
+
+        Returns:
+            bool: True for stale
+        """
+        return self.plat_common.is_stale()
+
     def get_presence(self):
         """
         Retrieves the presence of the PSU
@@ -268,6 +279,11 @@ class Psu(PsuBase):
             A float number, the output voltage in volts,
             e.g. 12.1
         """
+        value = self.__get_voltage()
+        self.record_reading("voltage", value)
+        return value
+
+    def __get_voltage(self):
         if not self.get_presence():
             return None
 
@@ -301,6 +317,11 @@ class Psu(PsuBase):
         Returns:
             A float number, the electric current in amperes, e.g 15.4
         """
+        value = self.__get_current()
+        self.record_reading("current", value)
+        return value
+
+    def __get_current(self):
         if not self.get_presence():
             return None
 
@@ -334,6 +355,11 @@ class Psu(PsuBase):
         Returns:
             A float number, the power in watts, e.g. 302.6
         """
+        value = self.__get_power()
+        self.record_reading("power", value)
+        return value
+
+    def __get_power(self):
         if not self.get_presence():
             return None
 
@@ -424,6 +450,11 @@ class Psu(PsuBase):
             A float number of current temperature in Celsius up to nearest thousandth
             of one degree Celsius, e.g. 30.125
         """
+        value = self.__get_temperature()
+        self.record_reading("temperature", value)
+        return value
+
+    def __get_temperature(self):
         if not self.get_presence():
             return None
 
@@ -9,10 +9,18 @@ try:
     import struct
     import os.path
     import time
+    import threading
+    import select
+    import re
     from sonic_platform_base.sonic_xcvr.sfp_optoe_base import SfpOptoeBase
     from sonic_platform.plat_common import PlatCommon
     from sonic_platform.plat_common import CommonCfg
+    from sonic_platform.plat_common import LazyImport
+    from sonic_platform.plat_common import SysfsReader
     from vendor_sonic_platform import hooks
+    from vendor_sonic_platform.device import DeviceCfg
+    json = LazyImport("json")
+    futures = LazyImport("concurrent.futures")
 except ImportError as e:
     raise ImportError (str(e) + "- required module not found") from e
 
@@ -64,9 +72,814 @@ cable_type_map = {
 #If meet init slow module, change this value
 SFP_INSERT_DELAY_MS = 2000
 
+# Channel status registers read by get_channel_status, (offset, width,
+# ((field, byte in block), ...)). Only adjacent bytes are read together,
+# the bytes in between are clear-on-read flags of other monitors.
+QSFP_CHANNEL_STATUS_BLOCKS = (
+    (QSFP_CHANNL_RX_LOS_STATUS_OFFSET, 2, (("rx_los", 0), ("tx_fault", 1))),
+    (QSFP_CHANNL_DISABLE_STATUS_OFFSET, QSFP_CHANNL_DISABLE_STATUS_WIDTH, (("tx_disable", 0),)),
+)
+QSFP_DD_CHANNEL_STATUS_BLOCKS = (
+    (QSFP_DD_CHANNEL_TX_FAULT_STATUS_OFFSET, QSFP_DD_CHANNEL_TX_FAULT_STATUS_WIDTH, (("tx_fault", 0),)),
+    (QSFP_DD_CHANNEL_RX_LOS_STATUS_OFFSET, QSFP_DD_CHANNEL_RX_LOS_STATUS_WIDTH, (("rx_los", 0),)),
+    (QSFP_DD_CHANNEL_TX_DISABLE_STATUS_OFFSET, QSFP_DD_CHANNEL_TX_DISABLE_STATUS_WIDTH, (("tx_disable", 0),)),
+)
+# sfp type -> (lane count, blocks)
+CHANNEL_STATUS_LAYOUT = {
+    QSFP_TYPE: (4, QSFP_CHANNEL_STATUS_BLOCKS),
+    QSFP_DD_TYPE: (8, QSFP_DD_CHANNEL_STATUS_BLOCKS),
+}
+CHANNEL_STATUS_FIELDS = ("rx_los", "tx_fault", "tx_disable")
+# flags latched by the module until read, kept until their getter is called
+CHANNEL_STATUS_LATCHED_FIELDS = ("rx_los", "tx_fault")
+# register value -> per lane booleans, lane 1 is bit 0
+LANE_FLAG_TABLES = {
+    lanes: tuple(tuple(value >> lane & 1 != 0 for lane in range(lanes)) for value in range(256))
+    for lanes in (4, 8)
+}
+
+# Static eeprom ranges [start, end) in optoe linear address, upper half of
+# page N is at (N + 1) * 128. They are cached until plug event or reset,
+# DOM, flags and control bytes are always read from the module.
+SFF8472_STATIC_RANGES = ((0, 128), (256, 352))           # A0h base/ext id, A2h thresholds/calibration
+SFF8636_STATIC_RANGES = ((0, 2), (128, 256), (512, 640))  # id/revision, page 00h, page 03h thresholds
+CMIS_STATIC_RANGES = ((0, 3), (85, 118), (128, 256), (256, 384), (384, 512))  # id, applications, pages 00h-02h
+EEPROM_STATIC_RANGES = {
+    0x03: SFF8472_STATIC_RANGES,
+    0x0c: SFF8636_STATIC_RANGES,
+    0x0d: SFF8636_STATIC_RANGES,
+    0x11: SFF8636_STATIC_RANGES,
+    0x18: CMIS_STATIC_RANGES,
+    0x19: CMIS_STATIC_RANGES,
+    0x1e: CMIS_STATIC_RANGES,
+}
+
+# Vendor serial number (offset, width), read back with the identifier to
+# tell whether the cached static ranges still belong to the plugged module
+EEPROM_SERIAL_FIELDS = {
+    0x03: (68, 16),
+    0x0c: (196, 16),
+    0x0d: (196, 16),
+    0x11: (196, 16),
+    0x18: (166, 16),
+    0x19: (166, 16),
+    0x1e: (166, 16),
+}
+
+# Module identity the xcvr api is memoized by, (offset, width) of the
+# revision compliance, vendor OUI and vendor PN, all in static ranges
+SFF8472_API_KEY_FIELDS = ((94, 1), (37, 3), (40, 16))
+SFF8636_API_KEY_FIELDS = ((1, 1), (165, 3), (168, 16))
+CMIS_API_KEY_FIELDS = ((1, 1), (145, 3), (148, 16))
+XCVR_API_KEY_FIELDS = {
+    0x03: SFF8472_API_KEY_FIELDS,
+    0x0c: SFF8636_API_KEY_FIELDS,
+    0x0d: SFF8636_API_KEY_FIELDS,
+    0x11: SFF8636_API_KEY_FIELDS,
+    0x18: CMIS_API_KEY_FIELDS,
+    0x19: CMIS_API_KEY_FIELDS,
+    0x1e: CMIS_API_KEY_FIELDS,
+}
+XCVR_API_CACHE_ENTRIES = 64
+
+# Reads done in one planned pass before the xcvr api builds the bulk status
+# or threshold info, (page, offset, length), page None for flat addressing.
+# Latched flag bytes are listed one by one so the others aren't cleared,
+# the lane flags among them are kept for get_rx_los/get_tx_fault.
+SFF8472_BULK_STATUS_READS = ((None, 256 + 96, 15),)                  # A2h monitors, status/control 110
+SFF8636_BULK_STATUS_READS = ((0, 3, 2), (0, 22, 36), (0, 86, 1))     # lane flags, monitors, tx disable
+CMIS_BULK_STATUS_READS = ((0, 14, 10), (0x10, 130, 1), (0x11, 135, 1),
+                          (0x11, 147, 1), (0x11, 154, 48))           # module and lane monitors, flags
+SFF8472_THRESHOLD_READS = ((None, 256, 56),)                         # A2h alarm/warning thresholds
+SFF8636_THRESHOLD_READS = ((3, 128, 96),)                            # page 03h thresholds
+CMIS_THRESHOLD_READS = ((2, 128, 72),)                               # page 02h thresholds
+BULK_STATUS_READS = {
+    0x03: SFF8472_BULK_STATUS_READS,
+    0x0c: SFF8636_BULK_STATUS_READS,
+    0x0d: SFF8636_BULK_STATUS_READS,
+    0x11: SFF8636_BULK_STATUS_READS,
+    0x18: CMIS_BULK_STATUS_READS,
+    0x19: CMIS_BULK_STATUS_READS,
+    0x1e: CMIS_BULK_STATUS_READS,
+}
+THRESHOLD_READS = {
+    0x03: SFF8472_THRESHOLD_READS,
+    0x0c: SFF8636_THRESHOLD_READS,
+    0x0d: SFF8636_THRESHOLD_READS,
+    0x11: SFF8636_THRESHOLD_READS,
+    0x18: CMIS_THRESHOLD_READS,
+    0x19: CMIS_THRESHOLD_READS,
+    0x1e: CMIS_THRESHOLD_READS,
+}
+
+
+class SfpPresenceBitmap(object):
+    """
+    Process-wide presence of all transceiver cages as an int bitmap, bit N
+    set if port N+1 is present. All cages are read in one pass (or by
+    hooks.get_sfp_presence_bitmap if the vendor reads CPLD registers) and
+    the result is served for CommonCfg.SFP_PRESENCE_CACHE_SECS, so
+    Sfp.get_presence doesn't read sysfs on every call.
+    """
+    _lock = threading.Lock()
+    _bitmap = None
+    _timestamp = 0
+
+    @classmethod
+    def __read(cls, plat_comm):
+        if hasattr(hooks, "get_sfp_presence_bitmap"):
+            return hooks.get_sfp_presence_bitmap()
+
+        paths = [os.path.join(CommonCfg.S3IP_SFP_PATH, "eth{}".format(index), "present")
+                 for index in range(1, DeviceCfg.SFP_NUM + 1)]
+        values, _ = plat_comm.read_files_typed(paths, int)
+        bitmap = 0
+        for index, path in enumerate(paths):
+            if values.get(path) == 1:
+                bitmap |= 1 << index
+        return bitmap
+
+    @classmethod
+    def get(cls, plat_comm, max_age=None):
+        """
+        Retrieves the presence bitmap, read again if older than max_age
+
+        Args:
+            plat_comm: PlatCommon object
+            max_age: float, seconds, default CommonCfg.SFP_PRESENCE_CACHE_SECS
+
+        Returns:
+            int: presence bitmap, None for Fail
+        """
+        if max_age is None:
+            max_age = CommonCfg.SFP_PRESENCE_CACHE_SECS
+        with cls._lock:
+            if cls._bitmap is None or time.monotonic() - cls._timestamp >= max_age:
+                try:
+                    cls._bitmap = cls.__read(plat_comm)
+                    cls._timestamp = time.monotonic()
+                except Exception as err:
+                    plat_comm.log_error("read sfp presence bitmap error:{}", err)
+                    cls._bitmap = None
+            return cls._bitmap
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Force next reader to read the bitmap again, eg. on a plug event
+        """
+        with cls._lock:
+            cls._bitmap = None
+
+    @staticmethod
+    def get_changed_ports(old_bitmap, new_bitmap):
+        """
+        Retrieves the ports differing between two bitmaps
+
+        Args:
+            old_bitmap: int
+            new_bitmap: int
+
+        Returns:
+            list: 0-based port indexes
+        """
+        changed = old_bitmap ^ new_bitmap
+        ports = []
+        while changed:
+            low_bit = changed & -changed
+            ports.append(low_bit.bit_length() - 1)
+            changed ^= low_bit
+        return ports
+
+
+class SfpTopology(object):
+    """
+    Process-wide map of transceiver ports to the I2C adapter, mux and mux
+    channel in front of their eeprom, built from platform-device.json
+    (SMBUSx, MUXx and PORTx-EEPROM entries) or hooks.get_sfp_topology.
+    Ports behind the same root adapter share one bus, ports on different
+    adapters can be accessed in parallel.
+    """
+    PORT_NAME_PATTERN = re.compile(r"^PORT(\d+)(?:-EEPROM)?$")
+    MUX_DEPTH_MAX = 8
+    _lock = threading.Lock()
+    _ports = None
+
+    @staticmethod
+    def __to_int(value):
+        value = str(value).strip()
+        if value.lower().startswith("0x"):
+            return int(value, 16)
+        return int(value)
+
+    @classmethod
+    def __find_file(cls):
+        file_list = [getattr(DeviceCfg, "SFP_TOPOLOGY_FILE", None)] + list(CommonCfg.SFP_TOPOLOGY_FILES)
+        for file_path in file_list:
+            if file_path and os.path.isfile(file_path):
+                return file_path
+        return None
+
+    @classmethod
+    def __get_port_index(cls, name):
+        match = cls.PORT_NAME_PATTERN.match(str(name))
+        if match:
+            return int(match.group(1))
+        return None
+
+    @classmethod
+    def __parse(cls, devices):
+        # child bus -> (mux name, parent bus, channel starting from 1)
+        child_buses = {}
+        mux_channels = {}
+        for name, device in devices.items():
+            if not name.startswith("MUX") or not isinstance(device, dict):
+                continue
+            for adapt_info in device.get("adapt_info", []):
+                parent_bus = cls.__to_int(adapt_info["bus_id"])
+                first_bus = cls.__to_int(adapt_info["adap_id"])
+                for channel in range(1, cls.__to_int(adapt_info.get("num_modes", 8)) + 1):
+                    child_buses[first_bus + channel - 1] = (name, parent_bus, channel)
+                    mux_channels[(name, channel)] = first_bus + channel - 1
+
+        def locate(bus):
+            mux = None
+            channel = None
+            if bus in child_buses:
+                mux, _, channel = child_buses[bus]
+            root_bus = bus
+            for _ in range(cls.MUX_DEPTH_MAX):
+                if root_bus not in child_buses:
+                    break
+                root_bus = child_buses[root_bus][1]
+            return ("i2c-{}".format(root_bus), mux, channel)
+
+        ports = {}
+        # the bus of the eeprom client is what the kernel really uses
+        for name, device in devices.items():
+            if not name.endswith("-EEPROM") or not isinstance(device, dict):
+                continue
+            index = cls.__get_port_index(device.get("dev_info", {}).get("virt_parent", name))
+            parent_bus = device.get("i2c", {}).get("topo_info", {}).get("parent_bus")
+            if index is None or parent_bus is None:
+                continue
+            ports[index] = locate(cls.__to_int(parent_bus))
+
+        # ports without eeprom entry, from the mux channel list
+        for name, device in devices.items():
+            if not name.startswith("MUX") or not isinstance(device, dict):
+                continue
+            for item in device.get("channel", []):
+                index = cls.__get_port_index(item.get("dev"))
+                bus = mux_channels.get((name, cls.__to_int(item.get("chn", 0))))
+                if index is not None and bus is not None and index not in ports:
+                    ports[index] = locate(bus)
+        return ports
+
+    @classmethod
+    def __load(cls, plat_comm):
+        if hasattr(hooks, "get_sfp_topology"):
+            return hooks.get_sfp_topology()
+
+        file_path = cls.__find_file()
+        if file_path is None:
+            return {}
+        try:
+            with open(file_path, 'r', encoding="utf-8") as fd:
+                devices = json.load(fd)
+            return cls.__parse(devices)
+        except Exception as err:
+            plat_comm.log_error("parse sfp topology {} error:{}", file_path, err)
+            return {}
+
+    @classmethod
+    def get(cls, plat_comm):
+        """
+        Retrieves the i2c location of all transceiver ports, loaded once
+
+        Args:
+            plat_comm: PlatCommon object
+
+        Returns:
+            dict: sfp index (start from 1) -> tuple(adapter, mux, channel),
+                  eg. {1: ("i2c-1", "MUX1", 1)}, mux and channel are None
+                  if the eeprom is on the adapter directly. Empty if the
+                  topology is unknown
+        """
+        with cls._lock:
+            if cls._ports is None:
+                cls._ports = cls.__load(plat_comm)
+            return cls._ports
+
+
+class SfpIoScheduler(object):
+    """
+    Transceiver eeprom access scheduler with one worker queue per
+    independent I2C adapter of SfpTopology. A bulk request is split by
+    adapter and each adapter's share runs in its own worker in mux/channel
+    order, so a sweep of all ports takes about as long as the busiest
+    adapter, instead of one thread per port contending on the shared buses
+    and muxes. Ports of unknown location share one queue.
+    """
+    UNKNOWN_ADAPTER = "unknown"
+    _lock = threading.Lock()
+    _workers = {}
+    _owner_pid = None
+
+    @classmethod
+    def __get_worker(cls, adapter):
+        with cls._lock:
+            if cls._owner_pid != os.getpid():
+                # worker threads don't survive fork
+                cls._workers = {}
+                cls._owner_pid = os.getpid()
+            worker = cls._workers.get(adapter)
+            if worker is None:
+                worker = futures.ThreadPoolExecutor(max_workers=1,
+                                                    thread_name_prefix="sfp-io-{}".format(adapter))
+                cls._workers[adapter] = worker
+            return worker
+
+    @staticmethod
+    def __run_jobs(jobs, func):
+        results = {}
+        for sfp in jobs:
+            try:
+                results[sfp.index] = func(sfp)
+            except Exception as err:
+                sfp.plat_comm.log_error("{} io error:{}", sfp.get_name(), err)
+                results[sfp.index] = None
+        return results
+
+    @classmethod
+    def run(cls, sfp_list, func):
+        """
+        Call func(sfp) for every sfp, ports on the same adapter one after
+        another grouped by mux channel, different adapters in parallel
+
+        Args:
+            sfp_list: list of Sfp objects
+            func: callable, does all the eeprom accesses of one port
+
+        Returns:
+            dict: sfp index -> return value of func, None for Fail
+        """
+        if not sfp_list:
+            return {}
+        plat_comm = sfp_list[0].plat_comm
+        topology = SfpTopology.get(plat_comm)
+        groups = {}
+        for sfp in sfp_list:
+            adapter, mux, channel = topology.get(sfp.index, (cls.UNKNOWN_ADAPTER, None, None))
+            groups.setdefault(adapter, []).append(((mux or "", channel or 0, sfp.index), sfp))
+
+        pending = []
+        for adapter, items in groups.items():
+            jobs = [sfp for _, sfp in sorted(items, key=lambda item: item[0])]
+            pending.append((jobs, cls.__get_worker(adapter).submit(cls.__run_jobs, jobs, func)))
+
+        results = {}
+        for jobs, future in pending:
+            try:
+                results.update(future.result())
+            except Exception as err:
+                plat_comm.log_error("sfp io error:{}", err)
+                for sfp in jobs:
+                    results[sfp.index] = None
+        return results
+
+    @classmethod
+    def read_eeprom_bulk(cls, sfp_list, offset, num_bytes, bypass_cache=False):
+        """
+        Read the same eeprom range of all present transceivers
+
+        Args:
+            sfp_list: list of Sfp objects
+            offset: int, optoe linear address
+            num_bytes: int
+            bypass_cache: bool, don't serve static ranges from the page cache
+
+        Returns:
+            dict: sfp index -> bytearray (None for Fail) of present ports
+        """
+        present_list = [sfp for sfp in sfp_list if sfp.get_presence()]
+        return cls.run(present_list,
+                       lambda sfp: sfp.read_eeprom(offset, num_bytes, bypass_cache=bypass_cache))
+
+
+class SfpPortControl(object):
+    """
+    Apply one control value (lpmode, reset, power, write_enable) to many
+    transceiver ports in one call. Ports covered by a group attribute
+    (DeviceCfg.SFP_CONTROL_GROUPS, eg. cpld port_pwr_en_N, or the global
+    transceiver power_on for all ports) are written once per group, the
+    others per port on the attribute's real path, and ports whose
+    attribute resolves to the same cpld register (eg. write_enable) are
+    written once. lpmode and reset are written with the write protect
+    lifted, like Sfp.set_lpmode and Sfp.reset do.
+    """
+    CONTROL_ATTRS = {
+        "lpmode": "low_power_mode",
+        "reset": "reset",
+        "power": "power_on",
+        "write_enable": "write_enable",
+    }
+    WRITE_PROTECTED_CONTROLS = ("lpmode", "reset")
+    WRITE_UNPROTECT = 0x59
+    WRITE_PROTECT = 0x4E
+
+    @classmethod
+    def __get_groups(cls, control):
+        groups = list(getattr(DeviceCfg, "SFP_CONTROL_GROUPS", {}).get(control, ()))
+        if control == "power":
+            groups.append((os.path.join(CommonCfg.S3IP_SFP_PATH, cls.CONTROL_ATTRS[control]),
+                           range(1, DeviceCfg.SFP_NUM + 1)))
+        return groups
+
+    @classmethod
+    def apply(cls, plat_comm, control, value, indexes=None):
+        """
+        Write a control attribute of many ports
+
+        Args:
+            plat_comm: PlatCommon object
+            control: str, "lpmode", "reset", "power" or "write_enable"
+            value: int or str, written as is, eg. 1 for lpmode, 0x59 for write_enable
+            indexes: list of sfp index (start from 1), None for all ports
+
+        Returns:
+            dict: sfp index -> True if written successfully, False if not
+        """
+        if control not in cls.CONTROL_ATTRS:
+            plat_comm.log_error("unsupported sfp control {}", control)
+            return {}
+        if indexes is None:
+            indexes = range(1, DeviceCfg.SFP_NUM + 1)
+        if hasattr(hooks, "set_sfp_control_bulk"):
+            return hooks.set_sfp_control_bulk(control, value, list(indexes))
+        if control not in cls.WRITE_PROTECTED_CONTROLS:
+            return cls.__write(plat_comm, control, value, indexes)
+
+        indexes = list(indexes)
+        cls.__write(plat_comm, "write_enable", cls.WRITE_UNPROTECT, indexes)
+        try:
+            return cls.__write(plat_comm, control, value, indexes)
+        finally:
+            cls.__write(plat_comm, "write_enable", cls.WRITE_PROTECT, indexes)
+
+    @classmethod
+    def __write(cls, plat_comm, control, value, indexes):
+        remaining = set(indexes)
+        results = {}
+        for group_path, group_ports in cls.__get_groups(control):
+            group_ports = set(group_ports)
+            if not group_ports or not group_ports <= remaining:
+                continue
+            ret = plat_comm.write_file(group_path, value)
+            for index in group_ports:
+                results[index] = ret
+            remaining -= group_ports
+
+        written = {}
+        for index in sorted(remaining):
+            file_path = os.path.join(CommonCfg.S3IP_SFP_PATH, "eth{}".format(index), cls.CONTROL_ATTRS[control])
+            try:
+                real_path = SysfsReader.get_real_path(file_path)
+            except OSError:
+                real_path = file_path
+            if real_path not in written:
+                written[real_path] = plat_comm.write_file(file_path, value)
+            results[index] = written[real_path]
+        return results
+
+
+class SfpBringUpScheduler(object):
+    """
+    Staged release of transceivers from reset and low power mode after a
+    cold boot. Reset is released in waves of at most inrush_ports modules,
+    lpmode in waves that also keep the sum of the modules' advertised
+    max power within power_budget. A new wave starts every wave_secs
+    without waiting for the previous one to become ready, so the CMIS
+    state machine wait times of the waves overlap.
+    """
+    STATE_RESET = "reset"
+    STATE_INIT = "init"
+    STATE_LOW_POWER = "low_power"
+    STATE_HIGH_POWER = "high_power"
+    STATE_READY = "ready"
+    # CMIS module state, lower page byte 3 bits 3:1
+    CMIS_MODULE_STATE_OFFSET = 3
+    CMIS_MODULE_LOW_PWR = 1
+    CMIS_MODULE_READY = 3
+    CMIS_MAX_POWER_OFFSET = 201
+    # SFF-8636 status byte 2 bit 0 Data_Not_Ready, power class byte 129
+    SFF8636_STATUS_OFFSET = 2
+    SFF8636_POWER_CLASS_OFFSET = 129
+    SFF8636_MAX_POWER_OFFSET = 107
+    SFF8636_POWER_CLASS_1_4 = (1.5, 2.0, 2.5, 3.5)
+    SFF8636_POWER_CLASS_5_7 = (4.0, 4.5, 5.0)
+
+    def __init__(self, sfp_list, plat_comm, power_budget=None, inrush_ports=None,
+                 wave_secs=None, timeout=None):
+        """
+        Args:
+            sfp_list: list of Sfp objects to bring up, absent ones are skipped
+            plat_comm: PlatCommon object
+            power_budget: float, W for all transceivers, default DeviceCfg.SFP_POWER_BUDGET
+                          or CommonCfg.SFP_BRINGUP_POWER_BUDGET
+            inrush_ports: int, max modules released in one wave
+            wave_secs: float, seconds between two waves
+            timeout: float, seconds to wait for all modules
+        """
+        self.sfp_list = sfp_list
+        self.plat_comm = plat_comm
+        self.power_budget = power_budget if power_budget is not None else \
+            getattr(DeviceCfg, "SFP_POWER_BUDGET", CommonCfg.SFP_BRINGUP_POWER_BUDGET)
+        self.inrush_ports = inrush_ports or CommonCfg.SFP_BRINGUP_INRUSH_PORTS
+        self.wave_secs = wave_secs if wave_secs is not None else CommonCfg.SFP_BRINGUP_WAVE_SECS
+        self.timeout = timeout if timeout is not None else CommonCfg.SFP_BRINGUP_READY_TIMEOUT
+        self.ports = {}
+
+    def __get_max_power(self, sfp):
+        """
+        Max power advertised by the module, W
+        """
+        identifier = sfp.read_eeprom(0, 1)
+        try:
+            if identifier and identifier[0] in (0x18, 0x19, 0x1e):
+                data = sfp.read_eeprom(self.CMIS_MAX_POWER_OFFSET, 1)
+                if data and data[0]:
+                    return data[0] * 0.25
+            elif identifier and identifier[0] in (0x0c, 0x0d, 0x11):
+                data = sfp.read_eeprom(self.SFF8636_POWER_CLASS_OFFSET, 1)
+                if data:
+                    if data[0] & 0x20:
+                        # power class 8, max power in 0.1 W
+                        max_power = sfp.read_eeprom(self.SFF8636_MAX_POWER_OFFSET, 1)
+                        if max_power and max_power[0]:
+                            return max_power[0] * 0.1
+                    if data[0] & 0x03:
+                        return self.SFF8636_POWER_CLASS_5_7[(data[0] & 0x03) - 1]
+                    return self.SFF8636_POWER_CLASS_1_4[data[0] >> 6]
+        except (IndexError, TypeError):
+            pass
+        return CommonCfg.SFP_BRINGUP_DEFAULT_POWER
+
+    def __get_module_state(self, sfp):
+        """
+        Returns:
+            tuple(readable, ready): module answers on i2c, module is ready
+        """
+        identifier = sfp.probe_eeprom(0, 1)
+        if not identifier:
+            return False, False
+        if identifier[0] in (0x18, 0x19, 0x1e):
+            data = sfp.probe_eeprom(self.CMIS_MODULE_STATE_OFFSET, 1)
+            if not data:
+                return False, False
+            state = (data[0] >> 1) & 0x07
+            return True, state == self.CMIS_MODULE_READY
+        if identifier[0] in (0x0c, 0x0d, 0x11):
+            data = sfp.probe_eeprom(self.SFF8636_STATUS_OFFSET, 1)
+            if not data:
+                return False, False
+            return True, data[0] & 0x01 == 0
+        return True, True
+
+    def __release(self, control, ports):
+        indexes = [port["sfp"].index for port in ports]
+        results = SfpPortControl.apply(self.plat_comm, control, 0, indexes)
+        return [port for port in ports if results.get(port["sfp"].index)]
+
+    def __start_wave(self, now, wave):
+        """
+        Release one wave, reset waves first, then lpmode within the budget
+
+        Returns:
+            bool: True if a wave was released
+        """
+        waiting = [port for port in self.ports.values() if port["state"] == self.STATE_RESET]
+        if waiting:
+            for port in self.__release("reset", waiting[:self.inrush_ports]):
+                port["state"] = self.STATE_INIT
+                port["wave"] = wave
+            return True
+
+        committed = sum(port["power"] if port["state"] in (self.STATE_HIGH_POWER, self.STATE_READY)
+                        else CommonCfg.SFP_BRINGUP_LOW_POWER for port in self.ports.values())
+        candidates = []
+        for port in self.ports.values():
+            if port["state"] != self.STATE_LOW_POWER or len(candidates) >= self.inrush_ports:
+                continue
+            extra = port["power"] - CommonCfg.SFP_BRINGUP_LOW_POWER
+            if committed + extra > self.power_budget:
+                continue
+            committed += extra
+            candidates.append(port)
+        if not candidates:
+            return False
+        for port in self.__release("lpmode", candidates):
+            port["state"] = self.STATE_HIGH_POWER
+            port["wave"] = wave
+            port["released"] = now
+        return True
+
+    def __poll(self, now):
+        for port in self.ports.values():
+            if port["state"] not in (self.STATE_INIT, self.STATE_HIGH_POWER):
+                continue
+            readable, ready = self.__get_module_state(port["sfp"])
+            if not readable:
+                continue
+            if port["state"] == self.STATE_INIT:
+                port["power"] = self.__get_max_power(port["sfp"])
+                port["state"] = self.STATE_LOW_POWER
+            elif ready:
+                port["state"] = self.STATE_READY
+                port["ready"] = now
+
+    def run(self):
+        """
+        Bring up all present modules, blocks until they are ready or timeout
+
+        Returns:
+            dict: sfp index -> {"state": str, "ready": bool, "time_to_ready": float
+                  seconds from start (None if not ready), "power": float W,
+                  "wave": int}
+        """
+        start = time.monotonic()
+        for sfp in self.sfp_list:
+            if not sfp.get_presence():
+                continue
+            reset = self.plat_comm.read_file(os.path.join(sfp.sysfs_path, "reset"))
+            in_reset = self.plat_comm.is_valid_value(reset) and reset.strip() == "1"
+            self.ports[sfp.index] = {"sfp": sfp, "state": self.STATE_RESET if in_reset else self.STATE_INIT,
+                                     "power": CommonCfg.SFP_BRINGUP_DEFAULT_POWER, "wave": None,
+                                     "released": None, "ready": None}
+        if not self.ports:
+            return {}
+
+        wave = 0
+        next_wave = start
+        while True:
+            now = time.monotonic()
+            self.__poll(now)
+            if all(port["state"] == self.STATE_READY for port in self.ports.values()):
+                break
+            if now - start >= self.timeout:
+                break
+            if now >= next_wave and self.__start_wave(now, wave + 1):
+                wave += 1
+                next_wave = now + self.wave_secs
+            time.sleep(CommonCfg.SFP_BRINGUP_POLL_SECS)
+
+        report = {}
+        for index, port in self.ports.items():
+            port["sfp"].invalidate_eeprom_cache()
+            report[index] = {
+                "state": port["state"],
+                "ready": port["state"] == self.STATE_READY,
+                "time_to_ready": None if port["ready"] is None else port["ready"] - start,
+                "power": port["power"],
+                "wave": port["wave"]
+            }
+        ready = [item["time_to_ready"] for item in report.values() if item["ready"]]
+        self.plat_comm.log_notice("sfp bring-up: {}/{} ready in {:.1f}s, {} waves", len(ready), len(report),
+                                  max(ready) if ready else time.monotonic() - start, wave)
+        return report
+
+
+class EepromReadPlanner(object):
+    """
+    Read planner of one transceiver. Requests are given as (page, offset,
+    length) like in the specs, grouped by page so optoe writes the page
+    select register once per page, and merged into the fewest contiguous
+    reads. Only overlapping or adjacent requests are merged, bytes between
+    two requests may be clear-on-read flags and are never read on the way.
+    """
+    PAGE_SIZE = 128
+
+    def __init__(self):
+        self.requests = []
+
+    @classmethod
+    def to_linear(cls, page, offset):
+        """
+        Optoe linear address of a paged offset, upper half of page N is
+        at (N + 1) * 128
+
+        Args:
+            page: int, None for flat addressing
+            offset: int, 0-127 lower page, 128-255 upper page
+
+        Returns:
+            int: linear address
+        """
+        if page is None or offset < cls.PAGE_SIZE:
+            return offset
+        return page * cls.PAGE_SIZE + offset
+
+    @classmethod
+    def get_page_key(cls, address):
+        """
+        Page select value needed to access a linear address, None for the
+        lower page which is always mapped
+        """
+        if address < cls.PAGE_SIZE:
+            return None
+        return address // cls.PAGE_SIZE - 1
+
+    def add(self, page, offset, length):
+        """
+        Add a request, must not cross the end of its page
+
+        Args:
+            page: int, None for flat addressing
+            offset: int, offset in the page
+            length: int
+
+        Returns:
+            tuple(page, offset, length): key of the result
+        """
+        request = (page, offset, length)
+        self.requests.append(request)
+        return request
+
+    def add_linear(self, address, length):
+        """
+        Add a request by optoe linear address
+
+        Returns:
+            tuple(page, offset, length): key of the result
+        """
+        page = self.get_page_key(address)
+        if page is None:
+            return self.add(None, address, length)
+        return self.add(page, address - page * self.PAGE_SIZE, length)
+
+    def get_reads(self):
+        """
+        Merge the requests, lower page first then pages in order
+
+        Returns:
+            list: tuple(linear address, length) of the reads to do
+        """
+        spans = []
+        for page, offset, length in self.requests:
+            start = self.to_linear(page, offset)
+            spans.append((self.get_page_key(start), start, start + length))
+        spans.sort(key=lambda span: (-1 if span[0] is None else span[0], span[1]))
+
+        reads = []
+        last = None
+        for page_key, start, end in spans:
+            if last is not None and last[0] == page_key and start <= last[2]:
+                last[2] = max(last[2], end)
+                continue
+            last = [page_key, start, end]
+            reads.append(last)
+        return [(start, end - start) for _, start, end in reads]
+
+    def execute(self, read_func):
+        """
+        Do the merged reads and split the data back to the requests
+
+        Args:
+            read_func: callable(address, length) -> bytearray or None
+
+        Returns:
+            tuple(results, chunks): dict of request -> bytearray (None for
+            Fail), list of tuple(linear address, bytearray) actually read
+        """
+        chunks = []
+        for start, length in self.get_reads():
+            data = read_func(start, length)
+            if data is not None and len(data) == length:
+                chunks.append((start, data))
+
+        results = {}
+        for request in self.requests:
+            page, offset, length = request
+            start = self.to_linear(page, offset)
+            results[request] = None
+            for chunk_start, data in chunks:
+                if chunk_start <= start and start + length <= chunk_start + len(data):
+                    results[request] = data[start - chunk_start:start - chunk_start + length]
+                    break
+        return results, chunks
+
+
 class Sfp(SfpOptoeBase):
     """Platform-specific SFP/XCVR class"""
 
+    # cage type of every port, read in one batch on first use
+    _cage_types = None
+    _cage_types_lock = threading.Lock()
+    # module identity -> (api class, eeprom class, memory map), shared by all ports
+    _xcvr_api_cache = {}
+    _xcvr_api_cache_lock = threading.Lock()
+    _xcvr_api_cache_stats = {"hits": 0, "misses": 0}
+
     def __init__(self, index):
         """Initialize sfp object
         Args:
@@ -78,16 +891,57 @@ class Sfp(SfpOptoeBase):
         self.plat_comm = PlatCommon(debug=CommonCfg.DEBUG)
         self.sysfs_path = os.path.join(CommonCfg.S3IP_SFP_PATH, "eth{}".format(self.index))
         self._old_presence = False
-        self.__init_cage_type()
+        self._cage_type_loaded = False
+        self._cage_type = None
         self._start_ms = 0
-
-    def __init_cage_type(self):
-        try:
-            cage_type_path = self.__get_file_path("type")
-            self.cage_type = self.plat_comm.read_file(cage_type_path)
-        except Exception as err:
-            self.plat_comm.log_error(str(err))
-            self.cage_type = None
+        # static eeprom page cache
+        self._eeprom_cache_lock = threading.Lock()
+        self._eeprom_cache = {}
+        self._eeprom_cache_ranges = None
+        self._eeprom_cache_generation = 0
+        self._eeprom_cache_identity = None
+        self._eeprom_cache_verified = 0
+        self._eeprom_cache_stats = {"hits": 0, "misses": 0, "bypass": 0, "invalidations": 0}
+        # last channel status registers, latched flags not yet returned
+        self._channel_status_lock = threading.Lock()
+        self._channel_status = None
+        self._channel_status_time = 0
+        self._channel_pending = {}
+        # data of the planned reads, served to the xcvr api of the same thread
+        self._prefetch_local = threading.local()
+        # eeprom attribute kept open for pread/pwrite, closed on plug event or error
+        self._eeprom_fd_lock = threading.Lock()
+        self._eeprom_fd = None
+
+    @classmethod
+    def __load_cage_types(cls, plat_comm):
+        with cls._cage_types_lock:
+            if cls._cage_types is None:
+                paths = {}
+                for index in range(1, DeviceCfg.SFP_NUM + 1):
+                    cage_type_path = os.path.join(CommonCfg.S3IP_SFP_PATH, "eth{}".format(index), "type")
+                    paths[cage_type_path] = index
+                values, _ = plat_comm.read_files(list(paths.keys()))
+                cls._cage_types = {index: values.get(path) for path, index in paths.items()}
+            return cls._cage_types
+
+    @property
+    def cage_type(self):
+        """
+        Cage type of the port, eg. "QSFP_DD", loaded on first use
+        """
+        if not self._cage_type_loaded:
+            try:
+                cage_types = self.__load_cage_types(self.plat_comm)
+                if self.index in cage_types:
+                    self._cage_type = cage_types.get(self.index)
+                else:
+                    self._cage_type = self.plat_comm.read_file(self.__get_file_path("type"))
+            except Exception as err:
+                self.plat_comm.log_error(str(err))
+                self._cage_type = None
+            self._cage_type_loaded = True
+        return self._cage_type
 
     def get_cage_type(self):
         """
@@ -162,6 +1016,11 @@ class Sfp(SfpOptoeBase):
         Returns:
             bool: True if SFP is present, False if not
         """
+        if self.index <= DeviceCfg.SFP_NUM:
+            bitmap = SfpPresenceBitmap.get(self.plat_comm)
+            if bitmap is not None:
+                return bool(bitmap >> (self.index - 1) & 1)
+
         try:
             presence_sysfs_path = self.__get_file_path("present")
             result = self.plat_comm.read_file(presence_sysfs_path)
@@ -172,27 +1031,238 @@ class Sfp(SfpOptoeBase):
 
         return False
 
-    def read_eeprom(self, offset, num_bytes):
+    def __open_eeprom(self):
+        """
+        Open the eeprom attribute once, read-only if it isn't writable
+        Caller must hold self._eeprom_fd_lock
+        """
+        if self._eeprom_fd is None:
+            try:
+                self._eeprom_fd = os.open(self.get_eeprom_path(), os.O_RDWR | os.O_CLOEXEC)
+            except PermissionError:
+                self._eeprom_fd = os.open(self.get_eeprom_path(), os.O_RDONLY | os.O_CLOEXEC)
+        return self._eeprom_fd
+
+    def __close_eeprom(self):
+        """
+        Close the kept eeprom descriptor, the next access opens it again
+        """
+        with self._eeprom_fd_lock:
+            if self._eeprom_fd is not None:
+                try:
+                    os.close(self._eeprom_fd)
+                except OSError:
+                    pass
+                self._eeprom_fd = None
+
+    def __eeprom_io_error(self, recover=True):
+        # the module may be gone or the i2c path rebuilt, don't keep the descriptor
+        self.__close_eeprom()
+        # if access sfp eeprom failed, the i2c clock maybe be pulled low always.
+        if recover and hasattr(hooks, "reset_pca9548"):
+            hooks.reset_pca9548(self.index)
+
+    def __read_eeprom_hw(self, offset, num_bytes, recover=True):
         try:
-            with open(self.get_eeprom_path(), mode='rb', buffering=0) as f:
-                f.seek(offset)
-                return bytearray(f.read(num_bytes))
+            with self._eeprom_fd_lock:
+                return bytearray(os.pread(self.__open_eeprom(), num_bytes, offset))
         except (OSError, IOError):
-            # if access sfp eeprom failed, the i2c clock maybe be pulled low always.
-            if hasattr(hooks, "reset_pca9548"):
-                hooks.reset_pca9548(self.index)
+            self.__eeprom_io_error(recover)
             return None
 
+    def probe_eeprom(self, offset, num_bytes):
+        """
+        Read the module without cache and without i2c recovery on failure,
+        for modules that may still be initializing and don't answer yet
+
+        Args:
+            offset: int, optoe linear address
+            num_bytes: int
+
+        Returns:
+            bytearray, None for Fail
+        """
+        return self.__read_eeprom_hw(offset, num_bytes, recover=False)
+
+    def __read_identity(self):
+        """
+        Returns:
+            bytes: identifier and vendor serial number read from the module, None for Fail
+        """
+        identifier = self.__read_eeprom_hw(0, 1)
+        if not identifier:
+            return None
+        field = EEPROM_SERIAL_FIELDS.get(identifier[0])
+        if field is None:
+            return bytes(identifier)
+        serial = self.__read_eeprom_hw(field[0], field[1])
+        if serial is None or len(serial) != field[1]:
+            return None
+        return bytes(identifier + serial)
+
+    def __get_static_ranges(self):
+        with self._eeprom_cache_lock:
+            ranges = self._eeprom_cache_ranges
+            generation = self._eeprom_cache_generation
+        if ranges is not None:
+            return ranges
+
+        identity = self.__read_identity()
+        if not identity:
+            return None
+        ranges = EEPROM_STATIC_RANGES.get(identity[0], ())
+        with self._eeprom_cache_lock:
+            if generation == self._eeprom_cache_generation:
+                self._eeprom_cache_ranges = ranges
+                self._eeprom_cache_identity = identity
+                self._eeprom_cache_verified = time.monotonic()
+        return ranges
+
+    def __verify_static_cache(self):
+        """
+        Drop the cache if the plugged module isn't the one it was filled
+        from. Only xcvrd sees the plug events, so every process reads the
+        identifier and serial number back from the module, at most every
+        CommonCfg.SFP_EEPROM_CACHE_VERIFY_SECS
+        """
+        with self._eeprom_cache_lock:
+            identity = self._eeprom_cache_identity
+            generation = self._eeprom_cache_generation
+            if identity is None or \
+                    time.monotonic() - self._eeprom_cache_verified < CommonCfg.SFP_EEPROM_CACHE_VERIFY_SECS:
+                return
+
+        if self.__read_identity() == identity:
+            with self._eeprom_cache_lock:
+                if generation == self._eeprom_cache_generation:
+                    self._eeprom_cache_verified = time.monotonic()
+            return
+
+        self.plat_comm.log_info("SFP{} module changed, drop cached eeprom", self.index)
+        self._xcvr_api = None
+        self.invalidate_eeprom_cache()
+
+    def __get_static_range(self, static_range):
+        with self._eeprom_cache_lock:
+            data = self._eeprom_cache.get(static_range)
+            generation = self._eeprom_cache_generation
+            if data is not None:
+                self._eeprom_cache_stats["hits"] += 1
+                return data
+            self._eeprom_cache_stats["misses"] += 1
+
+        data = self.__read_eeprom_hw(static_range[0], static_range[1] - static_range[0])
+        if data is None or len(data) != static_range[1] - static_range[0]:
+            return data
+        with self._eeprom_cache_lock:
+            # don't keep data of a module that was unplugged meanwhile
+            if generation == self._eeprom_cache_generation:
+                self._eeprom_cache[static_range] = data
+        return data
+
+    def invalidate_eeprom_cache(self):
+        """
+        Drop the cached eeprom pages, eg. on plug event or reset
+        """
+        with self._eeprom_cache_lock:
+            self._eeprom_cache = {}
+            self._eeprom_cache_ranges = None
+            self._eeprom_cache_identity = None
+            self._eeprom_cache_generation += 1
+            self._eeprom_cache_stats["invalidations"] += 1
+        with self._channel_status_lock:
+            self._channel_status = None
+            self._channel_pending = {}
+        self.__close_eeprom()
+
+    def get_eeprom_cache_stats(self):
+        """
+        Retrieves the eeprom page cache counters of this port
+
+        Returns:
+            dict: hits, misses, bypass, invalidations
+        """
+        with self._eeprom_cache_lock:
+            return dict(self._eeprom_cache_stats)
+
+    def read_eeprom(self, offset, num_bytes, bypass_cache=False):
+        """
+        Read the transceiver eeprom, static ranges (identity, vendor info,
+        thresholds) are served from the page cache
+
+        Args:
+            offset: int, optoe linear address
+            num_bytes: int
+            bypass_cache: bool, read everything from the module
+
+        Returns:
+            bytearray, None for Fail
+        """
+        for start, data in getattr(self._prefetch_local, "chunks", ()):
+            if start <= offset and offset + num_bytes <= start + len(data):
+                return data[offset - start:offset - start + num_bytes]
+
+        if bypass_cache:
+            with self._eeprom_cache_lock:
+                self._eeprom_cache_stats["bypass"] += 1
+            return self.__read_eeprom_hw(offset, num_bytes)
+
+        if self._eeprom_cache and not self.get_presence():
+            self.invalidate_eeprom_cache()
+        self.__verify_static_cache()
+
+        ranges = self.__get_static_ranges()
+        if not ranges:
+            return self.__read_eeprom_hw(offset, num_bytes)
+
+        result = bytearray()
+        pos = offset
+        end = offset + num_bytes
+        while pos < end:
+            static_range = None
+            for item in ranges:
+                if item[0] <= pos < item[1]:
+                    static_range = item
+                    break
+            if static_range is None:
+                # volatile bytes up to the next static range
+                stop = min([item[0] for item in ranges if item[0] > pos] + [end])
+                data = self.__read_eeprom_hw(pos, stop - pos)
+            else:
+                stop = min(end, static_range[1])
+                data = self.__get_static_range(static_range)
+                if data is not None:
+                    data = data[pos - static_range[0]:stop - static_range[0]]
+            if data is None:
+                return None
+            result += data
+            if len(data) != stop - pos:
+                break
+            pos = stop
+        return result
+
+    def __drop_channel_status(self):
+        """
+        Read the channel status registers again on next access, eg. after a
+        control write, latched flags not yet returned are kept
+        """
+        with self._channel_status_lock:
+            self._channel_status = None
+
     def write_eeprom(self, offset, num_bytes, write_buffer):
+        self._prefetch_local.chunks = ()
+        with self._eeprom_cache_lock:
+            for static_range in list(self._eeprom_cache.keys()):
+                if offset < static_range[1] and static_range[0] < offset + num_bytes:
+                    del self._eeprom_cache[static_range]
         try:
-            with open(self.get_eeprom_path(), mode='r+b', buffering=0) as f:
-                f.seek(offset)
-                f.write(write_buffer[0:num_bytes])
+            with self._eeprom_fd_lock:
+                os.pwrite(self.__open_eeprom(), bytes(write_buffer[0:num_bytes]), offset)
         except (OSError, IOError):
-            # if access sfp eeprom failed, the i2c clock maybe be pulled low always.
-            if hasattr(hooks, "reset_pca9548"):
-                hooks.reset_pca9548(self.index)
+            self.__eeprom_io_error()
             return False
+        finally:
+            self.__drop_channel_status()
         return True
 
     def get_transceiver_info(self):
@@ -206,15 +1276,61 @@ class Sfp(SfpOptoeBase):
             self.plat_comm.log_error(str(error))
         return None
 
+    def __keep_prefetched_flags(self, chunks):
+        """
+        The module clears latched lane flags once they are read, merge the
+        ones a planned pass read into the pending flags the way
+        __read_channel_status does, whether the xcvr api uses them or not
+        """
+        if self.sfp_type is None:
+            self.refresh_xcvr_api()
+        if self.sfp_type not in CHANNEL_STATUS_LAYOUT:
+            return
+
+        _, blocks = CHANNEL_STATUS_LAYOUT[self.sfp_type]
+        with self._channel_status_lock:
+            for offset, width, fields in blocks:
+                for start, data in chunks:
+                    if start <= offset and offset + width <= start + len(data):
+                        for field, position in fields:
+                            if field in CHANNEL_STATUS_LATCHED_FIELDS:
+                                value = data[offset - start + position]
+                                self._channel_pending[field] = self._channel_pending.get(field, 0) | value
+                        break
+
+    def __call_with_prefetch(self, read_plans, func):
+        """
+        Do the planned reads of the module type in one pass, then call
+        func with the xcvr api served from that data in this thread
+        """
+        identifier = self.read_eeprom(0, 1)
+        if not identifier or identifier[0] not in read_plans:
+            return func()
+
+        planner = EepromReadPlanner()
+        for page, offset, length in read_plans[identifier[0]]:
+            planner.add(page, offset, length)
+        _, chunks = planner.execute(self.read_eeprom)
+        self.__keep_prefetched_flags(chunks)
+        self._prefetch_local.chunks = chunks
+        try:
+            return func()
+        finally:
+            self._prefetch_local.chunks = ()
+
     def get_transceiver_bulk_status(self):
         # temporary record sfp temperature into s3ip-sysfs cache
-        transceiver_bulk_status = super().get_transceiver_bulk_status()
+        transceiver_bulk_status = self.__call_with_prefetch(BULK_STATUS_READS,
+                                                            super().get_transceiver_bulk_status)
         if transceiver_bulk_status and transceiver_bulk_status["temperature"] is not None:
             sfp_temp_sysfs_path = os.path.join(self.sysfs_path, "temp1", "value")
             self.plat_comm.write_file(sfp_temp_sysfs_path, transceiver_bulk_status["temperature"])
 
         return transceiver_bulk_status
 
+    def get_transceiver_threshold_info(self):
+        return self.__call_with_prefetch(THRESHOLD_READS, super().get_transceiver_threshold_info)
+
     def get_temperature_cache(self):
         """
         Retrieves the sfp/qsfp temperature from S3IP sysfs
@@ -282,6 +1398,7 @@ class Sfp(SfpOptoeBase):
             time.sleep(0.5)
             ret = self._set_reset(False)
         self._set_write_enable(True)
+        self.invalidate_eeprom_cache()
         return ret
 
     def set_reset(self, reset):
@@ -362,59 +1479,118 @@ class Sfp(SfpOptoeBase):
         self._set_write_enable(True)
         return ret
 
-    def get_rx_los(self):
+    def __read_channel_status(self):
         """
-        Retrieves the RX LOS (loss-of-signal) status of SFP
+        Read the channel status registers of the module type
 
         Returns:
-            A list of boolean values, representing the RX LOS status
-            of each available channel, value is True if SFP channel
-            has RX LOS, False if not.
-            E.g., for a tranceiver with four channels: [False, False, True, False]
-            Note : RX LOS status is latched until a call to get_rx_los or a reset.
+            dict: field -> register value (int) or sysfs value, None for Fail
         """
+        raw = {}
+        if self.sfp_type in CHANNEL_STATUS_LAYOUT:
+            _, blocks = CHANNEL_STATUS_LAYOUT[self.sfp_type]
+            planner = EepromReadPlanner()
+            requests = [(planner.add_linear(offset, width), fields) for offset, width, fields in blocks]
+            results, _ = planner.execute(self.read_eeprom)
+            for request, fields in requests:
+                data = results.get(request)
+                if data is None:
+                    self.plat_comm.log_info("{} channel status raw is None", self.sfp_type)
+                    return None
+                for field, position in fields:
+                    raw[field] = data[position]
+        elif self.sfp_type == SFP_TYPE:
+            paths = {self.__get_file_path(field): field for field in CHANNEL_STATUS_FIELDS}
+            values, _ = self.plat_comm.read_files_typed(list(paths.keys()), int)
+            for file_path, field in paths.items():
+                if values.get(file_path) is not None:
+                    raw[field] = values.get(file_path)
+
+        with self._channel_status_lock:
+            if self._channel_status is not None and self._channel_status[0] != self.sfp_type:
+                self._channel_pending = {}
+            for field in CHANNEL_STATUS_LATCHED_FIELDS:
+                if field in raw:
+                    self._channel_pending[field] = self._channel_pending.get(field, 0) | raw[field]
+            self._channel_status = (self.sfp_type, raw)
+            self._channel_status_time = time.monotonic()
+        return raw
+
+    def __decode_channel_field(self, value):
+        if value is None:
+            return []
+        if self.sfp_type in CHANNEL_STATUS_LAYOUT:
+            lanes, _ = CHANNEL_STATUS_LAYOUT[self.sfp_type]
+            return list(LANE_FLAG_TABLES[lanes][value])
+        return [value == 1]
+
+    def __get_channel_field(self, field):
         if not self.get_presence():
             return [False]
 
         if self.sfp_type is None:
             self.refresh_xcvr_api()
 
-        rx_los_list = []
-        if self.sfp_type == QSFP_TYPE:
-            rx_los_raw = self.read_eeprom(QSFP_CHANNL_RX_LOS_STATUS_OFFSET, QSFP_CHANNL_RX_LOS_STATUS_WIDTH)
-            if rx_los_raw is None:
-                self.plat_comm.log_info("QSFP rx_los_raw is None")
-                return None
-            rx_los_data = struct.unpack("B", rx_los_raw)[0]
-            rx_los_list.append(rx_los_data & 0x01 != 0)
-            rx_los_list.append(rx_los_data & 0x02 != 0)
-            rx_los_list.append(rx_los_data & 0x04 != 0)
-            rx_los_list.append(rx_los_data & 0x08 != 0)
-        elif self.sfp_type == QSFP_DD_TYPE:
-            rx_los_raw = self.read_eeprom(QSFP_DD_CHANNEL_RX_LOS_STATUS_OFFSET, QSFP_DD_CHANNEL_RX_LOS_STATUS_WIDTH)
-            if rx_los_raw is None:
-                self.plat_comm.log_info("QSFP-DD rx_los_raw is None")
-                return None
-            rx_los_data = struct.unpack("B", rx_los_raw)[0]
-            rx_los_list.append(rx_los_data & 0x01 != 0)
-            rx_los_list.append(rx_los_data & 0x02 != 0)
-            rx_los_list.append(rx_los_data & 0x04 != 0)
-            rx_los_list.append(rx_los_data & 0x08 != 0)
-            rx_los_list.append(rx_los_data & 0x10 != 0)
-            rx_los_list.append(rx_los_data & 0x20 != 0)
-            rx_los_list.append(rx_los_data & 0x40 != 0)
-            rx_los_list.append(rx_los_data & 0x80 != 0)
-        elif self.sfp_type == SFP_TYPE:
-            try:
-                sysfs_path = self.__get_file_path("rx_los")
-                result = self.plat_comm.read_file(sysfs_path)
-                if self.plat_comm.is_valid_value(result):
-                    rx_los_list.append(int(result) == 1)
-            except Exception as err:
-                self.plat_comm.log_error(str(err))
+        raw = None
+        with self._channel_status_lock:
+            if self._channel_status is not None and self._channel_status[0] == self.sfp_type and \
+                    time.monotonic() - self._channel_status_time < CommonCfg.SFP_CHANNEL_STATUS_CACHE_SECS and \
+                    (field not in CHANNEL_STATUS_LATCHED_FIELDS or field in self._channel_pending):
+                raw = self._channel_status[1]
+        if raw is None:
+            raw = self.__read_channel_status()
+            if raw is None:
                 return None
 
-        return rx_los_list
+        with self._channel_status_lock:
+            value = raw.get(field)
+            if field in CHANNEL_STATUS_LATCHED_FIELDS:
+                value = self._channel_pending.pop(field, value)
+        return self.__decode_channel_field(value)
+
+    def get_channel_status(self):
+        """
+        Retrieves rx_los, tx_fault and tx_disable of all channels, the
+        registers are read with as few eeprom accesses as the module type
+        allows. Latched flags include events since the last call of this
+        function or of the single field getter
+
+        Returns:
+            dict: {"rx_los": [bool, ...], "tx_fault": [...], "tx_disable": [...]},
+                  lists are empty if the module type doesn't support them,
+                  None for Fail
+        """
+        if not self.get_presence():
+            return {field: [False] for field in CHANNEL_STATUS_FIELDS}
+
+        if self.sfp_type is None:
+            self.refresh_xcvr_api()
+
+        raw = self.__read_channel_status()
+        if raw is None:
+            return None
+
+        status = {}
+        with self._channel_status_lock:
+            for field in CHANNEL_STATUS_FIELDS:
+                value = raw.get(field)
+                if field in CHANNEL_STATUS_LATCHED_FIELDS:
+                    value = self._channel_pending.pop(field, value)
+                status[field] = self.__decode_channel_field(value)
+        return status
+
+    def get_rx_los(self):
+        """
+        Retrieves the RX LOS (loss-of-signal) status of SFP
+
+        Returns:
+            A list of boolean values, representing the RX LOS status
+            of each available channel, value is True if SFP channel
+            has RX LOS, False if not.
+            E.g., for a tranceiver with four channels: [False, False, True, False]
+            Note : RX LOS status is latched until a call to get_rx_los or a reset.
+        """
+        return self.__get_channel_field("rx_los")
 
     def get_tx_fault(self):
         """
@@ -427,49 +1603,7 @@ class Sfp(SfpOptoeBase):
             E.g., for a tranceiver with four channels: [False, False, True, False]
             Note : TX fault status is lached until a call to get_tx_fault or a reset.
         """
-        if not self.get_presence():
-            return [False]
-
-        if self.sfp_type is None:
-            self.refresh_xcvr_api()
-
-        tx_fault_list = []
-        if self.sfp_type == QSFP_TYPE:
-            tx_fault_raw = self.read_eeprom(QSFP_CHANNL_TX_FAULT_STATUS_OFFSET, QSFP_CHANNL_TX_FAULT_STATUS_WIDTH)
-            if tx_fault_raw is None:
-                self.plat_comm.log_info("QSFP tx_fault_raw is None")
-                return None
-            tx_fault_data = struct.unpack("B", tx_fault_raw)[0]
-            tx_fault_list.append(tx_fault_data & 0x01 != 0)
-            tx_fault_list.append(tx_fault_data & 0x02 != 0)
-            tx_fault_list.append(tx_fault_data & 0x04 != 0)
-            tx_fault_list.append(tx_fault_data & 0x08 != 0)
-        elif self.sfp_type == QSFP_DD_TYPE:
-            tx_fault_raw = self.read_eeprom(QSFP_DD_CHANNEL_TX_FAULT_STATUS_OFFSET,
-                                            QSFP_DD_CHANNEL_TX_FAULT_STATUS_WIDTH)
-            if tx_fault_raw is None:
-                self.plat_comm.log_info("QSFP-DD tx_fault_raw is None")
-                return None
-            tx_fault_data = struct.unpack("B", tx_fault_raw)[0]
-            tx_fault_list.append(tx_fault_data & 0x01 != 0)
-            tx_fault_list.append(tx_fault_data & 0x02 != 0)
-            tx_fault_list.append(tx_fault_data & 0x04 != 0)
-            tx_fault_list.append(tx_fault_data & 0x08 != 0)
-            tx_fault_list.append(tx_fault_data & 0x10 != 0)
-            tx_fault_list.append(tx_fault_data & 0x20 != 0)
-            tx_fault_list.append(tx_fault_data & 0x40 != 0)
-            tx_fault_list.append(tx_fault_data & 0x80 != 0)
-        elif self.sfp_type == SFP_TYPE:
-            try:
-                sysfs_path = self.__get_file_path("tx_fault")
-                result = self.plat_comm.read_file(sysfs_path)
-                if self.plat_comm.is_valid_value(result):
-                    tx_fault_list.append(int(result) == 1)
-            except Exception as err:
-                self.plat_comm.log_error(str(err))
-                return None
-
-        return tx_fault_list
+        return self.__get_channel_field("tx_fault")
 
     def get_tx_disable(self):
         """
@@ -481,51 +1615,7 @@ class Sfp(SfpOptoeBase):
             is TX disabled, False if not.
             E.g., for a tranceiver with four channels: [False, False, True, False]
         """
-        if not self.get_presence():
-            return [False]
-
-        if self.sfp_type is None:
-            self.refresh_xcvr_api()
-
-        tx_disable_list = []
-        if self.sfp_type == QSFP_TYPE:
-            tx_disable_raw = self.read_eeprom(QSFP_CHANNL_DISABLE_STATUS_OFFSET, QSFP_CHANNL_DISABLE_STATUS_WIDTH)
-            if tx_disable_raw is None:
-                self.plat_comm.log_info("QSFP tx_disable_raw is None")
-                return None
-            tx_disable_data = struct.unpack("B", tx_disable_raw)[0]
-            tx_disable_list.append(tx_disable_data & 0x01 != 0)
-            tx_disable_list.append(tx_disable_data & 0x02 != 0)
-            tx_disable_list.append(tx_disable_data & 0x04 != 0)
-            tx_disable_list.append(tx_disable_data & 0x08 != 0)
-
-        elif self.sfp_type == QSFP_DD_TYPE:
-            tx_disable_raw = self.read_eeprom(QSFP_DD_CHANNEL_TX_DISABLE_STATUS_OFFSET,
-                                              QSFP_DD_CHANNEL_TX_DISABLE_STATUS_WIDTH)
-            if tx_disable_raw is None:
-                self.plat_comm.log_info("QSFP-DD tx_disable_raw is None")
-                return None
-            tx_disable_data = struct.unpack("B", tx_disable_raw)[0]
-            tx_disable_list.append(tx_disable_data & 0x01 != 0)
-            tx_disable_list.append(tx_disable_data & 0x02 != 0)
-            tx_disable_list.append(tx_disable_data & 0x04 != 0)
-            tx_disable_list.append(tx_disable_data & 0x08 != 0)
-            tx_disable_list.append(tx_disable_data & 0x10 != 0)
-            tx_disable_list.append(tx_disable_data & 0x20 != 0)
-            tx_disable_list.append(tx_disable_data & 0x40 != 0)
-            tx_disable_list.append(tx_disable_data & 0x80 != 0)
-
-        elif self.sfp_type == SFP_TYPE:
-            try:
-                sysfs_path = self.__get_file_path("tx_disable")
-                result = self.plat_comm.read_file(sysfs_path)
-                if self.plat_comm.is_valid_value(result):
-                    tx_disable_list.append(int(result) == 1)
-            except Exception as err:
-                self.plat_comm.log_error(str(err))
-                return None
-
-        return tx_disable_list
+        return self.__get_channel_field("tx_disable")
 
     def tx_disable(self, tx_disable):
         """
@@ -572,13 +1662,72 @@ class Sfp(SfpOptoeBase):
         self.plat_comm.log_info("set_optoe_write_max NotImplemented")
         return False
 
+    def __get_xcvr_api_key(self):
+        """
+        Read the module identity, served from the static eeprom cache
+
+        Returns:
+            tuple(identifier, revision, vendor OUI, vendor PN), None if the
+            module type isn't memoized or the read failed
+        """
+        identifier = self.read_eeprom(0, 1)
+        if not identifier or identifier[0] not in XCVR_API_KEY_FIELDS:
+            return None
+        key = [identifier[0]]
+        for offset, width in XCVR_API_KEY_FIELDS[identifier[0]]:
+            data = self.read_eeprom(offset, width)
+            if data is None or len(data) != width:
+                return None
+            key.append(bytes(data))
+        return tuple(key)
+
+    def __create_xcvr_api(self):
+        key = self.__get_xcvr_api_key()
+        if key is not None:
+            with self._xcvr_api_cache_lock:
+                entry = self._xcvr_api_cache.get(key)
+            if entry is not None:
+                api_class, eeprom_class, mem_map = entry
+                try:
+                    api = api_class(eeprom_class(self._xcvr_api_factory.reader,
+                                                 self._xcvr_api_factory.writer, mem_map))
+                    with self._xcvr_api_cache_lock:
+                        self._xcvr_api_cache_stats["hits"] += 1
+                    return api
+                except Exception as err:
+                    self.plat_comm.log_warning("{} cached xcvr api error:{}", self.get_name(), err)
+
+        api = self._xcvr_api_factory.create_xcvr_api()
+        xcvr_eeprom = getattr(api, "xcvr_eeprom", None)
+        mem_map = getattr(xcvr_eeprom, "mem_map", None)
+        with self._xcvr_api_cache_lock:
+            self._xcvr_api_cache_stats["misses"] += 1
+            if key is not None and mem_map is not None and \
+                    len(self._xcvr_api_cache) < XCVR_API_CACHE_ENTRIES:
+                self._xcvr_api_cache[key] = (api.__class__, xcvr_eeprom.__class__, mem_map)
+        return api
+
     def refresh_xcvr_api(self):
         """
-        Updates the XcvrApi associated with this SFP
+        Updates the XcvrApi associated with this SFP, a module type seen
+        before reuses the api class and memory map without probing
         """
-        self._xcvr_api = self._xcvr_api_factory.create_xcvr_api()
+        self._xcvr_api = self.__create_xcvr_api()
         self.refresh_sfp_type(self._xcvr_api.__class__.__name__)
 
+    @classmethod
+    def get_xcvr_api_cache_stats(cls):
+        """
+        Retrieves the counters of the process-wide xcvr api cache
+
+        Returns:
+            dict: hits, misses, entries
+        """
+        with cls._xcvr_api_cache_lock:
+            stats = dict(cls._xcvr_api_cache_stats)
+            stats["entries"] = len(cls._xcvr_api_cache)
+        return stats
+
     def get_error_description(self):
         """
         Retrives the error descriptions of the SFP module
@@ -593,10 +1742,16 @@ class Sfp(SfpOptoeBase):
 
         return self.SFP_STATUS_OK
 
-    def get_change_event(self):
+    def get_change_event(self, presence=None, plug_record=None, stable_ms=None):
         """
         Returns a nested dictionary containing sfp devices which have experienced a change
 
+        Args:
+            presence: bool, presence already read by an event source, None to read it
+            plug_record: bool, plug record already read by an event source, None to read it
+            stable_ms: float, time in ms the port was last seen unchanged, given by an
+                       event source that doesn't call this method on every scan
+
         Returns:
             -----------------------------------------------------------------
             device   |     device_id       |  device_event  |  annotate
@@ -611,8 +1766,11 @@ class Sfp(SfpOptoeBase):
                                               '7'              Sfp ok
         """
         now_ms = time.time() * 1000
-        new_presence = self.get_presence()
-        plug_record = self.get_plug_record()
+        if stable_ms is not None:
+            self._start_ms = stable_ms
+        new_presence = self.get_presence() if presence is None else presence
+        if plug_record is None:
+            plug_record = self.get_plug_record()
         if hasattr(hooks, "sfp_change_event_delay"):
             hooks.sfp_change_event_delay()
         if self._old_presence != new_presence or plug_record:
@@ -621,11 +1779,13 @@ class Sfp(SfpOptoeBase):
                     self._old_presence = new_presence
                     self.plat_comm.log_notice('SFP{} is present'.format(self.index))
                     self._xcvr_api = None
+                    self.invalidate_eeprom_cache()
                     return True, {"sfp": {self.index - 1: "1"}}
             else:
                 self._old_presence = new_presence
                 self.plat_comm.log_notice('SFP{} is absent'.format(self.index))
                 self._xcvr_api = None
+                self.invalidate_eeprom_cache()
                 return True, {"sfp": {self.index - 1: "0"}}
         else:
             self._start_ms = now_ms
@@ -669,6 +1829,8 @@ class Sfp(SfpOptoeBase):
             return self.plat_comm.write_file(sysfs_path, result)
         except Exception as err:
             self.plat_comm.log_error(str(err))
+        finally:
+            self.__drop_channel_status()
         return False
 
     def __get_file_path(self, file_name):
@@ -941,3 +2103,198 @@ class Sfp(SfpOptoeBase):
             A boolean value, True if device is operating properly, False if not
         """
         return self.get_presence()
+
+
+class SfpPresenceMonitor(object):
+    """
+    Event source of transceiver plug events for Chassis.get_change_event.
+
+    Each port's present attribute is kept open and waited on with
+    poll(POLLPRI), which wakes up on sysfs_notify() from the driver (or on
+    the optional CPLD interrupt attribute DeviceCfg.SFP_INTERRUPT_PATH).
+    Drivers that don't notify are covered by a bitmap poll of the kept-open
+    attributes. Only ports whose presence or plug record changed, or which
+    wait for the SFP_INSERT_DELAY_MS debounce, go through Sfp.get_change_event.
+    """
+
+    def __init__(self, sfp_list, plat_comm):
+        """
+        Args:
+            sfp_list: list of Sfp objects
+            plat_comm: PlatCommon object
+        """
+        self.sfp_list = sfp_list
+        self.plat_comm = plat_comm
+        self.poller = select.poll()
+        # fd -> sfp list index, None for the interrupt attribute
+        self.fd_index = {}
+        self.present_fds = {}
+        self.notify_seen = False
+        self.presence = None
+        self.reported = 0
+        self.pending = set()
+        self.last_scan = 0
+        self.__register()
+
+    def __register(self):
+        watch = []
+        for index, sfp in enumerate(self.sfp_list):
+            watch.append((index, os.path.join(sfp.sysfs_path, "present")))
+        interrupt_path = getattr(DeviceCfg, "SFP_INTERRUPT_PATH", None)
+        if interrupt_path:
+            watch.append((None, interrupt_path))
+
+        for index, path in watch:
+            try:
+                fd = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+            except OSError:
+                continue
+            try:
+                # reading arms sysfs notification
+                os.pread(fd, 64, 0)
+            except OSError:
+                pass
+            self.fd_index[fd] = index
+            if index is not None:
+                self.present_fds[index] = fd
+            if CommonCfg.SFP_EVENT_MODE == CommonCfg.SFP_EVENT_MODE_AUTO:
+                self.poller.register(fd, select.POLLPRI | select.POLLERR)
+
+    def close(self):
+        """
+        Close all watched attributes
+        """
+        for fd in self.fd_index:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self.fd_index = {}
+        self.present_fds = {}
+
+    def __read_presence(self, index):
+        fd = self.present_fds.get(index)
+        if fd is not None:
+            try:
+                value = os.pread(fd, 64, 0).decode("utf-8").strip()
+                return self.plat_comm.is_valid_value(value) and int(value) == 1
+            except (OSError, ValueError):
+                pass
+        return self.sfp_list[index].get_presence()
+
+    def __scan(self):
+        """
+        Returns:
+            tuple(presence bitmap, set of ports with plug record)
+        """
+        presence = SfpPresenceBitmap.get(self.plat_comm, max_age=0)
+        if presence is None:
+            presence = 0
+            for index in range(len(self.sfp_list)):
+                if self.__read_presence(index):
+                    presence |= 1 << index
+
+        paths = [os.path.join(sfp.sysfs_path, "plug_record") for sfp in self.sfp_list]
+        values, _ = self.plat_comm.read_files_typed(paths, int)
+        plugged = set()
+        for index, path in enumerate(paths):
+            if values.get(path) == 1:
+                plugged.add(index)
+        return presence, plugged
+
+    def __check(self, candidates, plugged):
+        """
+        Args:
+            candidates: dict, sfp list index -> time in ms the port was last seen unchanged
+            plugged: set, ports with plug record
+
+        Returns:
+            dict: {sfp list index: '0' or '1'}
+        """
+        events = {}
+        for index in sorted(candidates):
+            present = bool(self.presence >> index & 1)
+            # the debounce start time is only handed over when the change is first seen
+            stable_ms = None if index in self.pending else candidates[index]
+            ret, event = self.sfp_list[index].get_change_event(present, index in plugged, stable_ms)
+            if ret:
+                events.update(event["sfp"])
+                if present:
+                    self.reported |= 1 << index
+                else:
+                    self.reported &= ~(1 << index)
+                self.pending.discard(index)
+            elif present != bool(self.reported >> index & 1) or index in plugged:
+                self.pending.add(index)
+            else:
+                self.pending.discard(index)
+        return events
+
+    def wait(self, max_wait, scantime):
+        """
+        Wait for transceiver plug events
+
+        Args:
+            max_wait: float, seconds to wait at most, None to wait until an event
+            scantime: float, bitmap poll interval if the driver doesn't notify
+
+        Returns:
+            dict: {sfp list index: '0' or '1'}, empty on timeout
+        """
+        start = time.monotonic()
+        if self.presence is None:
+            # first call reports all present ports, as the per-port scan did
+            self.presence, plugged = self.__scan()
+            self.last_scan = time.monotonic()
+            events = self.__check(dict.fromkeys(range(len(self.sfp_list))), plugged)
+            if events:
+                return events
+
+        while True:
+            now = time.monotonic()
+            interval = scantime
+            if self.notify_seen and not self.pending:
+                interval = max(scantime, CommonCfg.SFP_NOTIFY_RESCAN_SECS)
+            wait_secs = max(0, self.last_scan + interval - now)
+            if max_wait is not None:
+                wait_secs = min(wait_secs, max(0, start + max_wait - now))
+
+            if self.fd_index and CommonCfg.SFP_EVENT_MODE == CommonCfg.SFP_EVENT_MODE_AUTO:
+                ready = self.poller.poll(wait_secs * 1000)
+            else:
+                time.sleep(wait_secs)
+                ready = []
+
+            now_ms = time.time() * 1000
+            candidates = dict.fromkeys(self.pending)
+            plugged = set()
+            full_scan = time.monotonic() >= self.last_scan + interval
+            for fd, _ in ready:
+                self.notify_seen = True
+                index = self.fd_index.get(fd)
+                if index is None:
+                    # interrupt attribute, re-arm and scan all ports
+                    os.pread(fd, 64, 0)
+                    full_scan = True
+                    continue
+                if self.__read_presence(index) != bool(self.presence >> index & 1):
+                    self.presence ^= 1 << index
+                    candidates[index] = now_ms
+                    SfpPresenceBitmap.invalidate()
+
+            if full_scan:
+                # ports changed since the previous scan
+                last_scan_ms = now_ms - (time.monotonic() - self.last_scan) * 1000
+                presence, plugged = self.__scan()
+                self.last_scan = time.monotonic()
+                changed = SfpPresenceBitmap.get_changed_ports(self.presence, presence)
+                self.presence = presence
+                for index in set(changed) | plugged:
+                    if index < len(self.sfp_list) and index not in candidates:
+                        candidates[index] = last_scan_ms
+
+            events = self.__check(candidates, plugged) if candidates else {}
+            if events:
+                return events
+            if max_wait is not None and time.monotonic() - start >= max_wait:
+                return {}
@@ -10,13 +10,15 @@ try:
     from sonic_platform_base.thermal_base import ThermalBase
     from sonic_platform.plat_common import PlatCommon
     from sonic_platform.plat_common import CommonCfg
+    from sonic_platform.plat_common import RecordedReadings
     from vendor_sonic_platform import hooks
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found") from e
 
 
-class Thermal(ThermalBase):
+class Thermal(RecordedReadings, ThermalBase):
     """Platform-specific Thermal class"""
+    RECORDED_READINGS = ("temperature",)
 
     def __init__(self, name, slot_index, thermal_index, method="sysfs"):
         """
@@ -33,7 +35,6 @@ class Thermal(ThermalBase):
         self.index = thermal_index
         self.method = method
         self.sysfs_path = None
-        self.temperature_list = []
         self.plat_common = PlatCommon(debug=CommonCfg.DEBUG)
         self._old_status = False
         if self.method == CommonCfg.BY_SYSFS:
@@ -83,11 +84,7 @@ class Thermal(ThermalBase):
                 else:
                     value = self.__get_temperature_by_cache()
 
-            # temperature cache
-            if len(self.temperature_list) >= 100:
-                del self.temperature_list[0]
-            if value is not None:
-                self.temperature_list.append(value)
+            self.record_reading("temperature", value)
 
             return value
         except Exception as error:
@@ -280,30 +277,6 @@ class Thermal(ThermalBase):
         """
         return False
 
-    def get_minimum_recorded(self):
-        """
-        Retrieves the minimum recorded temperature of thermal
-
-        Returns:
-            A float number, the minimum recorded temperature of thermal in Celsius
-            up to nearest thousandth of one degree Celsius, e.g. 30.125
-        """
-        if len(self.temperature_list) == 0:
-            return self.get_temperature()
-        return min(self.temperature_list)
-
-    def get_maximum_recorded(self):
-        """
-        Retrieves the maximum recorded temperature of thermal
-
-        Returns:
-            A float number, the maximum recorded temperature of thermal in Celsius
-            up to nearest thousandth of one degree Celsius, e.g. 30.125
-        """
-        if len(self.temperature_list) == 0:
-            return self.get_temperature()
-        return max(self.temperature_list)
-
     def get_change_event(self):
         """
         Returns a nested dictionary containing thermal devices which have experienced a change
@@ -9,12 +9,14 @@ try:
     import os.path
     from sonic_platform.plat_common import PlatCommon
     from sonic_platform.plat_common import CommonCfg
+    from sonic_platform.plat_common import RecordedReadings
 except ImportError as e:
     raise ImportError(str(e) + "- required module not found") from e
 
 
-class Voltage(object):
+class Voltage(RecordedReadings):
     """Platform-specific Voltage class"""
+    RECORDED_READINGS = ("voltage",)
 
     def __init__(self, name, slot_index, voltage_index, method="sysfs"):
         """
@@ -77,11 +79,13 @@ class Voltage(object):
             of one Volts, e.g. 3.325
         """
         if self.method == CommonCfg.BY_SYSFS:
-            return self.__get_voltage_by_sysfs()
-        if self.method == CommonCfg.BY_RESTFUL:
-            return self.__get_voltage_by_restful()
-
-        return self.__get_voltage_by_cache()
+            value = self.__get_voltage_by_sysfs()
+        elif self.method == CommonCfg.BY_RESTFUL:
+            value = self.__get_voltage_by_restful()
+        else:
+            value = self.__get_voltage_by_cache()
+        self.record_reading("voltage", value)
+        return value
 
     def get_high_threshold(self):
         """
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+"""
+Usage: %(scriptName)s [options]
+
+Build the binary telemetry snapshot from the platform_cache json files,
+for the cache producer to run each time it has rewritten them. Readers
+with the mmap backend only read the snapshot and use the json files as
+long as it is missing or behind them
+
+options:
+    -h | --help             : this help message
+    -d | --dir <dir>        : directory of sensor_rev.json, fan_rev.json and psu_rev.json,
+                              default /var/run/platform_cache
+    -o | --output <file>    : snapshot file to write, default <dir>/telemetry.bin
+"""
+
+import os
+import sys
+import getopt
+
+from sonic_platform.plat_common import PlatCommon
+
+
+def usage():
+    print(__doc__ % {'scriptName': os.path.basename(sys.argv[0])})
+    sys.exit(1)
+
+
+def main():
+    cache_dir = "/var/run/platform_cache"
+    output = None
+    try:
+        opts, _ = getopt.getopt(sys.argv[1:], "hd:o:", ["help", "dir=", "output="])
+    except getopt.GetoptError:
+        usage()
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            usage()
+        elif opt in ("-d", "--dir"):
+            cache_dir = arg
+        elif opt in ("-o", "--output"):
+            output = arg
+
+    plat_common = PlatCommon()
+    plat_common.SENSOR_CACHE_FILE = os.path.join(cache_dir, "sensor_rev.json")
+    plat_common.FAN_CACHE_FILE = os.path.join(cache_dir, "fan_rev.json")
+    plat_common.PSU_CACHE_FILE = os.path.join(cache_dir, "psu_rev.json")
+    plat_common.TELEMETRY_SNAPSHOT_FILE = output or os.path.join(cache_dir, "telemetry.bin")
+    if not plat_common.convert_cache_to_snapshot():
+        print("build snapshot {} from {} failed".format(plat_common.TELEMETRY_SNAPSHOT_FILE, cache_dir))
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
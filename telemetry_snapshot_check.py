@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+"""
+Usage: %(scriptName)s [options]
+
+Build the binary telemetry snapshot from the platform_cache json files and
+verify the mmap backend serves the same values as the json backend for
+every key Psu, Fan, Thermal, Voltage and Current read
+
+options:
+    -h | --help             : this help message
+    -d | --dir <dir>        : directory of sensor_rev.json, fan_rev.json and psu_rev.json,
+                              default /var/run/platform_cache
+    -o | --output <file>    : snapshot file to write, default a temporary file
+"""
+
+import os
+import sys
+import getopt
+import shutil
+import tempfile
+
+from sonic_platform.plat_common import PlatCommon
+
+
+def usage():
+    print(__doc__ % {'scriptName': os.path.basename(sys.argv[0])})
+    sys.exit(1)
+
+
+def main():
+    cache_dir = "/var/run/platform_cache"
+    output = None
+    try:
+        opts, _ = getopt.getopt(sys.argv[1:], "hd:o:", ["help", "dir=", "output="])
+    except getopt.GetoptError:
+        usage()
+    for opt, arg in opts:
+        if opt in ("-h", "--help"):
+            usage()
+        elif opt in ("-d", "--dir"):
+            cache_dir = arg
+        elif opt in ("-o", "--output"):
+            output = arg
+
+    plat_common = PlatCommon()
+    plat_common.SENSOR_CACHE_FILE = os.path.join(cache_dir, "sensor_rev.json")
+    plat_common.FAN_CACHE_FILE = os.path.join(cache_dir, "fan_rev.json")
+    plat_common.PSU_CACHE_FILE = os.path.join(cache_dir, "psu_rev.json")
+
+    tmp_dir = None
+    if output is None:
+        tmp_dir = tempfile.mkdtemp(prefix="telemetry_snapshot_check.")
+        output = os.path.join(tmp_dir, "telemetry.bin")
+    plat_common.TELEMETRY_SNAPSHOT_FILE = output
+    try:
+        if not plat_common.convert_cache_to_snapshot():
+            print("build snapshot {} from {} failed".format(output, cache_dir))
+            sys.exit(1)
+        mismatches = plat_common.check_cache_snapshot(output)
+    finally:
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    for line in mismatches:
+        print(line)
+    print("{}: {} differing keys".format(cache_dir, len(mismatches)))
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()